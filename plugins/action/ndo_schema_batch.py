@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.mso.plugins.module_utils.constants import SCHEMA_BATCH_ENV
+from ansible_collections.cisco.mso.plugins.module_utils.mso import mso_argument_spec
+
+
+class ActionModule(ActionBase):
+    """
+    Execute the schema module tasks of a batch with a shared staging directory on the controller.
+    The modules stage their schema changes in the directory, the ndo_schema_batch module sends the staged changes afterwards.
+    """
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        tasks = self._task.args.get("tasks")
+        if not isinstance(tasks, list) or not all(isinstance(task, dict) and task.get("module") for task in tasks):
+            raise AnsibleActionFail("The tasks option must be a list of dictionaries with a module.")
+
+        # The connection options of the batch are the defaults of every task
+        connection_args = dict((key, value) for key, value in self._task.args.items() if key in mso_argument_spec())
+
+        environment = self._task.environment
+        batch_dir = tempfile.mkdtemp(prefix="cisco_mso_schema_batch_")
+        if isinstance(environment, list):
+            self._task.environment = environment + [{SCHEMA_BATCH_ENV: batch_dir}]
+        else:
+            self._task.environment = [environment or {}, {SCHEMA_BATCH_ENV: batch_dir}]
+
+        results = []
+        try:
+            for index, task in enumerate(tasks):
+                module_name = task.get("module") if "." in task.get("module") else "cisco.mso.{0}".format(task.get("module"))
+                module_args = dict(connection_args, **(task.get("args") or {}))
+                task_result = self._execute_module(module_name=module_name, module_args=module_args, task_vars=task_vars)
+                task_result.update(module=module_name, name=task.get("name"))
+                results.append(task_result)
+                if task_result.get("failed"):
+                    result.update(
+                        failed=True,
+                        changed=False,
+                        results=results,
+                        msg="Task {0} ({1}) of the schema batch failed, no changes were sent: {2}".format(index, module_name, task_result.get("msg")),
+                    )
+                    return result
+
+            result.update(self._execute_module(module_name="cisco.mso.ndo_schema_batch", module_args=self._task.args, task_vars=task_vars))
+        finally:
+            self._task.environment = environment
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+        result["results"] = results
+        result["changed"] = result.get("changed", False) or any(task_result.get("changed") for task_result in results)
+        return result
@@ -77,6 +77,23 @@ options:
     - If the value is not specified in the task, the value of environment variable C(MSO_LOGIN_DOMAIN) will be used instead.
     - When using a HTTPAPI connection plugin the inventory variable C(ansible_httpapi_login_domain) will be used if this attribute is not specified.
     type: str
+  schema_commit_window:
+    description:
+    - The number of seconds the schema changes of concurrent tasks, e.g. of multiple hosts or forks, are queued on the Ansible controller.
+    - The queued changes of the same schema are sent in one PATCH request per commit window and every task gets the result of its own changes.
+    - When the combined PATCH request fails, the queued changes are sent separately.
+    - Changes which address list items by index, e.g. the removal of a static port, are not combined with the changes queued before them.
+    - Queuing is disabled by default and requires the modules to be executed on the Ansible controller.
+    - If the value is not specified in the task, the value of environment variable C(MSO_SCHEMA_COMMIT_WINDOW) will be used instead.
+    type: float
+  version_check:
+    description:
+    - Send the changes of a schema or template with the version of the schema or template the changes are based on.
+    - When the schema or template was changed concurrently, the schema or template is requested again and the changes are rebased onto the current version.
+    - The changes are sent again up to 3 times, the module fails when a concurrent change modified the same object.
+    - Version checking is disabled by default.
+    - If the value is not specified in the task, the value of environment variable C(MSO_VERSION_CHECK) will be used instead.
+    type: bool
 requirements:
 - Multi Site Orchestrator v2.1 or newer
 notes:
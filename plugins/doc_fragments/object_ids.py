@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    # Pre-resolved object ids documentation fragments
+    DOCUMENTATION = r"""
+options:
+  verify_ids:
+    description:
+    - Verify that the objects of the provided O(schema_id), O(site_id) or O(tenant_id) exist with a single request per id.
+    - Ids of objects which are queried by the module itself, like the schema of a schema object, are always verified by that query.
+    type: bool
+    default: false
+"""
+
+    SCHEMA = r"""
+options:
+  schema_id:
+    description:
+    - The id of the schema, e.g. from the C(current) output of a previous task.
+    - When provided, the schema is not looked up by the name provided in O(schema).
+    type: str
+"""
+
+    SITE = r"""
+options:
+  site_id:
+    description:
+    - The id of the site, e.g. from the C(current) output of a previous task.
+    - When provided, the site is not looked up by the name provided in O(site).
+    type: str
+"""
+
+    TENANT = r"""
+options:
+  tenant_id:
+    description:
+    - The id of the tenant, e.g. from the C(current) output of a previous task.
+    - When provided, the tenant is not looked up by the name provided in O(tenant).
+    type: str
+"""
+
+    TEMPLATE = r"""
+options:
+  template_id:
+    description:
+    - The id of the template, e.g. from the C(current) output of a previous task.
+    - When provided, the template is queried directly instead of being looked up by the name provided in O(template).
+    - The template is still looked up by name when the template with the id does not match the name and type of the template.
+    type: str
+"""
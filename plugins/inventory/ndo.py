@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: ndo
+short_description: Nexus Dashboard Orchestrator sites inventory source
+description:
+- Build the inventory from the sites, tenants, schemas and templates of Nexus Dashboard Orchestrator (NDO).
+- Every site is added as a host to the C(ndo_sites) group with the site object, id and associated tenants as host variables.
+- Every tenant is added as a C(ndo_tenant_<tenant>) group with the sites associated to the tenant.
+- Every schema is added as a C(ndo_schema_<schema>) group with the sites the schema is associated to.
+- The name to id indexes of the tenants, schemas and templates are added as variables of the C(ndo_sites) group.
+- The collections are queried concurrently after a single login.
+- With O(cache=true) the collections are stored with the inventory cache plugin and NDO is only queried again when the cache timeout expires.
+- The inventory configuration file must end with C(ndo.yml) or C(ndo.yaml).
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  plugin:
+    description:
+    - The name of this plugin, it should always be set to C(cisco.mso.ndo) for this plugin to recognize it as its own.
+    type: str
+    required: true
+    choices: [ cisco.mso.ndo ]
+  host:
+    description:
+    - IP Address or hostname of the NDO host.
+    type: str
+    required: true
+    env:
+    - name: MSO_HOST
+  port:
+    description:
+    - Port number to be used for the REST connection.
+    type: int
+    env:
+    - name: MSO_PORT
+  username:
+    description:
+    - The username to use for authentication.
+    type: str
+    default: admin
+    env:
+    - name: MSO_USERNAME
+  password:
+    description:
+    - The password to use for authentication.
+    type: str
+    required: true
+    env:
+    - name: MSO_PASSWORD
+  login_domain:
+    description:
+    - The login domain name to use for authentication.
+    type: str
+    env:
+    - name: MSO_LOGIN_DOMAIN
+  platform:
+    description:
+    - The platform of NDO, C(nd) for NDO on Nexus Dashboard and C(mso) for the legacy Multi Site Orchestrator.
+    type: str
+    choices: [ nd, mso ]
+    default: nd
+  use_ssl:
+    description:
+    - If C(false), an HTTP connection will be used instead of the default HTTPS connection.
+    type: bool
+    default: true
+    env:
+    - name: MSO_USE_SSL
+  validate_certs:
+    description:
+    - If C(false), SSL certificates will not be validated.
+    type: bool
+    default: true
+    env:
+    - name: MSO_VALIDATE_CERTS
+  use_proxy:
+    description:
+    - If C(false), it will not use a proxy, even if one is defined in an environment variable.
+    type: bool
+    default: true
+    env:
+    - name: MSO_USE_PROXY
+  timeout:
+    description:
+    - The socket level timeout in seconds.
+    type: int
+    default: 30
+    env:
+    - name: MSO_TIMEOUT
+  workers:
+    description:
+    - The maximum number of concurrent requests.
+    type: int
+    default: 8
+extends_documentation_fragment:
+- constructed
+- inventory_cache
+"""
+
+EXAMPLES = r"""
+# ndo.yml
+plugin: cisco.mso.ndo
+host: ndo_host
+username: admin
+password: SomeSecretPassword
+
+# ndo.yml with the inventory cache and constructed groups
+plugin: cisco.mso.ndo
+host: ndo_host
+username: admin
+password: SomeSecretPassword
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/tmp/cisco_mso_inventory_cache
+cache_timeout: 3600
+keyed_groups:
+- prefix: platform
+  key: ndo_site.platform
+compose:
+  ansible_host: "'ndo_host'"
+"""
+
+from ansible.errors import AnsibleError
+from ansible.module_utils._text import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.cisco.mso.plugins.plugin_utils.ndo import NDOClient
+
+INVENTORY_COLLECTIONS = ["sites", "tenants", "schemas", "templates"]
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "cisco.mso.ndo"
+
+    def verify_file(self, path):
+        return super(InventoryModule, self).verify_file(path) and path.endswith(("ndo.yml", "ndo.yaml"))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        # The cache is read when enabled in the configuration, unless the inventory is refreshed with meta: refresh_inventory
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+
+        objects = None
+        if use_cache:
+            try:
+                objects = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+
+        if objects is None:
+            objects = self.query_collections()
+
+        if update_cache:
+            self._cache[cache_key] = objects
+
+        self.populate(objects)
+
+    def query_collections(self):
+        """
+        Query the collections of the inventory concurrently.
+        :return: The objects per collection. -> Dict[Str, List[Dict]]
+        """
+        client = NDOClient(
+            self.get_option("host"),
+            username=self.get_option("username"),
+            password=self.get_option("password"),
+            port=self.get_option("port"),
+            login_domain=self.get_option("login_domain"),
+            platform=self.get_option("platform"),
+            use_ssl=self.get_option("use_ssl"),
+            validate_certs=self.get_option("validate_certs"),
+            use_proxy=self.get_option("use_proxy"),
+            timeout=self.get_option("timeout"),
+            workers=self.get_option("workers"),
+        )
+        try:
+            return client.query_collections(INVENTORY_COLLECTIONS)
+        except AnsibleError as e:
+            raise AnsibleError("Unable to query the NDO inventory: {0}".format(to_native(e)))
+
+    def populate(self, objects):
+        """
+        Add the sites as hosts and the tenants and schemas as groups of the sites to the inventory.
+        :param objects: The objects per collection. -> Dict[Str, List[Dict]]
+        """
+        sites = objects.get("sites") or []
+        tenants = objects.get("tenants") or []
+        schemas = objects.get("schemas") or []
+        templates = objects.get("templates") or []
+
+        site_names = dict((site.get("id"), site.get("name")) for site in sites)
+
+        site_tenants = {}
+        tenant_groups = {}
+        for tenant in tenants:
+            tenant_groups[tenant.get("name")] = [
+                site_names[association.get("siteId")] for association in tenant.get("siteAssociations") or [] if association.get("siteId") in site_names
+            ]
+            for site_name in tenant_groups[tenant.get("name")]:
+                site_tenants.setdefault(site_name, []).append(tenant.get("name"))
+
+        self.inventory.add_group("ndo_sites")
+        for site in sites:
+            host = self.inventory.add_host(site.get("name"), group="ndo_sites")
+            self.inventory.set_variable(host, "ndo_site", site)
+            self.inventory.set_variable(host, "ndo_site_id", site.get("id"))
+            self.inventory.set_variable(host, "ndo_tenants", site_tenants.get(site.get("name"), []))
+
+        for tenant in tenants:
+            group = self.inventory.add_group(self._sanitize_group_name("ndo_tenant_{0}".format(tenant.get("name"))))
+            self.inventory.set_variable(group, "ndo_tenant_id", tenant.get("id"))
+            for site_name in tenant_groups[tenant.get("name")]:
+                self.inventory.add_child(group, site_name)
+
+        for schema in schemas:
+            group = self.inventory.add_group(self._sanitize_group_name("ndo_schema_{0}".format(schema.get("displayName"))))
+            self.inventory.set_variable(group, "ndo_schema_id", schema.get("id"))
+            for site_name in set(site_names.get(site.get("siteId")) for site in schema.get("sites") or [] if site.get("siteId") in site_names):
+                self.inventory.add_child(group, site_name)
+
+        self.inventory.set_variable("ndo_sites", "ndo_tenant_ids", dict((tenant.get("name"), tenant.get("id")) for tenant in tenants))
+        self.inventory.set_variable("ndo_sites", "ndo_schema_ids", dict((schema.get("displayName"), schema.get("id")) for schema in schemas))
+        template_ids = {}
+        for template in templates:
+            template_ids.setdefault(template.get("templateType"), {})[template.get("templateName")] = template.get("templateId")
+        self.inventory.set_variable("ndo_sites", "ndo_template_ids", template_ids)
+
+        strict = self.get_option("strict")
+        for site in sites:
+            host = site.get("name")
+            host_vars = self.inventory.get_host(host).get_vars()
+            self._set_composite_vars(self.get_option("compose"), host_vars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option("groups"), host_vars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, host, strict=strict)
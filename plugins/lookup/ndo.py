@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: ndo
+short_description: Query Nexus Dashboard Orchestrator collections from the controller
+description:
+- Query the sites, tenants, schemas, templates, users, roles and labels of Nexus Dashboard Orchestrator (NDO) without launching a module.
+- A term is either a collection, which returns the objects of the collection, or a collection and a name separated by a slash, which returns the object.
+- Every collection is requested only once per lookup, independent of the number of terms, and different collections are requested concurrently.
+- The connection variables of the httpapi connection of the host are used, unless the connection options are provided.
+- With O(cache=true) the collections are stored with an Ansible cache plugin, so templating the same lookup for many hosts only queries NDO once.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  _terms:
+    description:
+    - The collections or collection and name pairs to query, e.g. C(sites) or C(sites/Site1).
+    - The collections are C(sites), C(tenants), C(schemas), C(templates), C(users), C(roles) and C(labels).
+    - On the C(nd) platform the C(users) are the local and remote users of Nexus Dashboard, which are matched by their C(loginID).
+    required: true
+    type: list
+    elements: str
+  name:
+    description:
+    - Only return the objects with this name for terms without a name.
+    type: str
+  filters:
+    description:
+    - Only return the objects which match all key value pairs, e.g. the C(templateType) of templates.
+    type: dict
+  attribute:
+    description:
+    - Return only this attribute of the objects, e.g. C(id).
+    type: str
+  host:
+    description:
+    - IP Address or hostname of the NDO host.
+    type: str
+    env:
+    - name: MSO_HOST
+    vars:
+    - name: ansible_host
+  port:
+    description:
+    - Port number to be used for the REST connection.
+    type: int
+    env:
+    - name: MSO_PORT
+    vars:
+    - name: ansible_httpapi_port
+  username:
+    description:
+    - The username to use for authentication.
+    type: str
+    default: admin
+    env:
+    - name: MSO_USERNAME
+    - name: ANSIBLE_NET_USERNAME
+    vars:
+    - name: ansible_user
+  password:
+    description:
+    - The password to use for authentication.
+    type: str
+    env:
+    - name: MSO_PASSWORD
+    - name: ANSIBLE_NET_PASSWORD
+    vars:
+    - name: ansible_password
+    - name: ansible_httpapi_pass
+    - name: ansible_httpapi_password
+  login_domain:
+    description:
+    - The login domain name to use for authentication.
+    type: str
+    env:
+    - name: MSO_LOGIN_DOMAIN
+    vars:
+    - name: ansible_httpapi_login_domain
+  platform:
+    description:
+    - The platform of the connection, C(nd) for NDO on Nexus Dashboard and C(mso) for the legacy Multi Site Orchestrator.
+    - Derived from the C(ansible_network_os) variable of the host, defaults to C(nd).
+    type: str
+    vars:
+    - name: ansible_network_os
+  use_ssl:
+    description:
+    - If C(false), an HTTP connection will be used instead of the default HTTPS connection.
+    type: bool
+    default: true
+    env:
+    - name: MSO_USE_SSL
+    vars:
+    - name: ansible_httpapi_use_ssl
+  validate_certs:
+    description:
+    - If C(false), SSL certificates will not be validated.
+    type: bool
+    default: true
+    env:
+    - name: MSO_VALIDATE_CERTS
+    vars:
+    - name: ansible_httpapi_validate_certs
+  use_proxy:
+    description:
+    - If C(false), it will not use a proxy, even if one is defined in an environment variable.
+    type: bool
+    default: true
+    env:
+    - name: MSO_USE_PROXY
+    vars:
+    - name: ansible_httpapi_use_proxy
+  timeout:
+    description:
+    - The socket level timeout in seconds.
+    type: int
+    default: 30
+    env:
+    - name: MSO_TIMEOUT
+  cache:
+    description:
+    - Store the queried collections with the cache plugin and reuse them until the cache timeout expires.
+    type: bool
+    default: false
+  cache_plugin:
+    description:
+    - The cache plugin used to store the collections, a persistent cache plugin is required to share the collections between hosts.
+    type: str
+    default: ansible.builtin.jsonfile
+  cache_connection:
+    description:
+    - The connection of the cache plugin, e.g. the directory of the C(ansible.builtin.jsonfile) cache plugin.
+    type: str
+    default: ~/.ansible/tmp/cisco_mso_lookup_cache
+  cache_timeout:
+    description:
+    - The number of seconds the collections are cached.
+    type: int
+    default: 3600
+  workers:
+    description:
+    - The maximum number of concurrent requests.
+    type: int
+    default: 8
+"""
+
+EXAMPLES = r"""
+- name: Get the id of a site with the httpapi connection variables of the host
+  ansible.builtin.set_fact:
+    site_id: "{{ lookup('cisco.mso.ndo', 'sites', name='Site1', attribute='id') }}"
+
+- name: Get the ids of multiple objects in one lookup
+  ansible.builtin.set_fact:
+    ids: "{{ query('cisco.mso.ndo', 'sites/Site1', 'sites/Site2', 'tenants/Tenant1', 'schemas/Schema1', attribute='id', cache=true) }}"
+
+- name: Get all tenant policy templates with explicit credentials
+  ansible.builtin.debug:
+    msg: "{{ query('cisco.mso.ndo', 'templates', filters={'templateType': 'tenantPolicy'}, host='ndo_host', username='admin', password='SomeSecretPassword') }}"
+"""
+
+RETURN = r"""
+_list:
+  description:
+  - The objects of a collection per collection term, or the object per collection and name term.
+  - The value of O(attribute) instead of the objects when provided.
+  type: list
+"""
+
+from ansible.errors import AnsibleError, AnsibleLookupError
+from ansible.module_utils._text import to_native, to_text
+from ansible.plugins.loader import cache_loader
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_COLLECTIONS
+from ansible_collections.cisco.mso.plugins.plugin_utils.ndo import NDOClient
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        queries = []
+        for term in terms:
+            collection, name = (to_text(term).split("/", 1) + [None])[:2]
+            if collection not in NDO_COLLECTIONS:
+                raise AnsibleLookupError("Unknown collection '{0}', expected one of: {1}".format(collection, ", ".join(NDO_COLLECTIONS)))
+            queries.append((collection, name or None))
+
+        client = self.get_client()
+        try:
+            objects = self.get_collections(client, sorted(set(collection for collection, name in queries)))
+        except AnsibleError as e:
+            raise AnsibleLookupError(to_native(e))
+
+        filters = dict(self.get_option("filters") or {})
+        attribute = self.get_option("attribute")
+        results = []
+        for collection, name in queries:
+            match_filters = dict(filters)
+            if name or self.get_option("name"):
+                match_filters[client.get_collection(collection).get("name")] = name or self.get_option("name")
+            matches = [obj for obj in objects[collection] if all(obj.get(key) == value for key, value in match_filters.items())]
+            if attribute:
+                matches = [obj.get(attribute) for obj in matches]
+            if name is None:
+                results.append(matches)
+            elif len(matches) == 1:
+                results.append(matches[0])
+            elif not matches:
+                raise AnsibleLookupError("Provided {0} '{1}' does not exist.".format(collection, name))
+            else:
+                raise AnsibleLookupError("More than one of the {0} match '{1}', use the filters option to select one.".format(collection, name))
+        return results
+
+    def get_client(self):
+        if not self.get_option("host"):
+            raise AnsibleLookupError("Provide the NDO host with the host option or the ansible_host variable.")
+        return NDOClient(
+            self.get_option("host"),
+            username=self.get_option("username"),
+            password=self.get_option("password"),
+            port=self.get_option("port"),
+            login_domain=self.get_option("login_domain"),
+            platform=self.get_option("platform"),
+            use_ssl=self.get_option("use_ssl"),
+            validate_certs=self.get_option("validate_certs"),
+            use_proxy=self.get_option("use_proxy"),
+            timeout=self.get_option("timeout"),
+            workers=self.get_option("workers"),
+        )
+
+    def get_collections(self, client, collections):
+        """
+        Get the objects of the collections from the cache or query them concurrently.
+        :param client: The NDO client. -> NDOClient
+        :param collections: The names of the collections. -> List[Str]
+        :return: The objects per collection. -> Dict[Str, List[Dict]]
+        """
+        cache = None
+        if self.get_option("cache"):
+            cache = cache_loader.get(
+                self.get_option("cache_plugin"),
+                _uri=self.get_option("cache_connection"),
+                _timeout=self.get_option("cache_timeout"),
+                _prefix="cisco_mso_ndo_",
+            )
+
+        objects = {}
+        for collection in collections:
+            if cache is not None:
+                try:
+                    objects[collection] = cache.get("{0}_{1}".format(client.scope, collection))
+                except KeyError:
+                    pass
+
+        missing = client.query_collections([collection for collection in collections if collection not in objects])
+        for collection, response in missing.items():
+            objects[collection] = response
+            if cache is not None:
+                cache.set("{0}_{1}".format(client.scope, collection), response)
+        return objects
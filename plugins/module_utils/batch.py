@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import json
+import time
+import uuid
+import tempfile
+from ansible_collections.cisco.mso.plugins.module_utils.constants import CACHE_DIR, CACHE_DIR_ENV, COMMIT_QUEUE_TTL
+from ansible_collections.cisco.mso.plugins.module_utils.utils import apply_patch_ops
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+class MSOSchemaBatch:
+    """
+    Staging area of the ndo_schema_batch action plugin on the Ansible controller.
+    The schema modules of a batch read the staged copy of a schema and stage their PATCH operations instead of sending them,
+    the action plugin sends the staged operations of every schema in one PATCH request afterwards.
+    Every schema is stored in a separate JSON file in the staging directory of the batch.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: The staging directory created by the ndo_schema_batch action plugin. -> Str
+        """
+        self.path = directory
+
+    def get_file(self, schema_id):
+        return os.path.join(self.path, "{0}.json".format(schema_id))
+
+    def load(self, schema_id):
+        """
+        Load the staged schema and operations.
+        :param schema_id: The id of the schema. -> Str
+        :return: The staged schema and operations, None when the schema is not staged. -> Dict
+        """
+        try:
+            with open(self.get_file(schema_id)) as batch_file:
+                return json.load(batch_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def save(self, schema_id, staged):
+        fd, tmp_file = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as batch_file:
+            json.dump(staged, batch_file)
+        os.replace(tmp_file, self.get_file(schema_id))
+
+    def get_schema(self, schema_id):
+        """
+        Get the staged copy of a schema, which includes the staged operations.
+        :param schema_id: The id of the schema. -> Str
+        :return: The staged schema, None when the schema is not staged. -> Dict
+        """
+        return (self.load(schema_id) or {}).get("schema")
+
+    def stage(self, schema_id, schema, ops=None):
+        """
+        Stage a schema and apply operations to the staged copy.
+        :param schema_id: The id of the schema. -> Str
+        :param schema: The schema, only used when the schema is not staged yet. -> Dict
+        :param ops: The PATCH operations to stage. -> List[Dict]
+        :return: The staged schema. -> Dict
+        :raises ValueError: When an operation does not apply to the staged schema.
+        """
+        staged = self.load(schema_id) or dict(schema=schema, ops=[])
+        if ops:
+            apply_patch_ops(staged["schema"], ops)
+            staged["ops"].extend(ops)
+        self.save(schema_id, staged)
+        return staged["schema"]
+
+    def get_staged(self):
+        """
+        Get the staged schemas with their operations.
+        :return: The staged schema and operations per schema id. -> Dict[Str, Dict]
+        """
+        staged = {}
+        for file_name in sorted(os.listdir(self.path)):
+            if file_name.endswith(".json"):
+                schema_id = file_name[: -len(".json")]
+                staged[schema_id] = self.load(schema_id)
+        return staged
+
+
+class MSOSchemaCommitQueue:
+    """
+    Write queue of a schema on the Ansible controller, shared by the module executions of concurrent forks.
+    Every module execution queues its PATCH operations and waits for the lock of the schema.
+    The first module execution which acquires the lock waits for the commit window, sends the queued operations of all module executions
+    in one PATCH request and stores the result of every queued request, the other module executions read their result afterwards.
+    When the merged PATCH request fails, the queued requests are sent separately, so every module execution gets its own result.
+    Requests with operations which address list items by index are not merged with the requests queued before them,
+    because the operations of those requests could shift the items.
+    """
+
+    def __init__(self, schema_id, window, directory=None):
+        """
+        :param schema_id: The id of the schema. -> Str
+        :param window: The number of seconds to wait for the requests of other module executions. -> Float
+        :param directory: The base directory of the queue, defaults to MSO_CACHE_DIR or CACHE_DIR. -> Str
+        """
+        directory = os.path.expanduser(directory or os.environ.get(CACHE_DIR_ENV) or CACHE_DIR)
+        self.path = os.path.join(directory, "commit", schema_id)
+        self.window = window
+
+    def write(self, file_name, data, create=False):
+        if create and not os.path.isdir(self.path):
+            os.makedirs(self.path, 0o700)
+        fd, tmp_file = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as queue_file:
+            json.dump(data, queue_file)
+        os.replace(tmp_file, os.path.join(self.path, file_name))
+
+    def read(self, file_name):
+        try:
+            with open(os.path.join(self.path, file_name)) as queue_file:
+                return json.load(queue_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def pop_result(self, request_id):
+        result = self.read("{0}.result".format(request_id))
+        if result is not None:
+            os.remove(os.path.join(self.path, "{0}.result".format(request_id)))
+        return result
+
+    def commit(self, ops, send):
+        """
+        Queue PATCH operations and wait until they are sent, together with the queued operations of other module executions.
+        :param ops: The PATCH operations. -> List[Dict]
+        :param send: Callable which sends PATCH operations of the schema and returns the response and the error message. -> Callable
+        :return: The response and the error message of the request. -> Tuple(Dict, Str)
+        """
+        if not HAS_FCNTL or not self.window:
+            return send(ops)
+
+        # The request id sorts the queued requests in order of arrival
+        request_id = "{0:020.6f}-{1}".format(time.time(), uuid.uuid4().hex)
+        try:
+            self.write("{0}.request".format(request_id), ops, create=True)
+        except (IOError, OSError):
+            return send(ops)
+
+        lock_file = self.lock()
+        try:
+            result = self.pop_result(request_id)
+            if result is None:
+                self.prune()
+                time.sleep(self.window)
+                self.send_queued(send)
+                result = self.pop_result(request_id)
+            self.remove_stale(self.path)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+        if result is None:
+            return None, "The queued request of the schema was not sent."
+        return result.get("response"), result.get("error")
+
+    def lock(self):
+        """
+        Acquire the lock of the schema.
+        The lock file is removed with the empty queue by prune, so the lock is acquired again when the lock file was replaced while waiting.
+        :return: The locked lock file. -> File
+        """
+        while True:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path, 0o700)
+            lock_file = open(os.path.join(self.path, "lock"), "a")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if os.fstat(lock_file.fileno()).st_ino == os.stat(lock_file.name).st_ino:
+                    return lock_file
+            except OSError:
+                pass
+            lock_file.close()
+
+    def prune(self):
+        """
+        Remove the queued requests, results and temporary files which module executions that ended unexpectedly left in the queues of all schemas,
+        so they are not sent. Empty queues are removed with their lock file, must be called with the lock of the schema.
+        """
+        directory = os.path.dirname(self.path)
+        for schema_id in os.listdir(directory):
+            path = os.path.join(directory, schema_id)
+            if path == self.path:
+                self.remove_stale(path)
+                continue
+            try:
+                lock_file = open(os.path.join(path, "lock"), "a")
+            except (IOError, OSError):
+                continue
+            with lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    # The queue is in use by another module execution
+                    continue
+                try:
+                    self.remove_stale(path)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def remove_stale(path):
+        """
+        Remove the files of a queue which are older than COMMIT_QUEUE_TTL and the queue itself when it is empty, must be called with the lock of the queue.
+        :param path: The directory of the queue. -> Str
+        """
+        now = time.time()
+        try:
+            for file_name in os.listdir(path):
+                file_path = os.path.join(path, file_name)
+                if file_name != "lock" and now - os.path.getmtime(file_path) > COMMIT_QUEUE_TTL:
+                    os.remove(file_path)
+            if os.listdir(path) == ["lock"]:
+                os.remove(os.path.join(path, "lock"))
+                os.rmdir(path)
+        except OSError:
+            # A module execution queued a request in the meantime
+            pass
+
+    def send_queued(self, send):
+        """
+        Send the queued requests in one PATCH request and store the result of every request, must be called with the lock.
+        :param send: Callable which sends PATCH operations of the schema and returns the response and the error message. -> Callable
+        """
+        requests = []
+        for file_name in sorted(os.listdir(self.path)):
+            if file_name.endswith(".request"):
+                ops = self.read(file_name)
+                os.remove(os.path.join(self.path, file_name))
+                if ops is not None:
+                    requests.append((file_name[: -len(".request")], ops))
+        if not requests:
+            return
+
+        # Operations which address list items by index are only valid for the schema their module execution requested,
+        # so a request with such operations starts a new group and is sent before the requests queued after it
+        groups = []
+        for request_id, ops in requests:
+            if not groups or any(key.isdigit() for op in ops for key in op.get("path", "").split("/")):
+                groups.append([])
+            groups[-1].append((request_id, ops))
+
+        results = []
+        for group in groups:
+            response, error = send([op for request_id, ops in group for op in ops])
+            if error is None or len(group) == 1:
+                results.extend((request_id, response, error) for request_id, ops in group)
+            else:
+                results.extend((request_id,) + tuple(send(ops)) for request_id, ops in group)
+
+        for request_id, response, error in results:
+            self.write("{0}.result".format(request_id), dict(response=response, error=error))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.cisco.mso.plugins.module_utils.constants import CACHE_DIR, CACHE_TTL, CACHE_ENV, CACHE_DIR_ENV, CACHE_PRUNE_INTERVAL
+
+
+class MSOCache:
+    """
+    File based key value cache on the Ansible controller which is shared by the module executions of the same scope.
+    Every entry is stored in a separate JSON file which is replaced atomically, so concurrent module executions do not corrupt each other.
+    The file based cache is only used when enabled with the MSO_CACHE environment variable,
+    otherwise the entries are kept in memory and only shared within the module execution.
+    Expired entries and scopes are deleted when the first entry of a module execution is written, at most once per CACHE_PRUNE_INTERVAL,
+    so the cache directory does not grow without limit.
+    The cache is best effort, read and write errors are ignored and result in a cache miss.
+    """
+
+    def __init__(self, namespace, scope, ttl=CACHE_TTL, directory=None):
+        """
+        :param namespace: The name of the cache, e.g. "validation". -> Str
+        :param scope: The scope of the cache, e.g. the connection socket path or the host and user. -> Str
+        :param ttl: The number of seconds after which an entry expires, None for no expiry. -> Int
+        :param directory: The base directory of the cache, defaults to MSO_CACHE_DIR or CACHE_DIR. -> Str
+        """
+        self.ttl = ttl
+        self.entries = {}
+        self.path = None
+        self.pruned = False
+        if boolean(os.environ.get(CACHE_ENV) or False, strict=False):
+            directory = os.path.expanduser(directory or os.environ.get(CACHE_DIR_ENV) or CACHE_DIR)
+            self.path = os.path.join(directory, namespace, hashlib.sha1(to_bytes(scope)).hexdigest())
+
+    def get_file(self, key):
+        return os.path.join(self.path, "{0}.json".format(hashlib.sha1(to_bytes(key)).hexdigest()))
+
+    def is_expired(self, timestamp):
+        return self.ttl is not None and time.time() - timestamp > self.ttl
+
+    def get(self, key, default=None):
+        """
+        Get the value of an entry.
+        :param key: The key of the entry. -> Str
+        :param default: The value returned when the entry does not exist or is expired. -> Any
+        :return: The cached value or the default. -> Any
+        """
+        if self.path is None:
+            entry = self.entries.get(key)
+            return entry.get("value", default) if entry and not self.is_expired(entry.get("timestamp")) else default
+        try:
+            with open(self.get_file(key)) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return default
+        if entry.get("key") != key:
+            return default
+        if self.is_expired(entry.get("timestamp", 0)):
+            self.delete(key)
+            return default
+        return entry.get("value", default)
+
+    def set(self, key, value):
+        """
+        Set the value of an entry.
+        :param key: The key of the entry. -> Str
+        :param value: The JSON serializable value of the entry. -> Any
+        """
+        if self.path is None:
+            self.entries[key] = dict(timestamp=time.time(), value=value)
+            return
+        try:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path, 0o700)
+        except OSError:
+            if not os.path.isdir(self.path):
+                return
+        if not self.pruned:
+            self.pruned = True
+            self.prune()
+        tmp_file = None
+        try:
+            fd, tmp_file = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(dict(key=key, timestamp=time.time(), value=value), cache_file)
+            os.replace(tmp_file, self.get_file(key))
+        except (IOError, OSError, TypeError, ValueError):
+            if tmp_file and os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def delete(self, key):
+        """
+        Delete an entry.
+        :param key: The key of the entry. -> Str
+        """
+        if self.path is None:
+            self.entries.pop(key, None)
+            return
+        try:
+            os.remove(self.get_file(key))
+        except OSError:
+            pass
+
+    def prune(self):
+        """
+        Delete the expired entries of the scope and the scopes of the namespace without an entry which is not expired.
+        The modification time of the entry files is used, which is the time the entry was written.
+        The namespace is pruned at most once per CACHE_PRUNE_INTERVAL, the time of the last prune is the modification time of the prune file.
+        """
+        if self.ttl is None:
+            return
+        namespace_path = os.path.dirname(self.path)
+        prune_file = os.path.join(namespace_path, ".pruned")
+        try:
+            if time.time() - os.path.getmtime(prune_file) < CACHE_PRUNE_INTERVAL:
+                return
+        except OSError:
+            pass
+        try:
+            with open(prune_file, "a"):
+                os.utime(prune_file, None)
+            scopes = os.listdir(namespace_path)
+        except (IOError, OSError):
+            return
+        for scope in scopes:
+            scope_path = os.path.join(namespace_path, scope)
+            if not os.path.isdir(scope_path):
+                continue
+            try:
+                file_names = os.listdir(scope_path)
+            except OSError:
+                continue
+            expired = 0
+            for file_name in file_names:
+                file_path = os.path.join(scope_path, file_name)
+                try:
+                    if self.is_expired(os.path.getmtime(file_path)):
+                        os.remove(file_path)
+                        expired += 1
+                except OSError:
+                    expired += 1
+            if expired == len(file_names) and scope_path != self.path:
+                shutil.rmtree(scope_path, ignore_errors=True)
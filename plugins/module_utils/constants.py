@@ -22,6 +22,55 @@ ENABLED_OR_DISABLED_TO_BOOL_STRING_MAP = {"enabled": True, "disabled": False}
 
 NDO_4_UNIQUE_IDENTIFIERS = ["templateID", "autoRouteTargetImport", "autoRouteTargetExport"]
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_WORKERS = 4
+REQUEST_WORKERS = 8
+
+WAIT_TIMEOUT = 600
+WAIT_DELAY = 1
+WAIT_MAX_DELAY = 30
+# Status values, lower cased and without spaces or underscores, that indicate that an operation is still running
+WAIT_PENDING_STATUSES = ["inprogress", "pending", "queued", "running", "started", "processing", "notstarted"]
+# The number of seconds after the submit of a deployment after which a final deploy status which equals the status before the submit is accepted
+WAIT_DEPLOY_GRACE = 30
+
+# The path, response key, name key and id key of the NDO collections which are gathered by ndo_facts and the ndo lookup plugin
+NDO_COLLECTIONS = dict(
+    sites=dict(path="sites", key="sites", name="name", id="id"),
+    tenants=dict(path="tenants", key="tenants", name="name", id="id"),
+    schemas=dict(path="schemas/list-identity", key="schemas", name="displayName", id="id"),
+    templates=dict(path="templates/summaries", key=None, name="templateName", id="templateId"),
+    users=dict(path="users", key="users", name="username", id="id"),
+    roles=dict(path="roles", key="roles", name="name", id="id"),
+    labels=dict(path="labels", key="labels", name="displayName", id="id"),
+)
+
+# Users are managed by Nexus Dashboard on the ND platform and are queried with the Nexus Dashboard API
+ND_USERS_PATHS = ["/nexus/infra/api/aaa/v4/localusers", "/nexus/infra/api/aaa/v4/remoteusers"]
+ND_USERS_COLLECTION = dict(name="loginID", id="userID")
+
+# Controller side cache shared by the module executions of a connection, only used when enabled with MSO_CACHE
+# The directory can be overridden with MSO_CACHE_DIR
+CACHE_ENV = "MSO_CACHE"
+CACHE_DIR_ENV = "MSO_CACHE_DIR"
+CACHE_DIR = "~/.ansible/tmp/cisco_mso_cache"
+CACHE_TTL = 3600
+# The minimum number of seconds between two prunes of the expired entries of a cache namespace
+CACHE_PRUNE_INTERVAL = 300
+
+# The maximum number of attempts of a version checked PATCH request, a version conflict rebases the operations and retries the request
+VERSION_CHECK_ATTEMPTS = 3
+
+# The maximum number of referenced schemas kept in the schema pool of a module execution
+SCHEMA_POOL_SIZE = 16
+
+# The number of seconds after which queued requests and results of the schema commit queue are removed,
+# they are left over by module executions which ended unexpectedly
+COMMIT_QUEUE_TTL = 600
+
+# Environment variable with the staging directory of the ndo_schema_batch action plugin
+SCHEMA_BATCH_ENV = "MSO_SCHEMA_BATCH_DIR"
+
 NDO_API_VERSION_FORMAT = "/mso/api/{api_version}"
 NDO_API_VERSION_PATH_FORMAT = "/mso/api/{api_version}/{path}"
 
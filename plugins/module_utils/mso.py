@@ -7,13 +7,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
+from copy import copy, deepcopy
+from collections import OrderedDict
 import re
 import os
 import ast
 import datetime
-import shutil
+import hashlib
 import tempfile
+import time
+from email.utils import parsedate_tz, mktime_tz
 from ansible.module_utils.basic import json
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.six import PY3
@@ -22,13 +25,35 @@ from ansible.module_utils.six.moves.urllib.parse import urlencode, urljoin
 from ansible.module_utils.urls import fetch_url
 from ansible.module_utils._text import to_native, to_text
 from ansible.module_utils.connection import Connection
+from ansible_collections.cisco.mso.plugins.module_utils.cache import MSOCache
+from ansible_collections.cisco.mso.plugins.module_utils.batch import MSOSchemaBatch, MSOSchemaCommitQueue
+from ansible_collections.cisco.mso.plugins.module_utils.schema import MSOSchema
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplateObjects
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_patch_base, rebase_patch_ops, REMOVE_ATTRIBUTE
 from ansible_collections.cisco.mso.plugins.module_utils.constants import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_WORKERS,
+    REQUEST_WORKERS,
+    WAIT_TIMEOUT,
+    WAIT_DELAY,
+    WAIT_MAX_DELAY,
+    WAIT_PENDING_STATUSES,
+    WAIT_DEPLOY_GRACE,
+    CACHE_TTL,
+    SCHEMA_BATCH_ENV,
+    VERSION_CHECK_ATTEMPTS,
+    SCHEMA_POOL_SIZE,
     NDO_API_VERSION_PATH_FORMAT,
     AZURE_L4L7_CONNECTOR_TYPE_MAP,
     LISTENER_REDIRECT_CODE_MAP,
     LISTENER_CONTENT_TYPE_MAP,
     LISTENER_ACTION_TYPE_MAP,
     LISTENER_PROTOCOLS,
+    PORT_CHANNEL_MODE_MAP,
+    CONTROL_MAP,
+    LINK_LEVEL_FEC_MAP,
+    L2_INTERFACE_QINQ_MAP,
+    LOAD_BALANCE_HASHING_MAP,
 )
 
 
@@ -40,6 +65,31 @@ except ImportError:
     HAS_MULTIPART_ENCODER = False
 
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+
+    HAS_CONCURRENT_FUTURES = True
+except ImportError:
+    HAS_CONCURRENT_FUTURES = False
+
+
+class DownloadError(Exception):
+    """Raised when a download fails, carries the url and response information for the module output"""
+
+    def __init__(self, msg, url=None, info=None):
+        super(DownloadError, self).__init__(msg)
+        self.url = url
+        self.info = info
+
+
+class RequestError(Exception):
+    """Raised instead of failing the module when a request fails in a concurrent worker"""
+
+    def __init__(self, msg, **kwargs):
+        super(RequestError, self).__init__(msg)
+        self.kwargs = kwargs
+
+
 if PY3:
 
     def cmp(a, b):
@@ -116,6 +166,8 @@ def mso_argument_spec():
         use_ssl=dict(type="bool", fallback=(env_fallback, ["MSO_USE_SSL"])),
         validate_certs=dict(type="bool", fallback=(env_fallback, ["MSO_VALIDATE_CERTS"])),
         login_domain=dict(type="str", fallback=(env_fallback, ["MSO_LOGIN_DOMAIN"])),
+        schema_commit_window=dict(type="float", fallback=(env_fallback, ["MSO_SCHEMA_COMMIT_WINDOW"])),
+        version_check=dict(type="bool", fallback=(env_fallback, ["MSO_VERSION_CHECK"])),
     )
 
 
@@ -267,89 +319,311 @@ def ndo_remote_user_spec():
     )
 
 
-# Copied from ansible's module uri.py (url): https://github.com/ansible/ansible/blob/cdf62edc65f564fff6b7e575e084026fa7faa409/lib/ansible/modules/uri.py
-def write_file(module, url, dest, content, resp, tmpsrc=None):
-    # create a tempfile with some test content
+def ndo_interface_setting_spec():
+    return dict(
+        name=dict(type="str", aliases=["interface_policy_group", "interface_setting"]),
+        uuid=dict(type="str", aliases=["interface_policy_group_uuid", "interface_setting_uuid"]),
+        description=dict(type="str"),
+        interface_type=dict(type="str", choices=["physical", "port_channel"]),
+        speed=dict(type="str", choices=["100M", "1G", "10G", "25G", "40G", "50G", "100G", "200G", "400G", "inherit"]),
+        auto_negotiation=dict(type="str", choices=["on", "off", "on_enforce"]),
+        vlan_scope=dict(type="str", choices=["global", "port_local"]),
+        cdp_admin_state=dict(type="str", choices=["enabled", "disabled"]),
+        lldp=dict(
+            type="dict",
+            options=dict(
+                status=dict(type="str", choices=["enabled", "disabled"]),
+                transmit_state=dict(type="str", choices=["enabled", "disabled"]),
+                receive_state=dict(type="str", choices=["enabled", "disabled"]),
+            ),
+        ),
+        domains=dict(type="list", elements="str"),
+        port_channel_mode=dict(type="str", choices=list(PORT_CHANNEL_MODE_MAP)),
+        min_links=dict(type="int"),
+        max_links=dict(type="int"),
+        controls=dict(type="list", elements="str", choices=list(CONTROL_MAP)),
+        load_balance_hashing=dict(type="str", choices=list(LOAD_BALANCE_HASHING_MAP)),
+        synce=dict(type="str"),
+        link_level_debounce_interval=dict(type="int"),
+        link_level_bring_up_delay=dict(type="int"),
+        link_level_fec=dict(type="str", choices=list(LINK_LEVEL_FEC_MAP)),
+        l2_interface_qinq=dict(type="str", choices=list(L2_INTERFACE_QINQ_MAP)),
+        l2_interface_reflective_relay=dict(type="str", choices=["enabled", "disabled"]),
+        stp_bpdu_filter=dict(type="str", choices=["enabled", "disabled"]),
+        stp_bpdu_guard=dict(type="str", choices=["enabled", "disabled"]),
+        llfc_transmit_state=dict(type="str", choices=["enabled", "disabled"]),
+        llfc_receive_state=dict(type="str", choices=["enabled", "disabled"]),
+        mcp=dict(
+            type="dict",
+            options=dict(
+                admin_state=dict(type="str", choices=["enabled", "disabled"]),
+                strict_mode=dict(type="str", choices=["on", "off"], aliases=["mcp_mode"]),
+                initial_delay_time=dict(type="int"),
+                transmission_frequency_sec=dict(type="int"),
+                transmission_frequency_msec=dict(type="int"),
+                grace_period_sec=dict(type="int"),
+                grace_period_msec=dict(type="int"),
+            ),
+        ),
+        pfc_admin_state=dict(type="str", choices=["on", "off", "auto"]),
+        access_macsec_policy=dict(type="str"),
+    )
+
+
+def get_interface_setting_attributes(interface_setting, domains=None, synce=None, access_macsec_policy=None):
+    """
+    Map the parameters of an interface setting to the attribute paths of an interface policy group, used with get_attribute_ops.
+    :param interface_setting: The parameters of the interface setting, see ndo_interface_setting_spec. -> Dict
+    :param domains: The UUIDs of the domains, an empty list removes the domains. -> List
+    :param synce: The UUID of the SyncE policy. -> Str
+    :param access_macsec_policy: The UUID of the access MACsec policy. -> Str
+    :return: The desired value per attribute path. -> Dict
+    """
+    lldp = interface_setting.get("lldp") or {}
+    mcp = interface_setting.get("mcp") or {}
+    auto_negotiation = interface_setting.get("auto_negotiation")
+    vlan_scope = interface_setting.get("vlan_scope")
+    controls = interface_setting.get("controls")
+    if controls == []:
+        controls = REMOVE_ATTRIBUTE
+    elif controls:
+        controls = [CONTROL_MAP.get(control) for control in controls]
+    return {
+        "name": interface_setting.get("name"),
+        "description": interface_setting.get("description"),
+        "domains": REMOVE_ATTRIBUTE if domains == [] else domains,
+        "syncEthPolicy": synce,
+        "accessMACsecPolicy": access_macsec_policy,
+        ("cdp", "adminState"): interface_setting.get("cdp_admin_state"),
+        ("pfc", "adminState"): interface_setting.get("pfc_admin_state"),
+        ("llfc", "transmitState"): interface_setting.get("llfc_transmit_state"),
+        ("llfc", "receiveState"): interface_setting.get("llfc_receive_state"),
+        ("stp", "bpduFilterEnabled"): interface_setting.get("stp_bpdu_filter"),
+        ("stp", "bpduGuardEnabled"): interface_setting.get("stp_bpdu_guard"),
+        ("l2Interface", "qinq"): L2_INTERFACE_QINQ_MAP.get(interface_setting.get("l2_interface_qinq")),
+        ("l2Interface", "reflectiveRelay"): interface_setting.get("l2_interface_reflective_relay"),
+        ("l2Interface", "vlanScope"): "portlocal" if vlan_scope == "port_local" else vlan_scope,
+        ("lldp", "receiveState"): lldp.get("receive_state"),
+        ("lldp", "transmitState"): lldp.get("transmit_state"),
+        ("linkLevel", "debounceInterval"): interface_setting.get("link_level_debounce_interval"),
+        ("linkLevel", "bringUpDelay"): interface_setting.get("link_level_bring_up_delay"),
+        ("linkLevel", "fec"): LINK_LEVEL_FEC_MAP.get(interface_setting.get("link_level_fec")),
+        ("linkLevel", "speed"): interface_setting.get("speed"),
+        ("linkLevel", "autoNegotiation"): "on-enforce" if auto_negotiation == "on_enforce" else auto_negotiation,
+        ("mcp", "adminState"): mcp.get("admin_state"),
+        ("mcp", "mcpMode"): mcp.get("strict_mode"),
+        ("mcp", "initialDelayTime"): mcp.get("initial_delay_time"),
+        ("mcp", "txFreq"): mcp.get("transmission_frequency_sec"),
+        ("mcp", "txFreqMsec"): mcp.get("transmission_frequency_msec"),
+        ("mcp", "gracePeriod"): mcp.get("grace_period_sec"),
+        ("mcp", "gracePeriodMsec"): mcp.get("grace_period_msec"),
+        ("portChannelPolicy", "mode"): PORT_CHANNEL_MODE_MAP.get(interface_setting.get("port_channel_mode")),
+        ("portChannelPolicy", "minLinks"): interface_setting.get("min_links"),
+        ("portChannelPolicy", "maxLinks"): interface_setting.get("max_links"),
+        ("portChannelPolicy", "hashFields"): LOAD_BALANCE_HASHING_MAP.get(interface_setting.get("load_balance_hashing")),
+        ("portChannelPolicy", "control"): controls,
+    }
+
+
+def ndo_physical_interface_spec():
+    return dict(
+        name=dict(type="str", aliases=["physical_interface"]),
+        uuid=dict(type="str", aliases=["physical_interface_uuid"]),
+        description=dict(type="str"),
+        nodes=dict(type="list", elements="int"),
+        interfaces=dict(type="list", elements="str"),
+        physical_interface_type=dict(type="str", choices=["physical", "breakout"]),
+        physical_policy_uuid=dict(type="str", aliases=["policy_uuid", "interface_policy_uuid", "interface_policy_group_uuid", "interface_setting_uuid"]),
+        physical_policy=dict(
+            type="dict",
+            options=dict(
+                name=dict(type="str"),
+                template=dict(type="str"),
+            ),
+            aliases=["policy", "interface_policy", "interface_policy_group", "interface_setting"],
+        ),
+        breakout_mode=dict(type="str", choices=["4x10G", "4x25G", "4x100G"]),
+        interface_descriptions=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                interface_id=dict(type="str"),
+                description=dict(type="str"),
+            ),
+        ),
+    )
 
-    if tmpsrc is None and content is not None:
-        fd, tmpsrc = tempfile.mkstemp(dir=module.tmpdir)
-        f = open(tmpsrc, "wb")
-        try:
-            f.write(content)
-        except Exception as e:
-            os.remove(tmpsrc)
-            module.fail_json(msg="Failed to create temporary content file: {0}".format(to_native(e)))
-        f.close()
-
-    checksum_src = None
-    checksum_dest = None
-
-    # raise an error if there is no tmpsrc file
-    if not os.path.exists(tmpsrc):
-        os.remove(tmpsrc)
-        module.fail_json(msg="Source '{0}' does not exist".format(tmpsrc))
-    if not os.access(tmpsrc, os.R_OK):
-        os.remove(tmpsrc)
-        module.fail_json(msg="Source '{0}' is not readable".format(tmpsrc))
-    checksum_src = module.sha1(tmpsrc)
-
-    # check if there is no dest file
-    if os.path.exists(dest):
-        # raise an error if copy has no permission on dest
-        if not os.access(dest, os.W_OK):
-            os.remove(tmpsrc)
-            module.fail_json(msg="Destination '{0}' not writable".format(dest))
-        if not os.access(dest, os.R_OK):
-            os.remove(tmpsrc)
-            module.fail_json(msg="Destination '{0}' not readable".format(dest))
-        checksum_dest = module.sha1(dest)
-    else:
-        if not os.access(os.path.dirname(dest), os.W_OK):
-            os.remove(tmpsrc)
-            module.fail_json(msg="Destination dir '{0}' not writable".format(os.path.dirname(dest)))
 
-    if checksum_src != checksum_dest:
+def ndo_port_channel_interface_spec():
+    return dict(
+        name=dict(type="str", aliases=["port_channel_interface", "port_channel"]),
+        uuid=dict(type="str", aliases=["port_channel_interface_uuid", "port_channel_uuid"]),
+        description=dict(type="str"),
+        node=dict(type="str"),
+        interfaces=dict(type="list", elements="str", aliases=["members"]),
+        interface_policy_group=dict(
+            type="dict",
+            options=dict(
+                name=dict(type="str", required=True),
+                template=dict(type="str", required=True),
+            ),
+            aliases=["policy", "interface_policy", "interface_setting"],
+        ),
+        interface_policy_group_uuid=dict(type="str", aliases=["policy_uuid", "interface_policy_uuid", "interface_setting_uuid"]),
+        interface_descriptions=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                interface_id=dict(type="str", required=True),
+                description=dict(type="str"),
+            ),
+        ),
+    )
+
+
+def get_last_modified_timestamp(info):
+    """Get the Last-Modified response header as a POSIX timestamp"""
+    last_modified = info.get("last-modified")
+    if last_modified:
+        parsed_last_modified = parsedate_tz(last_modified)
+        if parsed_last_modified:
+            return mktime_tz(parsed_last_modified)
+    return None
+
+
+def is_download_current(dest, info):
+    """Check if the local copy of a download is current with the Content-Length and Last-Modified response headers"""
+    last_modified = get_last_modified_timestamp(info)
+    if not os.path.isfile(dest) or info.get("content-length") is None or last_modified is None:
+        return False
+    try:
+        return int(info.get("content-length")) == os.path.getsize(dest) and last_modified <= os.path.getmtime(dest)
+    except ValueError:
+        return False
+
+
+def check_destination(dest):
+    """
+    Check that the destination file and its directory are writable.
+    :return: The absolute path of the destination directory. -> Str
+    """
+    dest_dir = os.path.dirname(os.path.abspath(dest))
+    if not os.access(dest_dir, os.W_OK):
+        raise IOError("Destination dir '{0}' not writable".format(dest_dir))
+    if os.path.exists(dest) and not os.access(dest, os.W_OK | os.R_OK):
+        raise IOError("Destination '{0}' not writable or readable".format(dest))
+    return dest_dir
+
+
+def write_file(module, dest, src, info, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """
+    Stream a download in chunks to a temporary file in the destination directory while computing its checksum.
+    The destination is atomically replaced when the content differs from the existing file.
+    Errors are raised as IOError so this function can be used from download workers.
+    :return: The SHA1 checksum of the download, the number of bytes written and whether the destination was changed. -> Tuple(Str, Int, Bool)
+    """
+    dest_dir = check_destination(dest)
+    fd, tmpdest = tempfile.mkstemp(dir=dest_dir, prefix=".{0}.".format(os.path.basename(dest)), suffix=".part")
+    checksum = hashlib.sha1()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                checksum.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+    except Exception as e:
+        os.remove(tmpdest)
+        raise IOError("Failed to create temporary content file: {0}".format(to_native(e)))
+    checksum = checksum.hexdigest()
+
+    return checksum, size, replace_file(module, dest, tmpdest, checksum, size, info)
+
+
+def replace_file(module, dest, tmpdest, checksum, size, info):
+    """
+    Atomically replace the destination with a temporary file from the destination directory when the content differs.
+    The temporary file is removed when the destination is unchanged.
+    :return: Whether the destination was changed. -> Bool
+    """
+    if os.path.exists(dest) and os.path.getsize(dest) == size and module.sha1(dest) == checksum:
+        os.remove(tmpdest)
+        changed = False
+    else:
         try:
-            shutil.copyfile(tmpsrc, dest)
+            # mkstemp creates a file that is only accessible by the owner, apply the permissions of a regular new file instead
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmpdest, 0o666 & ~umask)
+            os.replace(tmpdest, dest)
         except Exception as e:
-            os.remove(tmpsrc)
-            module.fail_json(msg="failed to copy {0} to {1}: {2}".format(tmpsrc, dest, to_native(e)))
-
-    os.remove(tmpsrc)
+            os.remove(tmpdest)
+            raise IOError("failed to move {0} to {1}: {2}".format(tmpdest, dest, to_native(e)))
+        changed = True
+
+    # Keep the modification time in sync with the server so the next run can detect that the local copy is current
+    last_modified = get_last_modified_timestamp(info)
+    if last_modified is not None:
+        os.utime(dest, (last_modified, last_modified))
+
+    return changed
+
+
+INTERFACE_ID_REGEX = re.compile(r"^((?:\d+/)+)(\d+)(?:-(\d+))?$")
+
+
+def get_interface_description_ranges(mso, interface_descriptions, node=None):
+    """
+    Parse the interface IDs or ranges of interface IDs of interface descriptions into compact ranges.
+    :param interface_descriptions: The interface descriptions with an interface ID or a range of interface IDs, e.g. 1/1-48. -> List[Dict]
+    :param node: The node ID of every interface description, the node of the interface description is used when not provided. -> Str
+    :return: The node ID, the interface ID prefix, the first and last port and the description per range. -> List[Tuple(Str, Str, Int, Int, Str)]
+             The first port is None for an interface ID which is not a range, the prefix is the interface ID then.
+    """
+    ranges = []
+    for interface_description in interface_descriptions or []:
+        ids = interface_description.get("interface_id", interface_description.get("interfaceID")) or ""
+        match = INTERFACE_ID_REGEX.match(ids)
+        if not match:
+            mso.fail_json(msg="Incorrect interface ID or range of IDs. Got '{0}'".format(ids))
+        range_node = node if node is not None else interface_description.get("node")
+        if match.group(3) is None:
+            ranges.append((range_node, ids, None, None, interface_description.get("description")))
+        elif int(match.group(3)) > int(match.group(2)):
+            ranges.append((range_node, match.group(1), int(match.group(2)), int(match.group(3)), interface_description.get("description")))
+        else:
+            mso.fail_json(msg="Range start is greater than or equal to range stop for range of IDs '{0}'".format(ids))
+    return ranges
+
+
+def expand_interface_description_ranges(ranges):
+    """
+    Expand compact ranges of interface descriptions into the interface descriptions of every interface ID of the payload.
+    :param ranges: The ranges returned by get_interface_description_ranges. -> List[Tuple(Str, Str, Int, Int, Str)]
+    :return: The interface descriptions. -> List[Dict]
+    """
+    interface_descriptions = []
+    for node, prefix, start, stop, description in ranges:
+        if start is None:
+            interface_descriptions.append({"nodeID": node, "interfaceID": prefix, "description": description})
+        else:
+            interface_descriptions.extend(
+                {"nodeID": node, "interfaceID": "{0}{1}".format(prefix, port), "description": description} for port in range(start, stop + 1)
+            )
+    return interface_descriptions
 
 
 def format_interface_descriptions(mso, interface_descriptions, node=None):
-    if interface_descriptions:
-
-        def format_range_interfaces(format_dict):
-            ids = format_dict.get("interfaceID")
-            if re.fullmatch(r"((\d+/)+\d+$)", ids):
-                yield format_dict
-            elif re.fullmatch(r"((\d+/)+\d+-\d+$)", ids):
-                slots = ids.rsplit("/", 1)[0]
-                range_start, range_stop = ids.rsplit("/", 1)[1].split("-")
-                if int(range_stop) > int(range_start):
-                    for x in range(int(range_start), int(range_stop) + 1):
-                        copy_format_dict = deepcopy(format_dict)
-                        copy_format_dict.update(interfaceID="{0}/{1}".format(slots, x))
-                        yield copy_format_dict
-                else:
-                    mso.fail_json(msg="Range start is greater than or equal to range stop for range of IDs '{0}'".format(ids))
-            else:
-                mso.fail_json(msg="Incorrect interface ID or range of IDs. Got '{0}'".format(ids))
-
-        return [
-            item
-            for interface_description in interface_descriptions
-            for item in format_range_interfaces(
-                {
-                    "nodeID": node if node is not None else interface_description.get("node"),
-                    "interfaceID": interface_description.get("interface_id", interface_description.get("interfaceID")),
-                    "description": interface_description.get("description"),
-                }
-            )
-        ]
-    return []
+    return expand_interface_description_ranges(get_interface_description_ranges(mso, interface_descriptions, node))
+
+
+SCHEMA_PATH_REGEX = re.compile(r"^/?schemas/([^/?]+)$")
+VERSIONED_PATH_REGEX = re.compile(r"^/?(schemas|templates)/([^/?]+)$")
+# The error message of NDO when the _updateVersion of a version checked PATCH request is not the current version
+VERSION_CONFLICT_REGEX = re.compile(r"(?:update ?version|version) (?:mismatch|conflict)", re.IGNORECASE)
 
 
 class MSOModule(object):
@@ -386,6 +660,22 @@ class MSOModule(object):
         self.site_type = None  # on-premise or cloud
         self.cloud_provider_type = None  # aws or azure or gcp
 
+        # Staging area of the schema changes when executed by the ndo_schema_batch action plugin
+        self.schema_batch = MSOSchemaBatch(os.environ.get(SCHEMA_BATCH_ENV)) if os.environ.get(SCHEMA_BATCH_ENV) else None
+
+        # The _updateVersion and the content of the requested schemas and templates per path, used for version checked PATCH requests
+        self.versions = dict()
+
+        # The objects and templates referenced across templates, shared by the MSOTemplate instances of the module execution
+        self.template_objects = MSOTemplateObjects(self)
+
+        # The schemas of the module execution per schema id, in order of use, and the schema ids per schema name
+        self.schema_pool = OrderedDict()
+        self.schema_ids = dict()
+
+        # The controller side caches of the module execution per namespace
+        self.caches = dict()
+
         if self.module._debug:
             self.module.warn("Enable debug output because ANSIBLE_DEBUG was set.")
             self.params["output_level"] = "debug"
@@ -484,88 +774,188 @@ class MSOModule(object):
             self.error = self.jsondata
 
     def request_download(self, path, destination=None, method="GET", api_version="v1"):
+        """Generic HTTP method for MSO downloads."""
+        self.path = path
+        self.method = method
+        try:
+            redirect, destination, changed = self.download(path, destination=destination, method=method, api_version=api_version, src=self.params.get("src"))
+        except DownloadError as e:
+            self.url = e.url
+            self.fail_json(msg=str(e), info=e.info)
+        self.url = redirect.get("url", self.url)
+
+        # The download reports if the local copy was changed, similar to the modified header of a PATCH request
+        self.has_modified = True
+        self.result["changed"] = changed
+
+        return redirect, destination
+
+    def request_downloads(self, paths, destination, workers=DOWNLOAD_WORKERS, method="GET", api_version="v1"):
+        """
+        Download multiple files concurrently with a bounded pool of workers.
+        :param paths: The API paths of the files to download. -> List[Str]
+        :param destination: The directory where the files are downloaded to. -> Str
+        :param workers: The maximum number of concurrent downloads. -> Int
+        :return: The download details per path in the order of the provided paths. -> List[Dict]
+        """
+
+        def download(path):
+            start = time.time()
+            try:
+                redirect, file_path, changed = self.download(path, destination=destination, method=method, api_version=api_version)
+            except DownloadError as e:
+                return dict(path=path, error=str(e), info=e.info)
+            elapsed = time.time() - start
+            return dict(
+                path=path,
+                destination=file_path,
+                changed=changed,
+                checksum=redirect.get("checksum"),
+                size=redirect.get("size"),
+                elapsed=round(elapsed, 3),
+                throughput=int(redirect.get("size") / elapsed) if elapsed else 0,
+            )
+
+        self.method = method
+        if HAS_CONCURRENT_FUTURES and workers > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+                downloads = list(executor.map(download, paths))
+        else:
+            downloads = [download(path) for path in paths]
+
+        errors = ["{0}: {1}".format(item.get("path"), item.get("error")) for item in downloads if item.get("error")]
+        if errors:
+            self.fail_json(msg="Failed to download: {0}".format("; ".join(errors)), downloads=downloads)
+
+        self.has_modified = True
+        self.result["changed"] = any(item.get("changed") for item in downloads)
+
+        return downloads
+
+    def download(self, path, destination=None, method="GET", api_version="v1", src=None):
+        """
+        Download a file to a destination file or directory without changing the module state, so it can be used from download workers.
+        :return: The response information, the destination file and whether the destination was changed. -> Tuple(Dict, Str, Bool)
+        """
+        url = None
         if self.platform != "nd":
-            self.url = urljoin(self.baseuri, path)
+            url = urljoin(self.baseuri, path)
 
         redirected = False
         redir_info = {}
         redirect = {}
-        content = None
+        resp = None
         data = None
+        headers = self.headers
 
-        src = self.params.get("src")
         if src:
             try:
-                self.headers.update({"Content-Length": os.stat(src).st_size})
+                headers = dict(self.headers, **{"Content-Length": os.stat(src).st_size})
                 data = open(src, "rb")
             except OSError:
-                self.fail_json(msg="Unable to open source file %s" % src, elapsed=0)
+                raise DownloadError("Unable to open source file %s" % src, url)
 
         kwargs = {}
         if destination is not None and os.path.isdir(destination):
             # first check if we are redirected to a file download
             if self.platform == "nd":
+                # The connection stores the download in the destination directory, so it can be moved into place without a copy
                 redir_info = self.connection.get_remote_file_io_stream(
-                    NDO_API_VERSION_PATH_FORMAT.format(api_version=api_version, path=path), self.module.tmpdir, method
+                    NDO_API_VERSION_PATH_FORMAT.format(api_version=api_version, path=path), os.path.abspath(destination), method
                 )
                 # In place of Content-Disposition, NDO get_remote_file_io_stream returns content-disposition.
                 content_disposition = redir_info.get("content-disposition")
             else:
-                check, redir_info = fetch_url(self.module, self.url, headers=self.headers, method=method, timeout=self.params.get("timeout"))
-                content_disposition = check.headers.get("Content-Disposition")
+                # The body of this response is streamed to the destination below when we are not redirected
+                resp, redir_info = fetch_url(self.module, url, headers=headers, method=method, timeout=self.params.get("timeout"))
+                content_disposition = redir_info.get("content-disposition")
 
             if content_disposition:
                 file_name = content_disposition.split("filename=")[1]
             else:
-                self.fail_json(msg="Failed to fetch {0} backup information from MSO/NDO, response: {1}".format(self.params.get("backup"), redir_info))
+                raise DownloadError(
+                    "Failed to fetch {0} backup information from MSO/NDO, response: {1}".format(self.params.get("backup") or path, redir_info), url
+                )
 
             # if we are redirected, update the url with the location header and update dest with the new url filename
             if redir_info["status"] in (301, 302, 303, 307):
-                self.url = redir_info.get("location")
+                url = redir_info.get("location")
                 redirected = True
+                if resp is not None:
+                    resp.close()
+                    resp = None
             destination = os.path.join(destination, file_name)
 
-        # if destination file already exist, only download if file newer
-        if os.path.exists(destination):
-            kwargs["last_mod_time"] = datetime.datetime.utcfromtimestamp(os.path.getmtime(destination))
-
         if self.platform == "nd":
             if redir_info["status"] == 200 and redirected is False:
                 info = redir_info
             else:
-                info = self.connection.get_remote_file_io_stream("/mso/{0}".format(self.url.split("/mso/", 1)), self.module.tmpdir, method)
-        else:
+                info = self.connection.get_remote_file_io_stream(
+                    "/mso/{0}".format(url.split("/mso/", 1)), os.path.dirname(os.path.abspath(destination)), method
+                )
+        elif resp is None:
+            # if destination file already exist, only download if file newer
+            if os.path.exists(destination):
+                kwargs["last_mod_time"] = datetime.datetime.utcfromtimestamp(os.path.getmtime(destination))
+
             resp, info = fetch_url(
                 self.module,
-                self.url,
+                url,
                 data=data,
-                headers=self.headers,
+                headers=headers,
                 method=method,
                 timeout=self.params.get("timeout"),
                 unix_socket=self.params.get("unix_socket"),
                 **kwargs
             )
+        else:
+            info = redir_info
 
+        if src:
+            # Try to close the open file handle
             try:
-                content = resp.read()
-            except AttributeError:
-                # there was no content, but the error read() may have been stored in the info as 'body'
-                content = info.pop("body", "")
-
-            if src:
-                # Try to close the open file handle
-                try:
-                    data.close()
-                except Exception:
-                    pass
+                data.close()
+            except Exception:
+                pass
 
-        redirect["redirected"] = redirected or info.get("url") != self.url
+        redirect["redirected"] = redirected or info.get("url") != url
         redirect.update(redir_info)
         redirect.update(info)
 
-        write_file(self.module, self.url, destination, content, redirect, info.get("tmpsrc"))
+        checksum = None
+        size = 0
+        tmpsrc = info.get("tmpsrc") if self.platform == "nd" else None
+        try:
+            if info.get("status") == 304 or is_download_current(destination, info):
+                # 304: Not Modified, the local copy is current so the download is skipped
+                changed = False
+                if resp is not None:
+                    resp.close()
+            elif self.platform == "nd":
+                if not tmpsrc or not os.path.exists(tmpsrc):
+                    raise DownloadError("Source '{0}' does not exist".format(tmpsrc), url, info)
+                if os.path.dirname(os.path.abspath(tmpsrc)) == check_destination(destination):
+                    checksum, size = self.module.sha1(tmpsrc), os.path.getsize(tmpsrc)
+                    changed = replace_file(self.module, destination, tmpsrc, checksum, size, info)
+                else:
+                    # Connections which do not store the download in the requested directory still need a copy
+                    with open(tmpsrc, "rb") as f:
+                        checksum, size, changed = write_file(self.module, destination, f, info)
+            elif resp is None or info.get("status") >= 400:
+                raise DownloadError("Failed to download {0}: {1}".format(url, info.get("msg")), url, info)
+            else:
+                checksum, size, changed = write_file(self.module, destination, resp, info)
+        except IOError as e:
+            raise DownloadError(to_native(e), url, info)
+        finally:
+            # Remove the download of the connection when it was skipped, copied or failed
+            if tmpsrc and os.path.exists(tmpsrc):
+                os.remove(tmpsrc)
 
-        return redirect, destination
+        redirect["checksum"] = checksum
+        redirect["size"] = size
+
+        return redirect, destination, changed
 
     def request_upload(self, path, fields=None, method="POST", api_version="v1"):
         """Generic HTTP MultiPart POST method for MSO uploads."""
@@ -651,6 +1041,13 @@ class MSOModule(object):
 
     def request(self, path, method=None, data=None, qs=None, api_version="v1"):
         """Generic HTTP method for MSO requests."""
+        if self.schema_batch is not None and SCHEMA_PATH_REGEX.match(path) and api_version == "v1":
+            return self.request_schema_batch(path, method, data)
+        if self.params.get("schema_commit_window") and method == "PATCH" and data and SCHEMA_PATH_REGEX.match(path) and api_version == "v1":
+            return self.request_schema_commit(path, data)
+        if self.params.get("version_check") and method in ("GET", "PATCH") and VERSIONED_PATH_REGEX.match(path) and api_version == "v1":
+            return self.request_version_check(path, method, data)
+
         self.path = path
 
         if method is not None:
@@ -662,12 +1059,6 @@ class MSOModule(object):
         else:
             self.patch_operation = data
 
-        # if method in ['PATCH', 'PUT']:
-        #     if qs is not None:
-        #         qs['enableVersionCheck'] = 'true'
-        #     else:
-        #         qs = dict(enableVersionCheck='true')
-
         if method in ["PATCH"]:
             if qs is not None:
                 qs["validate"] = "false"
@@ -783,6 +1174,195 @@ class MSOModule(object):
                 self.fail_json(msg=msg)
             return {}
 
+    def request_schema_batch(self, path, method, data):
+        """
+        Serve the requests of a schema from the staged copy of the schema batch and stage the PATCH operations instead of sending them.
+        The schema is requested only once per batch, when it is not staged yet.
+        :param path: The path of the schema, e.g. "schemas/<id>". -> Str
+        :param method: The HTTP method. -> Str
+        :param data: The PATCH operations. -> List[Dict]
+        :return: The staged schema. -> Dict
+        """
+        schema_id = SCHEMA_PATH_REGEX.match(path).group(1)
+        if method == "PATCH" and not data:
+            return {}
+        if method not in ("GET", "PATCH"):
+            self.fail_json(msg="The {0} request of '{1}' is not supported in a schema batch.".format(method, path))
+
+        schema = self.schema_batch.get_schema(schema_id)
+        if schema is None:
+            schema_batch, self.schema_batch = self.schema_batch, None
+            try:
+                schema = self.request(path, method="GET")
+            finally:
+                self.schema_batch = schema_batch
+            # Other requests of the schemas API, e.g. schemas/list-identity, are not staged
+            if not isinstance(schema, dict) or schema.get("id") != schema_id:
+                if method == "GET":
+                    return schema
+                self.fail_json(msg="The {0} request of '{1}' is not supported in a schema batch.".format(method, path))
+
+        self.path = path
+        self.method = method
+        if method == "PATCH":
+            self.patch_operation = data
+        try:
+            return self.schema_batch.stage(schema_id, schema, data if method == "PATCH" else None)
+        except ValueError as e:
+            self.fail_json(msg="Unable to stage the changes of schema '{0}': {1}".format(schema_id, e))
+
+    def request_schema_commit(self, path, data):
+        """
+        Queue the PATCH operations of a schema and send them together with the queued operations of concurrent module executions.
+        :param path: The path of the schema, e.g. "schemas/<id>". -> Str
+        :param data: The PATCH operations. -> List[Dict]
+        :return: The response of the PATCH request. -> Dict
+        """
+
+        def raise_request_error(msg, **kwargs):
+            raise RequestError(msg, **kwargs)
+
+        def send(ops):
+            worker = copy(self)
+            worker.params = dict(self.params, schema_commit_window=None)
+            worker.result = dict(changed=False)
+            worker.httpapi_logs = []
+            worker.fail_json = raise_request_error
+            try:
+                return worker.request(path, method="PATCH", data=ops), None
+            except RequestError as e:
+                return None, str(e)
+
+        queue = MSOSchemaCommitQueue(SCHEMA_PATH_REGEX.match(path).group(1), self.params.get("schema_commit_window"))
+        response, error = queue.commit(data, send)
+        self.path = path
+        self.method = "PATCH"
+        self.patch_operation = data
+        if error is not None:
+            self.fail_json(msg=error)
+        return response
+
+    def record_version(self, path, response):
+        """
+        Record the _updateVersion of a schema or template response and a JSON snapshot of the response.
+        The snapshot is taken before modules change the response in place and is only parsed when the PATCH operations are rebased.
+        :param path: The path of the schema or template. -> Str
+        :param response: The schema or template. -> Dict
+        """
+        if isinstance(response, dict) and response.get("_updateVersion") is not None:
+            self.versions[path] = (response.get("_updateVersion"), json.dumps(response))
+        else:
+            self.versions.pop(path, None)
+
+    def request_version_check(self, path, method, data):
+        """
+        Request a schema or template with optimistic concurrency control.
+        GET requests record the _updateVersion of the schema or template.
+        PATCH requests send the recorded _updateVersion with version checking enabled.
+        On a version conflict the schema or template is requested again, the operations are rebased onto the current version and sent again.
+        :param path: The path of the schema or template, e.g. "schemas/<id>". -> Str
+        :param method: The HTTP method, GET or PATCH. -> Str
+        :param data: The PATCH operations. -> List[Dict]
+        :return: The response. -> Dict
+        """
+
+        def raise_request_error(msg, **kwargs):
+            raise RequestError(msg, **kwargs)
+
+        params = self.params
+        self.params = dict(params, version_check=False)
+        try:
+            if method == "GET":
+                response = self.request(path, method="GET")
+                self.record_version(path, response)
+                return response
+
+            # Without a recorded version the operations are not based on a known version, so the version can not be checked
+            if not data or path not in self.versions:
+                return self.request(path, method="PATCH", data=data)
+
+            for attempt in range(VERSION_CHECK_ATTEMPTS):
+                version, snapshot = self.versions.get(path)
+                worker = copy(self)
+                worker.result = dict(self.result)
+                worker.httpapi_logs = []
+                worker.fail_json = raise_request_error
+                try:
+                    response = worker.request(
+                        path,
+                        method="PATCH",
+                        data=[dict(op="replace", path="/_updateVersion", value=version)] + data,
+                        qs=dict(enableVersionCheck="true"),
+                    )
+                    error = None
+                except RequestError as e:
+                    error = e
+                self.httpapi_logs.extend(worker.httpapi_logs)
+                self.path, self.method, self.url, self.status, self.response = worker.path, worker.method, worker.url, worker.status, worker.response
+                self.patch_operation = data
+
+                if error is None:
+                    self.result, self.has_modified = worker.result, worker.has_modified
+                    self.record_version(path, response)
+                    return response
+                # NDO responds with 409 Conflict or 400 Bad Request and a version mismatch message when the version changed
+                if worker.status not in (400, 409) or not VERSION_CONFLICT_REGEX.search(str(error)):
+                    self.error = worker.error
+                    self.fail_json(msg=str(error), **error.kwargs)
+
+                current = self.request(path, method="GET")
+                try:
+                    data = rebase_patch_ops(get_patch_base(json.loads(snapshot), data), current, data)
+                except ValueError as e:
+                    self.fail_json(msg="The {0} was changed concurrently and the changes can not be rebased: {1}".format(path.split("/")[0][:-1], e))
+                self.record_version(path, current)
+
+            self.fail_json(msg="The {0} was changed concurrently in {1} attempts.".format(path.split("/")[0][:-1], VERSION_CHECK_ATTEMPTS))
+        finally:
+            self.params = params
+
+    def request_concurrently(self, requests, workers=REQUEST_WORKERS, ignore_errors=False, not_found=None):
+        """
+        Execute independent requests concurrently with a bounded pool of workers.
+        Each worker uses a shallow copy of the module which raises RequestError instead of failing the module.
+        When the HTTP API connection plugin is used the requests are queued by the persistent connection.
+        :param requests: The keyword arguments of MSOModule.request per request. -> List[Dict]
+        :param workers: The maximum number of concurrent requests. -> Int
+        :param ignore_errors: Return None for failed requests instead of failing the module. -> Bool
+        :param not_found: Callable which returns True for the status and error message of a request of an object which does not exist,
+                          None is returned for those requests and the other failed requests fail the module. -> Callable
+        :return: The responses in the order of the provided requests. -> List
+        """
+
+        def raise_request_error(msg, **kwargs):
+            raise RequestError(msg, **kwargs)
+
+        def send(request_kwargs):
+            worker = copy(self)
+            worker.result = dict(changed=False)
+            worker.httpapi_logs = []
+            worker.fail_json = raise_request_error
+            try:
+                return worker, worker.request(**request_kwargs), None
+            except RequestError as e:
+                return worker, None, e
+
+        if HAS_CONCURRENT_FUTURES and workers > 1 and len(requests) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(requests))) as executor:
+                results = list(executor.map(send, requests))
+        else:
+            results = [send(request_kwargs) for request_kwargs in requests]
+
+        for worker, response, error in results:
+            self.httpapi_logs.extend(worker.httpapi_logs)
+            self.path, self.method, self.url, self.status, self.response = worker.path, worker.method, worker.url, worker.status, worker.response
+            if error is not None and not ignore_errors and not (not_found and not_found(worker.status, str(error))):
+                self.error = worker.error
+                self.result.update((key, value) for key, value in worker.result.items() if key != "changed")
+                self.fail_json(msg=str(error), **error.kwargs)
+
+        return [response for worker, response, error in results]
+
     def query_objs(self, path, key=None, api_version="v1", **kwargs):
         """Query the MSO REST API for objects in a path"""
         found = []
@@ -850,11 +1430,69 @@ class MSOModule(object):
             self.fail_json(msg="More than one object matches unique filter: {0}".format(kwargs))
         return objs[0]
 
+    def get_provided_id(self, object_type, name, verify=None):
+        """
+        Get the pre-resolved id of an object from the <object_type>_id parameter of the module, which skips the lookup of the object.
+        :param object_type: The type of the object, one of schema, site, tenant or template. -> Str
+        :param name: The name of the object to look up, the id is only used when it matches the <object_type> parameter. -> Str
+        :param verify: Verify that the object with the id exists with a single request, defaults to the verify_ids parameter. -> Bool
+        :return: The provided id or None when not provided. -> Str | None
+        """
+        object_id = self.params.get("{0}_id".format(object_type))
+        if not object_id or name is None or name != self.params.get(object_type):
+            return None
+        if verify is None:
+            verify = self.params.get("verify_ids")
+        if verify:
+            if object_type == "schema":
+                exists = any(schema.get("id") == object_id for schema in self.query_objs("schemas/list-identity", key="schemas"))
+            else:
+                # Only a 400 or 404 response means that the id does not exist, other errors fail the module with the original error
+                exists = bool(
+                    self.request_concurrently(
+                        [dict(path="{0}s/{1}".format(object_type, object_id), method="GET")], not_found=lambda status, msg: status in (400, 404)
+                    )[0]
+                )
+            if not exists:
+                self.fail_json(msg="Provided {0} id '{1}' does not exist.".format(object_type, object_id))
+        return object_id
+
+    def get_schema(self, schema_name=None, schema_id=None):
+        """
+        Get a schema from the schema pool of the module execution, the schema is only queried when it is not pooled yet.
+        :param schema_name: The name of the schema. -> Str
+        :param schema_id: The id of the schema. -> Str
+        :return: The schema. -> MSOSchema
+        """
+        schema_id = schema_id or self.schema_ids.get(schema_name)
+        mso_schema = self.schema_pool.get(schema_id)
+        if mso_schema is None or (schema_name is not None and mso_schema.schema_name != schema_name):
+            # MSOSchema adds itself to the pool
+            return MSOSchema(self, schema_name, schema_id=schema_id)
+        self.pool_schema(mso_schema)
+        return mso_schema
+
+    def pool_schema(self, mso_schema):
+        """
+        Add a schema to the schema pool of the module execution as the most recently used schema.
+        The least recently used schemas are removed when the pool holds more than SCHEMA_POOL_SIZE schemas, the schema ids per name are kept.
+        :param mso_schema: The schema. -> MSOSchema
+        """
+        self.schema_pool.pop(mso_schema.id, None)
+        self.schema_pool[mso_schema.id] = mso_schema
+        self.schema_ids[mso_schema.schema_name] = mso_schema.id
+        while len(self.schema_pool) > SCHEMA_POOL_SIZE:
+            self.schema_pool.popitem(last=False)
+
     def lookup_schema(self, schema, ignore_not_found_error=False):
         """Look up schema and return its id"""
         if schema is None:
             return schema
 
+        schema_id = self.get_provided_id("schema", schema) or self.schema_ids.get(schema)
+        if schema_id:
+            return schema_id
+
         schema_summary = self.query_objs("schemas/list-identity", key="schemas", displayName=schema)
         if not schema_summary and not ignore_not_found_error:
             self.fail_json(msg="Provided schema '{0}' does not exist.".format(schema))
@@ -864,6 +1502,7 @@ class MSOModule(object):
         schema_id = schema_summary[0].get("id")
         if not schema_id:
             self.fail_json(msg="Schema lookup failed for schema '{0}': '{1}'".format(schema, schema_id))
+        self.schema_ids[schema] = schema_id
         return schema_id
 
     def lookup_domain(self, domain, ignore_not_found_error=False):
@@ -921,6 +1560,10 @@ class MSOModule(object):
         if site is None:
             return site
 
+        site_id = self.get_provided_id("site", site)
+        if site_id:
+            return site_id
+
         s = self.get_obj("sites", name=site)
         if not s and not ignore_not_found_error:
             self.fail_json(msg="Site '{0}' is not a valid site name.".format(site))
@@ -956,6 +1599,10 @@ class MSOModule(object):
         if tenant is None:
             return tenant
 
+        tenant_id = self.get_provided_id("tenant", tenant)
+        if tenant_id:
+            return tenant_id
+
         t = self.get_obj("tenants", key="tenants", name=tenant)
         if not t and not ignore_not_found_error:
             self.fail_json(msg="Tenant '{0}' is not valid tenant name.".format(tenant))
@@ -1510,8 +2157,145 @@ class MSOModule(object):
 
         return modified_target
 
-    def validate_schema(self, schema_id):
-        return self.request("schemas/{id}/validate".format(id=schema_id), method="GET")
+    def wait_for_completion(self, path, get_statuses, timeout=WAIT_TIMEOUT, delay=WAIT_DELAY, max_delay=WAIT_MAX_DELAY):
+        """
+        Poll a status endpoint with exponential backoff until all statuses are final or the timeout expires.
+        :param path: The status endpoint to poll. -> Str
+        :param get_statuses: Function which returns the list of status values from the response, None when not available yet. -> Callable
+        :param timeout: The maximum number of seconds to wait. -> Int
+        :param delay: The initial number of seconds between polls, doubled after every poll. -> Int
+        :param max_delay: The maximum number of seconds between polls. -> Int
+        :return: The final response and the timings of the wait. -> Tuple(Dict, Dict)
+        """
+        return self.wait_for_completions([path], get_statuses, timeout=timeout, delay=delay, max_delay=max_delay)[0]
+
+    def wait_for_completions(self, paths, get_statuses, timeout=WAIT_TIMEOUT, delay=WAIT_DELAY, max_delay=WAIT_MAX_DELAY, workers=REQUEST_WORKERS):
+        """
+        Poll multiple status endpoints concurrently with exponential backoff until all statuses are final or the timeout expires.
+        Endpoints are no longer polled once their statuses are final.
+        :param paths: The status endpoints to poll. -> List[Str]
+        :param get_statuses: Function which returns the list of status values from a response, None when not available yet,
+                             or a list with a function per path. -> Callable | List[Callable]
+        :param timeout: The maximum number of seconds to wait. -> Int
+        :param delay: The initial number of seconds between polls, doubled after every poll. -> Int
+        :param max_delay: The maximum number of seconds between polls. -> Int
+        :param workers: The maximum number of concurrent polls. -> Int
+        :return: The final response and the timings of the wait per path in the order of the provided paths. -> List[Tuple(Dict, Dict)]
+        """
+        if not isinstance(get_statuses, list):
+            get_statuses = [get_statuses] * len(paths)
+        start = time.time()
+        polls = 0
+        interval = delay
+        results = [None] * len(paths)
+        pending = list(range(len(paths)))
+        statuses = {}
+        while pending:
+            elapsed = time.time() - start
+            if elapsed + interval > timeout:
+                self.fail_json(
+                    msg="Timeout of {0} seconds expired while waiting for '{1}' to complete. Last status: {2}".format(
+                        timeout, "', '".join(paths[index] for index in pending), [statuses.get(index) for index in pending]
+                    ),
+                    timings=dict(elapsed=round(elapsed, 3), polls=polls),
+                )
+            # Sleep before the first poll as well, so the status of a previous operation is not mistaken for the final status
+            time.sleep(interval)
+            interval = min(interval * 2, max_delay)
+            responses = self.request_concurrently([dict(path=paths[index], method="GET") for index in pending], workers=workers)
+            polls += 1
+            still_pending = []
+            for index, response in zip(pending, responses):
+                statuses[index] = get_statuses[index](response)
+                if is_completed(statuses[index]):
+                    results[index] = (response, dict(elapsed=round(time.time() - start, 3), polls=polls))
+                else:
+                    still_pending.append(index)
+            pending = still_pending
+        return results
+
+    def query_deploy_statuses(self, status_paths, workers=REQUEST_WORKERS):
+        """
+        Query the deploy statuses of schema templates, e.g. before a deployment is submitted, see get_submitted_deploy_site_statuses.
+        :param status_paths: The deploy status paths of the templates. -> List[Str]
+        :param workers: The maximum number of concurrent requests. -> Int
+        :return: The deploy status responses, None for templates which were never deployed. -> List[Dict]
+        """
+        return self.request_concurrently(
+            [dict(path=status_path, method="GET") for status_path in status_paths], workers=workers, not_found=lambda status, msg: status in (400, 404)
+        )
+
+    def get_cache(self, namespace, ttl=CACHE_TTL):
+        """
+        Get a controller side cache which is shared by the module executions of the same connection when enabled with MSO_CACHE,
+        otherwise the cache is only shared within the module execution.
+        With the HTTP API connection plugin the cache is scoped to the persistent connection, which is unique per playbook run and host.
+        :param namespace: The name of the cache. -> Str
+        :param ttl: The number of seconds after which an entry expires. -> Int
+        :return: The cache. -> MSOCache
+        """
+        if namespace not in self.caches:
+            if self.module._socket_path is not None:
+                scope = self.module._socket_path
+            else:
+                scope = "{0}:{1}:{2}".format(self.params.get("host"), self.params.get("port"), self.params.get("username"))
+            self.caches[namespace] = MSOCache(namespace, scope, ttl=ttl)
+        return self.caches[namespace]
+
+    def validate_schema(self, schema_id, force=False):
+        """
+        Validate a schema once per schema version.
+        :param schema_id: The id of the schema. -> Str
+        :param force: Validate the schema even when the validation result of the current schema version is cached. -> Bool
+        :return: The validation result. -> Dict
+        """
+        return self.validate_schemas([schema_id], force=force)[0]
+
+    def validate_schemas(self, schema_ids, force=False, workers=REQUEST_WORKERS):
+        """
+        Validate schemas concurrently, reusing the cached validation results of unchanged schemas.
+        Successful validation results are cached per schema id and _updateVersion, failed validations fail the module and are not cached.
+        The _updateVersion is taken from the schemas requested by the module execution, the schema identities are only requested
+        for the schemas which were not requested, the full schemas are never requested for the validation.
+        :param schema_ids: The ids of the schemas. -> List[Str]
+        :param force: Validate the schemas even when the validation results of the current schema versions are cached. -> Bool
+        :param workers: The maximum number of concurrent requests. -> Int
+        :return: The validation results in the order of the provided schema ids. -> List[Dict]
+        """
+        cache = self.get_cache("validation")
+        versions = [self.get_schema_version(schema_id) for schema_id in schema_ids]
+        if not force and None in versions:
+            schema_identities = dict((schema.get("id"), schema) for schema in self.query_objs("schemas/list-identity", key="schemas"))
+            versions = [
+                version if version is not None else schema_identities.get(schema_id, {}).get("_updateVersion")
+                for schema_id, version in zip(schema_ids, versions)
+            ]
+        # Schemas without a known _updateVersion are validated without caching, a key without version would reuse the results of other versions
+        keys = ["{0}:{1}".format(schema_id, version) if version is not None else None for schema_id, version in zip(schema_ids, versions)]
+        results = [cache.get(key) if key and not force else None for key in keys]
+        pending = [index for index, result in enumerate(results) if result is None]
+        validations = self.request_concurrently(
+            [dict(path="schemas/{0}/validate".format(schema_ids[index]), method="GET") for index in pending], workers=workers
+        )
+        for index, validation in zip(pending, validations):
+            results[index] = validation
+            if keys[index]:
+                cache.set(keys[index], validation)
+        return results
+
+    def get_schema_version(self, schema_id):
+        """
+        Get the _updateVersion of a schema which was requested by the module execution, without a request.
+        :param schema_id: The id of the schema. -> Str
+        :return: The _updateVersion or None when the schema was not requested. -> Int | None
+        """
+        path = "schemas/{0}".format(schema_id)
+        if path in self.versions:
+            return self.versions[path][0]
+        mso_schema = self.schema_pool.get(schema_id)
+        if mso_schema is not None and mso_schema.schema:
+            return mso_schema.schema.get("_updateVersion")
+        return None
 
     def input_validation(self, attr_name, attr_value, required_attributes, target_object, object_position=None, object_name=None):
         if attr_name in (None, "") or attr_value in (None, ""):
@@ -1647,6 +2431,44 @@ class MSOModule(object):
                 return self.fail_json(msg="ERROR: The time must be in 'YYYY-MM-DD HH:MM:SS' format.")
 
 
+def is_completed(statuses):
+    """Check if status values are available, None when not available yet, and none of them indicate that the operation is still running"""
+    return statuses is not None and not any(str(status).lower().replace(" ", "").replace("_", "") in WAIT_PENDING_STATUSES for status in statuses)
+
+
+def get_deploy_site_statuses(deploy_status):
+    """Get the site statuses from a schema template deploy status response, None when the response has no site statuses yet"""
+    if not isinstance(deploy_status, dict) or deploy_status.get("status") is None:
+        return None
+    return [(site.get("status") or {}).get("siteStatus") for site in deploy_status.get("status")]
+
+
+def get_submitted_deploy_site_statuses(previous_deploy_status, grace=WAIT_DEPLOY_GRACE):
+    """
+    Get a function which returns the site statuses of the deployment which is submitted after this call, see wait_for_completion.
+    Right after the submit the final status of the previous deployment can still be returned, so a final status is only accepted
+    when it differs from the deploy status before the submit, e.g. in the deployment time, when a pending status was returned since the submit,
+    or when the grace period after the submit expired. A template without sites has no site statuses and is completed.
+    :param previous_deploy_status: The deploy status response before the submit, None when the template has no deploy status. -> Dict
+    :param grace: The number of seconds after which a final status which equals the previous deploy status is accepted. -> Int
+    :return: The function which returns the site statuses of a deploy status response. -> Callable
+    """
+    submitted = time.time()
+    progress = dict(pending=False)
+
+    def get_statuses(deploy_status):
+        statuses = get_deploy_site_statuses(deploy_status)
+        if not statuses:
+            return statuses
+        if not is_completed(statuses):
+            progress["pending"] = True
+        elif not progress.get("pending") and deploy_status == previous_deploy_status and time.time() - submitted < grace:
+            return None
+        return statuses
+
+    return get_statuses
+
+
 def service_node_ref_str_to_dict(serviceNodeRefStr):
     serviceNodeRefTokens = serviceNodeRefStr.split("/")
     return dict(
@@ -14,16 +14,116 @@ Item = namedtuple("Item", "index details")
 
 
 class MSOSchema:
-    def __init__(self, mso_module, schema_name, template_name=None, site_name=None):
+    def __init__(self, mso_module, schema_name, template_name=None, site_name=None, schema_id=None, site_id=None):
         self.mso = mso_module
         self.schema_name = schema_name
-        self.id, self.path, self.schema = mso_module.query_schema(schema_name)
+        self.sites = {}
+        self.cached_sites = set()
+        # The schema and site ids provided as module parameters are verified by the schema query and set_site
+        schema_id = schema_id or mso_module.get_provided_id("schema", schema_name, verify=False)
+        site_id = site_id or mso_module.get_provided_id("site", site_name, verify=False)
+        if site_name and site_id:
+            self.sites[site_name] = dict(id=site_id, name=site_name)
+        self.id, self.path, self.schema = self.query_schema(schema_id, site_name if template_name else None)
         self.schema_objects = {}
+        self.mso.pool_schema(self)
         if template_name:
             self.set_template(template_name)
         if site_name and template_name:
             self.set_site(template_name, site_name)
 
+    def query_schema(self, schema_id=None, site_name=None):
+        """
+        Query the schema and the site with the least amount of sequential requests.
+        Schema ids and sites are reused from the identity cache of the connection, so the steady state is a single request.
+        The site and the schema or schema identities are requested concurrently, a stale cached schema id falls back to a lookup.
+        :param schema_id: The id of the schema, which skips the schema lookup. -> Str
+        :param site_name: The name of the site to resolve together with the schema. -> Str
+        :return: The schema id, path and schema. -> Tuple(Str, Str, Dict)
+        """
+        cache = self.mso.get_cache("identity")
+        cached_schema_id = None
+        if schema_id is None:
+            schema_id = cached_schema_id = cache.get("schema:{0}".format(self.schema_name))
+        if site_name and site_name not in self.sites:
+            self.set_site_data(cache.get("site:{0}".format(site_name)))
+            if site_name in self.sites:
+                self.cached_sites.add(site_name)
+
+        requests = [dict(path="schemas/{0}".format(schema_id) if schema_id else "schemas/list-identity", method="GET")]
+        if site_name and site_name not in self.sites:
+            requests.append(dict(path="sites", method="GET"))
+        responses = self.mso.request_concurrently(requests, ignore_errors=cached_schema_id is not None)
+
+        if len(responses) > 1 and responses[1]:
+            self.set_site_data(next((site for site in responses[1].get("sites", []) if site.get("name") == site_name), None), cache)
+
+        schema_identities = None
+        schema = None
+        if not schema_id:
+            schema_identities = responses[0]
+        elif responses[0] and (self.schema_name is None or responses[0].get("displayName") == self.schema_name):
+            schema = responses[0]
+        elif cached_schema_id is None:
+            self.mso.fail_json(msg="Schema '{0}' is not a valid schema name.".format(self.schema_name or schema_id))
+
+        if schema is None:
+            schema_id = self.lookup_schema_id(schema_identities)
+            schema = self.mso.query_obj("schemas/{0}".format(schema_id), displayName=self.schema_name)
+            if not schema:
+                self.mso.fail_json(msg="Schema '{0}' is not a valid schema name.".format(self.schema_name))
+        if self.schema_name is None:
+            self.schema_name = schema.get("displayName")
+        cache.set("schema:{0}".format(self.schema_name), schema_id)
+        return schema_id, "schemas/{0}".format(schema_id), schema
+
+    def lookup_schema_id(self, schema_identities=None):
+        """
+        Get the id of the schema from the schema identities.
+        :param schema_identities: The response of the schemas/list-identity request, queried when not provided. -> Dict
+        :return: The id of the schema. -> Str
+        """
+        if schema_identities is None:
+            return self.mso.lookup_schema(self.schema_name)
+        schema = next((schema for schema in schema_identities.get("schemas", []) if schema.get("displayName") == self.schema_name), None)
+        if not schema:
+            self.mso.fail_json(msg="Provided schema '{0}' does not exist.".format(self.schema_name))
+        if not schema.get("id"):
+            self.mso.fail_json(msg="Schema lookup failed for schema '{0}': '{1}'".format(self.schema_name, schema.get("id")))
+        return schema.get("id")
+
+    def set_site_data(self, site, cache=None):
+        """
+        Store the id and type of a site, so the site does not need to be looked up again.
+        :param site: The site as returned by the sites request. -> Dict
+        :param cache: The identity cache to store the site in. -> MSOCache
+        :return: None
+        """
+        if not site or not site.get("id"):
+            return
+        site = dict((key, site.get(key)) for key in ["id", "name", "platform", "cloudProviders"])
+        self.sites[site.get("name")] = site
+        self.mso.lookup_site_type(site)
+        if cache is not None:
+            cache.set("site:{0}".format(site.get("name")), site)
+
+    def lookup_site(self, site_name, refresh=False):
+        """
+        Get the id of a site from the resolved sites or look up the site.
+        :param site_name: Name of the site. -> Str
+        :param refresh: Look up the site even when it is already resolved. -> Bool
+        :return: The id of the site. -> Str
+        """
+        if refresh or site_name not in self.sites:
+            site = self.mso.get_obj("sites", name=site_name)
+            if not site:
+                self.mso.fail_json(msg="Site '{0}' is not a valid site name.".format(site_name))
+            if "id" not in site:
+                self.mso.fail_json(msg="Site lookup failed for site '{0}': {1}".format(site_name, site))
+            self.set_site_data(site, self.mso.get_cache("identity"))
+            self.cached_sites.discard(site_name)
+        return self.sites[site_name].get("id")
+
     @staticmethod
     def get_object_from_list(search_list, kv_list):
         """
@@ -232,8 +332,12 @@ class MSOSchema:
             msg = "No sites associated with schema '{0}'. Associate the site with the schema using (M) mso_schema_site.".format(self.schema_name)
             self.mso.fail_json(msg=msg)
 
-        kv_list = [KVPair("siteId", self.mso.lookup_site(site_name)), KVPair("templateName", template_name)]
+        kv_list = [KVPair("siteId", self.lookup_site(site_name)), KVPair("templateName", template_name)]
         match, existing = self.get_object_from_list(self.schema.get("sites"), kv_list)
+        if not match and site_name in self.cached_sites:
+            # The site id may be stale when the site is resolved from the identity cache, so refresh it once before failing
+            kv_list = [KVPair("siteId", self.lookup_site(site_name, refresh=True)), KVPair("templateName", template_name)]
+            match, existing = self.get_object_from_list(self.schema.get("sites"), kv_list)
         if not match and fail_module:
             msg = "Provided site '{0}' not associated with template '{1}'. Site is currently associated with template(s): {2}".format(
                 site_name, template_name, ", ".join(existing[1::2])
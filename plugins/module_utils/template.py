@@ -10,14 +10,78 @@ __metaclass__ = type
 from ansible_collections.cisco.mso.plugins.module_utils.constants import TEMPLATE_TYPES
 from ansible_collections.cisco.mso.plugins.module_utils.utils import generate_api_endpoint
 from collections import namedtuple
+from copy import deepcopy
+import re
 
 KVPair = namedtuple("KVPair", "key value")
 Item = namedtuple("Item", "index details")
 SearchQuery = namedtuple("SearchQuery", "key kv_pairs")
 
+# A template id that does not exist results in: MSO Error 400: Template ID 665da24b95400f375928f195 invalid
+TEMPLATE_ID_INVALID_REGEX = re.compile(r"Template ID \S+ invalid")
+
+
+def is_template_not_found(status, msg):
+    """
+    Check if the error of a template request means that the template does not exist.
+    :param status: The HTTP status of the response. -> Int
+    :param msg: The error message of the request. -> Str
+    :return: True for a 404 response or the 400 response of an invalid template id. -> Bool
+    """
+    return status == 404 or (status == 400 and TEMPLATE_ID_INVALID_REGEX.search(msg or "") is not None)
+
+
+def get_index(indexes, search_list, key, rebuild=False):
+    """
+    Get the positions of the objects in a list by the value of a key.
+    The index is stored in the provided indexes and rebuilt when the length of the list changes or when requested.
+    :param indexes: The indexes of the lists, which are dropped by the owner when the lists are replaced. -> Dict
+    :param search_list: Objects to index -> List.
+    :param key: The key of the objects to index, e.g. name or uuid. -> Str
+    :param rebuild: Rebuild the index, e.g. when objects were changed in place. -> Bool
+    :return: The positions of the objects per value of the key. -> Dict[Str, List[Int]]
+    :raises TypeError: When a value of the key is not hashable.
+    """
+    index_key = (id(search_list), key)
+    indexed_list, length, positions = indexes.get(index_key, (None, None, None))
+    if rebuild or indexed_list is not search_list or length != len(search_list):
+        positions = {}
+        for position, item in enumerate(search_list):
+            positions.setdefault(item.get(key), []).append(position)
+        indexes[index_key] = (search_list, len(search_list), positions)
+    return positions
+
+
+def get_indexed_object(indexes, search_list, kv_list):
+    """
+    Get the first matched object from a list of mso object dictionaries with the index of the first key.
+    The positions of the index are verified, an index which was reused and does not match is rebuilt,
+    because modules change the objects of the list in place, e.g. rename an object, without changing the length of the list.
+    :param indexes: The indexes of the lists. -> Dict
+    :param search_list: Objects to search through -> List.
+    :param kv_list: Key/value pairs that should match in the object. -> List[KVPair(Str, Str)]
+    :return: The index and details of the object. -> Item (Named Tuple) | None
+    """
+    if not kv_list or not isinstance(search_list, list):
+        return MSOTemplate.get_object_from_list(search_list, kv_list)[0]
+    index_key = (id(search_list), kv_list[0].key)
+    for rebuild in (False, True):
+        previous_index = indexes.get(index_key)
+        try:
+            positions = get_index(indexes, search_list, kv_list[0].key, rebuild).get(kv_list[0].value, [])
+        except TypeError:
+            return MSOTemplate.get_object_from_list(search_list, kv_list)[0]
+        for position in positions:
+            if all(search_list[position].get(kv.key) == kv.value for kv in kv_list):
+                return Item(position, search_list[position])
+        if indexes.get(index_key) is not previous_index:
+            # The index was built for this lookup, so it is current
+            break
+    return None
+
 
 class MSOTemplate:
-    def __init__(self, mso_module, template_type=None, template_name=None, template_id=None):
+    def __init__(self, mso_module, template_type=None, template_name=None, template_id=None, template=None):
         self.mso = mso_module
         self.templates_path = "templates"
         self.summaries_path = "{0}/summaries".format(self.templates_path)
@@ -26,46 +90,126 @@ class MSOTemplate:
         self.template_name = template_name
         self.template_id = template_id
         self.template_type = template_type
-        self.template_summary = {}
-
-        if template_id:
-            # Checking if the template with id exists to avoid error: MSO Error 400: Template ID 665da24b95400f375928f195 invalid
-            self.template_summary = self.mso.get_obj(self.summaries_path, templateId=self.template_id)
-            if self.template_summary:
-                self.template_path = "{0}/{1}".format(self.templates_path, self.template_id)
-                self.template = self.mso.query_obj(self.template_path)
-            else:
-                self.mso.fail_json(
-                    msg="Provided template id '{0}' does not exist. Existing templates: {1}".format(
-                        self.template_id,
-                        [
-                            "Template '{0}' with id '{1}'".format(template.get("templateName"), template.get("templateId"))
-                            for template in self.mso.query_objs(self.summaries_path)
-                        ],
-                    )
-                )
+        self._template_summary = None
+
+        if template:
+            # The template is already queried, e.g. concurrently with other referenced templates by MSOTemplateObjects
+            self.template_id = template.get("templateId")
+            self.template_type = template.get("templateType")
+            self.template, self.template_path = template, "{0}/{1}".format(self.templates_path, self.template_id)
+        elif template_id:
+            self.set_template_by_id(template_id, fail_module=True)
         elif template_name:
             if not template_type:
                 self.mso.fail_json(msg="Template type must be provided when using template name.")
-            self.template_summary = self.mso.get_obj(
-                self.summaries_path, templateName=self.template_name, templateType=TEMPLATE_TYPES[template_type]["template_type"]
-            )
-            if self.template_summary:
-                self.template_path = "{0}/{1}".format(self.templates_path, self.template_summary.get("templateId"))
-                self.template = self.mso.query_obj(self.template_path)
+            # The template id provided as module parameter skips the summaries lookup when it matches the name and type of the template
+            provided_template_id = self.mso.get_provided_id("template", template_name, verify=False)
+            if provided_template_id:
+                self.set_template_by_id(provided_template_id, fail_module=False)
+                if self.template.get("displayName") != template_name or self.template.get("templateType") != TEMPLATE_TYPES[template_type]["template_type"]:
+                    self.template, self.template_path, self.template_id, self._template_summary = {}, "", None, None
+            if not self.template:
+                self.set_template_by_name(template_name, TEMPLATE_TYPES[template_type]["template_type"])
+            if self.template:
                 self.template_id = self.template.get("templateId")
                 self.template_type = self.template.get("templateType")
 
         elif template_type:
-            self.template = self.mso.query_objs(self.summaries_path, templateType=TEMPLATE_TYPES[template_type]["template_type"])
+            self.template = [summary for summary in self.query_summaries() if summary.get("templateType") == TEMPLATE_TYPES[template_type]["template_type"]]
         else:
-            self.template = self.mso.query_objs(self.summaries_path)
+            self.template = self.query_summaries()
 
         # Remove unwanted keys from existing object for better output and diff compares
         if isinstance(self.template, dict):
             for key in ["_updateVersion", "version"]:
                 self.template.pop(key, None)
 
+    @property
+    def template(self):
+        return self._template
+
+    @template.setter
+    def template(self, template):
+        # Replacing the template, e.g. with the response of a PATCH request, drops the indexes of its object lists
+        self._template = template
+        self._indexes = {}
+
+    @property
+    def template_summary(self):
+        """
+        The summary of the template, which is only queried when the template was not looked up by its summary.
+        :return: The template summary. -> Dict
+        """
+        if self._template_summary is None:
+            self._template_summary = self.get_summary(templateId=self.template_id) if self.template_id else {}
+        return self._template_summary
+
+    @template_summary.setter
+    def template_summary(self, template_summary):
+        self._template_summary = template_summary
+
+    def query_summaries(self):
+        """
+        Query the template summaries and store them in the identity cache of the connection.
+        :return: The template summaries. -> List[Dict]
+        """
+        summaries = self.mso.query_objs(self.summaries_path)
+        self.mso.get_cache("identity").set("template_summaries", summaries)
+        return summaries
+
+    def get_summary(self, **kwargs):
+        """
+        Get the summary of a template from the cached template summaries of the connection.
+        The template summaries are queried again when no cached summary matches, e.g. for a template which was created after caching.
+        :param kwargs: The key value pairs which must match the summary. -> Dict
+        :return: The template summary. -> Dict
+        """
+
+        def find(summaries):
+            return next((summary for summary in summaries or [] if all(summary.get(key) == value for key, value in kwargs.items())), None)
+
+        return find(self.mso.get_cache("identity").get("template_summaries")) or find(self.query_summaries()) or {}
+
+    def set_template_by_name(self, template_name, template_type):
+        """
+        Query the template with the id of the cached template summary and fall back to the current template summaries when the cached summary is stale.
+        :param template_name: The name of the template. -> Str
+        :param template_type: The type of the template as used by NDO, e.g. "tenantPolicy". -> Str
+        :return: None
+        """
+
+        def set_template(summaries):
+            summary = next((item for item in summaries if item.get("templateName") == template_name and item.get("templateType") == template_type), None)
+            if summary:
+                self.set_template_by_id(summary.get("templateId"), fail_module=False)
+                if self.template.get("displayName") == template_name and self.template.get("templateType") == template_type:
+                    self._template_summary = summary
+                    return True
+                self.template, self.template_path, self.template_id = {}, "", None
+            return False
+
+        if not set_template(self.mso.get_cache("identity").get("template_summaries") or []):
+            set_template(self.query_summaries())
+
+    def set_template_by_id(self, template_id, fail_module=True):
+        """
+        Query the template directly by id, without checking the template summaries first.
+        :param template_id: The id of the template. -> Str
+        :param fail_module: When the template does not exist fail the ansible module. -> Bool
+        :return: None
+        """
+        template_path = "{0}/{1}".format(self.templates_path, template_id)
+        template = self.mso.request_concurrently([dict(path=template_path, method="GET")], not_found=is_template_not_found)[0]
+        if template:
+            self.template, self.template_path, self.template_id = template, template_path, template_id
+        elif fail_module:
+            self.mso.fail_json(
+                msg="Provided template id '{0}' does not exist. Existing templates: {1}".format(
+                    template_id,
+                    ["Template '{0}' with id '{1}'".format(template.get("templateName"), template.get("templateId")) for template in self.query_summaries()],
+                )
+            )
+
     @staticmethod
     def get_object_from_list(search_list, kv_list):
         """
@@ -83,6 +227,140 @@ class MSOTemplate:
         existing = [item.get(kv.key) for item in search_list for kv in kv_list]
         return match, existing
 
+    def get_index(self, search_list, key):
+        """
+        Get the positions of the objects in a list by the value of a key.
+        The index is built on first use and reused until the template is replaced or the length of the list changes.
+        :param search_list: Objects of the template to index -> List.
+        :param key: The key of the objects to index, e.g. name or uuid. -> Str
+        :return: The positions of the objects per value of the key. -> Dict[Str, List[Int]]
+        :raises TypeError: When a value of the key is not hashable.
+        """
+        return get_index(self._indexes, search_list, key)
+
+    def get_indexed_object(self, search_list, kv_list):
+        """
+        Get the first matched object from a list of mso object dictionaries with the index of the first key.
+        :param search_list: Objects to search through -> List.
+        :param kv_list: Key/value pairs that should match in the object. -> List[KVPair(Str, Str)]
+        :return: The index and details of the object. -> Item (Named Tuple) | None
+        """
+        return get_indexed_object(self._indexes, search_list, kv_list)
+
+    def get_bulk_matches(self, object_description, search_list, desired_objects):
+        """
+        Match the desired objects of a bulk module with the existing objects, by uuid when provided and by name otherwise.
+        :param object_description: Description of the objects used in the error messages, e.g. Interface Policy Group. -> Str
+        :param search_list: The existing objects. -> List[Dict]
+        :param desired_objects: The desired objects with a name or a uuid. -> List[Dict]
+        :return: The desired object and the matched existing object per desired object. -> List[Tuple(Dict, Item | None)]
+        """
+        matches, provided = [], set()
+        for desired_object in desired_objects:
+            name, uuid = desired_object.get("name"), desired_object.get("uuid")
+            if not (name or uuid):
+                self.mso.fail_json(msg="Every {0} must have a name or a uuid.".format(object_description))
+            match = self.get_indexed_object(search_list, [KVPair("uuid", uuid) if uuid else KVPair("name", name)])
+            if uuid and not match:
+                self.mso.fail_json(msg="{0} with the UUID: '{1}' not found".format(object_description, uuid))
+            key = match.index if match else name
+            if key in provided:
+                self.mso.fail_json(msg="The {0} '{1}' is provided more than once.".format(object_description, name or uuid))
+            provided.add(key)
+            matches.append((desired_object, match))
+        return matches
+
+    def patch(self, ops, chunk_size=None):
+        """
+        Send PATCH operations to the template, in multiple requests of at most chunk_size operations when provided.
+        The template is replaced with the response of the last request.
+        :param ops: The PATCH operations. -> List[Dict]
+        :param chunk_size: The maximum number of operations per request. -> Int
+        :return: The response of the last request. -> Dict
+        """
+        response = None
+        chunk_size = chunk_size or len(ops)
+        for start in range(0, len(ops), chunk_size):
+            response = self.mso.request(self.template_path, method="PATCH", data=ops[start : start + chunk_size])
+        if response:
+            self.template = response
+        return response
+
+    @staticmethod
+    def get_attribute_ops(path, existing, desired):
+        """
+        Get the PATCH operations which set the desired attributes of an object, attributes which are not provided or None are not changed.
+        :param path: The path of the object. -> Str
+        :param existing: The existing object. -> Dict
+        :param desired: The desired attributes of the object. -> Dict
+        :return: The operations. -> List[Dict]
+        """
+        return [
+            dict(op="replace" if key in existing else "add", path="{0}/{1}".format(path, key), value=value)
+            for key, value in sorted(desired.items())
+            if value is not None and existing.get(key) != value
+        ]
+
+    def get_apply_ops(self, content_key, desired, prune=False):
+        """
+        Get the PATCH operations which apply the desired objects to the collections of the template content with a minimal diff.
+        Objects are matched by uuid when provided and by name otherwise, only the provided attributes of matched objects are compared.
+        The collections which are not provided are not changed.
+        :param content_key: The key of the template content, e.g. tenantPolicyTemplate. -> Str
+        :param desired: The desired objects per collection, or the desired attributes of singleton objects like ptpPolicy. -> Dict[Str, List[Dict] | Dict]
+        :param prune: Remove the objects of the provided collections which are not desired. -> Bool
+        :return: The operations, the previous and the proposed objects of the provided collections. -> Tuple(List[Dict], Dict, Dict)
+        """
+        content = self.template.get(content_key, {}).get("template", {})
+        ops, previous, proposed = [], {}, {}
+        for collection in sorted(desired):
+            path = "/{0}/template/{1}".format(content_key, collection)
+            existing = content.get(collection)
+            previous[collection] = deepcopy(existing)
+
+            if isinstance(desired[collection], dict):
+                attributes = dict((key, value) for key, value in desired[collection].items() if value is not None)
+                if isinstance(existing, dict):
+                    ops.extend(self.get_attribute_ops(path, existing, attributes))
+                    proposed[collection] = dict(existing, **attributes)
+                else:
+                    ops.append(dict(op="add", path=path, value=attributes))
+                    proposed[collection] = attributes
+                continue
+
+            existing = existing or []
+            matched, keys = set(), set()
+            replace_ops, add_ops = [], []
+            proposed_objects = deepcopy(existing)
+            added_objects = []
+            for desired_object in desired[collection] or []:
+                if not isinstance(desired_object, dict) or not (desired_object.get("uuid") or desired_object.get("name")):
+                    self.mso.fail_json(msg="Every object of '{0}' must be a dictionary with a name or uuid.".format(collection))
+                kv = KVPair("uuid", desired_object.get("uuid")) if desired_object.get("uuid") else KVPair("name", desired_object.get("name"))
+                if kv in keys:
+                    self.mso.fail_json(msg="The object with {0} '{1}' is provided more than once in '{2}'.".format(kv.key, kv.value, collection))
+                keys.add(kv)
+                attributes = dict((key, value) for key, value in desired_object.items() if value is not None)
+                match = self.get_indexed_object(existing, [kv])
+                if match:
+                    if match.index in matched:
+                        self.mso.fail_json(msg="The object '{0}' is provided more than once in '{1}'.".format(match.details.get("name"), collection))
+                    matched.add(match.index)
+                    replace_ops.extend(self.get_attribute_ops("{0}/{1}".format(path, match.index), match.details, attributes))
+                    proposed_objects[match.index].update(attributes)
+                elif kv.key == "uuid":
+                    self.mso.fail_json(msg="The object with uuid '{0}' does not exist in '{1}'.".format(kv.value, collection))
+                else:
+                    add_ops.append(dict(op="add", path="{0}/-".format(path), value=attributes))
+                    added_objects.append(attributes)
+
+            # The objects are removed from the end of the collection, so the indexes of the operations remain valid
+            remove_ops = [dict(op="remove", path="{0}/{1}".format(path, index)) for index in reversed(range(len(existing))) if prune and index not in matched]
+            ops.extend(replace_ops + remove_ops + add_ops)
+            proposed[collection] = [item for index, item in enumerate(proposed_objects) if not prune or index in matched] + added_objects
+
+        return ops, previous, proposed
+
     def validate_template(self, template_type):
         """
         Validate that attributes are set to a value that is not equal None.
@@ -102,8 +380,9 @@ class MSOTemplate:
         :param fail_module: When match is not found fail the ansible module. -> Bool
         :return: The object. -> Dict | None
         """
-        match, existing = self.get_object_from_list(search_list, kv_list)
+        match = self.get_indexed_object(search_list, kv_list)
         if not match and fail_module:
+            existing = [item.get(kv.key) for item in search_list for kv in kv_list]
             msg = "Provided {0} with '{1}' not matching existing object(s): {2}".format(object_description, kv_list, ", ".join(existing))
             self.mso.fail_json(msg=msg)
         return match
@@ -153,28 +432,22 @@ class MSOTemplate:
         :return: The details of the route map object if found, otherwise an empty dictionary. -> Dict
         """
         if route_map and tenant_id and route_map_objects:
-            route_map_object = self.get_object_from_list(
-                route_map_objects,
-                [KVPair("name", route_map), KVPair("tenantId", tenant_id)],
-            )
-            if route_map_object[0]:
-                return route_map_object[0].details
+            route_map_object = self.get_indexed_object(route_map_objects, [KVPair("name", route_map), KVPair("tenantId", tenant_id)])
+            if route_map_object:
+                return route_map_object.details
             else:
                 self.mso.fail_json(msg="Provided Route Map {0}: {1} with the tenant: {2} not found.".format(attr_name, route_map, tenant_name))
         else:
             return {}
 
-    def get_vrf_object(self, vrf_dict, tenant_id, templates_objects_path):
+    def get_vrf_object(self, vrf_dict, tenant_id, templates_objects_path=None):
         """
         Get VRF object based on provided parameters.
         :param vrf_dict: Dictionary containing VRF details. -> Dict
         :param tenant_id: Id of the tenant. -> Str
-        :param templates_objects_path: Path to the templates objects. -> Str
+        :param templates_objects_path: Unused, the VRF objects are queried by the template objects resolver of the module. -> Str
         :return: VRF object if found, otherwise fail with an error message. -> Dict
         """
-
-        vrf_path = generate_api_endpoint(templates_objects_path, **{"type": "vrf", "tenant-id": tenant_id, "include-common": "true"})
-        vrf_objects = self.mso.query_objs(vrf_path)
         vrf_kv_list = [
             KVPair("name", vrf_dict.get("name")),
             KVPair("templateName", vrf_dict.get("template")),
@@ -182,10 +455,10 @@ class MSOTemplate:
             KVPair("tenantId", tenant_id),
         ]
 
-        vrf_object = self.get_object_from_list(vrf_objects, vrf_kv_list)
+        vrf_object = self.mso.template_objects.get_object("vrf", tenant_id, vrf_kv_list)
 
-        if vrf_object[0]:
-            return vrf_object[0]
+        if vrf_object:
+            return vrf_object
         else:
             self.mso.fail_json(msg="Provided VRF {0} not found.".format(vrf_dict.get("name")))
 
@@ -269,3 +542,151 @@ class MSOTemplate:
         if uuid or name:  # Query a specific object
             return self.get_object_by_key_value_pairs("Node Settings", existing_objects, [KVPair("uuid", uuid) if uuid else KVPair("name", name)], fail_module)
         return existing_objects  # Query all objects
+
+
+class MSOTemplateObjects:
+    """
+    Resolver of the objects referenced across templates, shared by the MSOTemplate instances of a module execution.
+    The objects are queried with templates/objects per object type and tenant, the queries of multiple object types are sent concurrently.
+    The query results and the referenced templates are kept in memory for the module execution and served from indexes.
+    """
+
+    def __init__(self, mso_module):
+        self.mso = mso_module
+        self.templates_path = "templates"
+        self.objects_path = "{0}/objects".format(self.templates_path)
+        self.objects = {}
+        self.templates = {}
+        self._indexes = {}
+
+    def prefetch(self, queries):
+        """
+        Query the objects of multiple object types and tenants concurrently, skipping the queries which are already done.
+        :param queries: The object type and tenant id per query, the tenant id is None to query the objects of all tenants. -> List[Tuple(Str, Str)]
+        """
+        queries = [query for index, query in enumerate(queries) if query not in self.objects and query not in queries[:index]]
+        if not queries:
+            return
+        responses = self.mso.request_concurrently(
+            [
+                dict(
+                    path=generate_api_endpoint(
+                        self.objects_path, **({"type": object_type, "tenant-id": tenant_id, "include-common": "true"} if tenant_id else {"type": object_type})
+                    ),
+                    method="GET",
+                )
+                for object_type, tenant_id in queries
+            ]
+        )
+        for query, response in zip(queries, responses):
+            self.objects[query] = response if isinstance(response, list) else []
+
+    def get_objects(self, object_type, tenant_id=None):
+        """
+        Get the objects of a type, including the objects of the common tenant when a tenant is provided.
+        :param object_type: The type of the objects, e.g. vrf, routeMap or l3OutNodePolGroup. -> Str
+        :param tenant_id: The id of the tenant. -> Str
+        :return: The objects. -> List[Dict]
+        """
+        self.prefetch([(object_type, tenant_id)])
+        return self.objects[(object_type, tenant_id)]
+
+    def get_object(self, object_type, tenant_id, kv_list, object_description=None, fail_module=False):
+        """
+        Get the first object of a type which matches the key value pairs.
+        :param object_type: The type of the objects, e.g. vrf, routeMap or l3OutNodePolGroup. -> Str
+        :param tenant_id: The id of the tenant. -> Str
+        :param kv_list: Key/value pairs that should match in the object. -> List[KVPair(Str, Str)]
+        :param object_description: Description of the object to search for, used in the failure message. -> Str
+        :param fail_module: When match is not found fail the ansible module. -> Bool
+        :return: The index and details of the object. -> Item (Named Tuple) | None
+        """
+        search_list = self.get_objects(object_type, tenant_id)
+        match = get_indexed_object(self._indexes, search_list, kv_list)
+        if not match and fail_module:
+            existing = [item.get(kv.key) for item in search_list for kv in kv_list]
+            msg = "Provided {0} with '{1}' not matching existing object(s): {2}".format(object_description or object_type, kv_list, ", ".join(existing))
+            self.mso.fail_json(msg=msg)
+        return match
+
+    def prefetch_templates(self, template_type, template_names):
+        """
+        Query multiple referenced templates of a type concurrently, skipping the templates which are already queried.
+        The template ids are taken from the template summaries, a template which is not found is looked up again by get_template.
+        :param template_type: The template type key of TEMPLATE_TYPES, e.g. fabric_policy. -> Str
+        :param template_names: The names of the templates. -> List[Str]
+        """
+        template_names = [
+            name for index, name in enumerate(template_names) if (template_type, name) not in self.templates and name not in template_names[:index]
+        ]
+        if not template_names:
+            return
+        ndo_template_type = TEMPLATE_TYPES[template_type]["template_type"]
+
+        def get_template_ids(summaries):
+            return dict(
+                (summary.get("templateName"), summary.get("templateId"))
+                for summary in summaries or []
+                if summary.get("templateType") == ndo_template_type and summary.get("templateName") in template_names
+            )
+
+        cache = self.mso.get_cache("identity")
+        template_ids = get_template_ids(cache.get("template_summaries"))
+        if len(template_ids) != len(template_names):
+            summaries = self.mso.query_objs("{0}/summaries".format(self.templates_path))
+            cache.set("template_summaries", summaries)
+            template_ids = get_template_ids(summaries)
+
+        names = list(template_ids)
+        responses = self.mso.request_concurrently(
+            [dict(path="{0}/{1}".format(self.templates_path, template_ids[name]), method="GET") for name in names], not_found=is_template_not_found
+        )
+        for name, template in zip(names, responses):
+            if template and template.get("displayName") == name and template.get("templateType") == ndo_template_type:
+                self.templates[(template_type, name)] = MSOTemplate(self.mso, template_type, name, template=template)
+
+    def resolve_references(self, desired, references, template=None):
+        """
+        Replace the references by name in the desired objects with the uuids of the referenced objects, the referenced templates are queried concurrently.
+        A reference is a dictionary with the name of the object and the name of its template, e.g. {"name": "policy_group_1", "template": "fabric_template"}.
+        :param desired: The desired objects per collection, the references are replaced in place. -> Dict[Str, List[Dict]]
+        :param references: The template type, collection and description of the referenced objects per collection and attribute.
+                           -> Dict[Tuple(Str, Str), Tuple(Str, Str, Str)]
+        :param template: The template of the references without a template name, the references must include a template name when not provided. -> MSOTemplate
+        """
+        found = []
+        for (collection, attribute), reference in sorted(references.items()):
+            for desired_object in desired.get(collection) or []:
+                value = desired_object.get(attribute) if isinstance(desired_object, dict) else None
+                if isinstance(value, dict):
+                    if not value.get("name") or not (value.get("template") or template):
+                        self.mso.fail_json(msg="The reference '{0}' of '{1}' must include a name and a template.".format(attribute, collection))
+                    found.append((desired_object, attribute, value, reference))
+
+        for template_type in sorted(set(reference[0] for desired_object, attribute, value, reference in found)):
+            self.prefetch_templates(
+                template_type,
+                [value.get("template") for desired_object, attribute, value, reference in found if value.get("template") and reference[0] == template_type],
+            )
+
+        for desired_object, attribute, value, (template_type, collection, object_description) in found:
+            referenced_template = self.get_template(template_type, value.get("template")) if value.get("template") else template
+            referenced_template.validate_template(TEMPLATE_TYPES[template_type]["template_type"])
+            referenced_objects = (
+                referenced_template.template.get(TEMPLATE_TYPES[template_type]["template_type_container"], {}).get("template", {}).get(collection, [])
+            )
+            match = referenced_template.get_object_by_key_value_pairs(object_description, referenced_objects, [KVPair("name", value.get("name"))], True)
+            desired_object[attribute] = match.details.get("uuid")
+
+    def get_template(self, template_type, template_name=None, template_id=None):
+        """
+        Get a referenced template, which is only requested once per module execution.
+        :param template_type: The template type key of TEMPLATE_TYPES, e.g. fabric_policy. -> Str
+        :param template_name: The name of the template. -> Str
+        :param template_id: The id of the template. -> Str
+        :return: The template. -> MSOTemplate
+        """
+        key = (template_type, template_id) if template_id else (template_type, template_name)
+        if key not in self.templates:
+            self.templates[key] = MSOTemplate(self.mso, template_type, template_name, template_id)
+        return self.templates[key]
@@ -8,6 +8,11 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import copy
+import json
+from ansible.module_utils.six import string_types
+
+# The value of an attribute which is removed by get_attribute_ops
+REMOVE_ATTRIBUTE = object()
 
 
 def generate_api_endpoint(path, **kwargs):
@@ -92,50 +97,311 @@ def append_update_ops_data(ops, existing_data, update_path, replace_data=None, r
     ]
     """
 
-    def recursive_replace(data, path, keys, new_value):
-        key = keys[0]
-        if len(keys) == 1:
-            # Update the existing configuration
-            if new_value is not None and data.get(key) != new_value:
-                data[key] = new_value
-                ops.append(
-                    dict(
-                        op="replace",
-                        path="{}/{}".format(path, key),
-                        value=copy.deepcopy(new_value),
-                    )
-                )
-        elif key in data:
-            recursive_replace(data[key], "{}/{}".format(path, key), keys[1:], new_value)
-
-    def recursive_delete(data, path, keys):
-        key = keys[0]
-        if len(keys) == 1:
-            # Clear the existing configuration
-            if key in data:
-                data.pop(key)
-                ops.append(
-                    dict(
-                        op="remove",
-                        path="{}/{}".format(path, key),
-                    )
-                )
-        elif key in data:
-            recursive_delete(data[key], "{}/{}".format(path, key), keys[1:])
-
-    if replace_data:
-        if not isinstance(replace_data, dict):
-            raise TypeError("replace_data must be a dict")
-
-        for key, value in replace_data.items():
-            recursive_replace(existing_data, update_path, key if isinstance(key, tuple) else (key,), value)
-
-    if remove_data:
-        if not isinstance(remove_data, list):
-            raise TypeError("remove_data must be a list of string or tuples")
-
-        for key in remove_data:
-            recursive_delete(existing_data, update_path, key if isinstance(key, tuple) else (key,))
+    if replace_data and not isinstance(replace_data, dict):
+        raise TypeError("replace_data must be a dict")
+
+    if remove_data and not isinstance(remove_data, list):
+        raise TypeError("remove_data must be a list of string or tuples")
+
+    attributes = dict(replace_data or {})
+    attributes.update((key, REMOVE_ATTRIBUTE) for key in remove_data or [])
+    ops.extend(get_attribute_ops(existing_data, update_path, attributes, add_missing=False))
+
+
+def get_attribute_ops(existing_data, update_path, attributes, add_missing=True):
+    """
+    Compile the desired attributes of an object into the minimal PATCH operations in one pass.
+    The existing data is updated in place with the desired attributes, so it can be used as the proposed object.
+    :param existing_data: The existing object. -> Dict
+    :param update_path: The path of the object. -> Str
+    :param attributes: The desired value per attribute path, the path is the attribute name or a tuple of nested attribute names.
+                       Attributes with a None value are not changed, attributes with the REMOVE_ATTRIBUTE value are removed. -> Dict
+    :param add_missing: Create the missing parents of nested attributes, when False the nested attributes of missing parents are ignored. -> Bool
+                        Nested attributes of an attribute with a dict value are set in a copy of the dict value.
+    :return: The PATCH operations. -> List[Dict]
+
+    The changes of sibling attributes are coalesced into one replace operation of the parent when the operation is smaller.
+    The values of the operations are not copied, except for coalesced parents which are copied once.
+
+    Sample Input Data:
+    ------------------
+    existing_data = {"name": "name", "cdp": {"adminState": "enabled"}, "mcp": {"adminState": "enabled", "txFreq": 2}}
+    attributes = {
+        "name": "new_name",
+        "description": None,
+        ("cdp", "adminState"): REMOVE_ATTRIBUTE,
+        ("mcp", "adminState"): "disabled",
+        ("mcp", "txFreq"): 10,
+        ("lldp", "receiveState"): "enabled",
+    }
+
+    API Input Data:
+    ---------------
+    [
+        {"op": "replace", "path": "/path/name", "value": "new_name"},
+        {"op": "remove", "path": "/path/cdp/adminState"},
+        {"op": "replace", "path": "/path/mcp", "value": {"adminState": "disabled", "txFreq": 10}},
+        {"op": "replace", "path": "/path/lldp", "value": {"receiveState": "enabled"}},
+    ]
+    """
+    # The attribute tree nests the changes per parent, the desired values are wrapped in a tuple to distinguish them from nested changes
+    tree = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        keys = key if isinstance(key, tuple) else (key,)
+        node = tree
+        for index, parent in enumerate(keys[:-1]):
+            if isinstance(node.get(parent), tuple) and isinstance(node[parent][0], dict):
+                # Nested attributes of a desired dict value are set in a copy of the value
+                node[parent] = (set_nested_value(dict(node[parent][0]), keys[index + 1 :], value),)
+                break
+            node = node.setdefault(parent, {})
+            if isinstance(node, tuple):
+                raise ValueError("The attribute '{0}' is set together with its nested attributes".format(parent))
+        else:
+            if isinstance(node.get(keys[-1]), dict):
+                raise ValueError("The attribute '{0}' is set together with its nested attributes".format(keys[-1]))
+            node[keys[-1]] = (value,)
+
+    ops = []
+    compile_attribute_ops(ops, existing_data, update_path, tree, add_missing)
+    return ops
+
+
+def set_nested_value(data, keys, value):
+    if len(keys) == 1:
+        if value is REMOVE_ATTRIBUTE:
+            data.pop(keys[0], None)
+        else:
+            data[keys[0]] = value
+    else:
+        data[keys[0]] = set_nested_value(dict(data.get(keys[0]) or {}), keys[1:], value)
+    return data
+
+
+def compile_attribute_ops(ops, data, path, tree, add_missing):
+    for key, change in tree.items():
+        key_path = "{0}/{1}".format(path, key)
+        if isinstance(change, tuple):
+            if change[0] is REMOVE_ATTRIBUTE:
+                if key in data:
+                    data.pop(key)
+                    ops.append(dict(op="remove", path=key_path))
+            elif data.get(key) != change[0]:
+                data[key] = change[0]
+                ops.append(dict(op="replace", path=key_path, value=change[0]))
+        elif isinstance(data.get(key), dict):
+            nested_ops = []
+            compile_attribute_ops(nested_ops, data[key], key_path, change, add_missing)
+            parent_op = dict(op="replace", path=key_path, value=data[key])
+            if len(nested_ops) > 1 and len(json.dumps(parent_op)) < len(json.dumps(nested_ops)):
+                parent_op["value"] = copy.deepcopy(data[key])
+                ops.append(parent_op)
+            else:
+                ops.extend(nested_ops)
+        elif add_missing:
+            value = {}
+            compile_attribute_ops([], value, key_path, change, add_missing)
+            if value:
+                data[key] = value
+                ops.append(dict(op="replace", path=key_path, value=value))
+
+
+def apply_patch_ops(data, ops):
+    """
+    Apply PATCH operations to a schema or template structure in place, the way the NDO API applies them.
+
+    :param data: The schema or template structure. -> Dict
+    :param ops: The PATCH operations with an op, a path and a value. -> List[Dict]
+    :return: None
+    :raises ValueError: When the path of an operation does not exist in the structure.
+
+    Items of a list are addressed by index, by "-" for the end of the list, by name,
+    or by "<siteId>-<templateName>" for the sites of a schema, e.g. "/templates/Template1/bds/BD1/subnets/0".
+    """
+
+    def get_index(items, key, path):
+        if key == "-":
+            return len(items)
+        if key.isdigit():
+            return int(key)
+        for index, item in enumerate(items):
+            if isinstance(item, dict) and key in (item.get("name"), "{0}-{1}".format(item.get("siteId"), item.get("templateName"))):
+                return index
+        raise ValueError("Unable to apply the operation, '{0}' does not exist in '{1}'".format(key, path))
+
+    for op in ops:
+        path = op.get("path")
+        keys = [key.replace("~1", "/").replace("~0", "~") for key in path.strip("/").split("/")]
+        parent = data
+        try:
+            for key in keys[:-1]:
+                parent = parent[get_index(parent, key, path) if isinstance(parent, list) else key]
+        except (IndexError, KeyError, TypeError):
+            raise ValueError("Unable to apply the operation, the path '{0}' does not exist".format(path))
+
+        key = keys[-1]
+        value = copy.deepcopy(op.get("value"))
+        if isinstance(parent, list):
+            index = get_index(parent, key, path) if op.get("op") != "add" or key == "-" or key.isdigit() else None
+            if op.get("op") == "add":
+                if index is None:
+                    parent.append(value)
+                else:
+                    parent.insert(index, value)
+            elif index >= len(parent):
+                raise ValueError("Unable to apply the operation, the path '{0}' does not exist".format(path))
+            elif op.get("op") == "remove":
+                parent.pop(index)
+            else:
+                parent[index] = value
+        elif op.get("op") == "remove":
+            if key not in parent:
+                raise ValueError("Unable to apply the operation, the path '{0}' does not exist".format(path))
+            parent.pop(key)
+        else:
+            parent[key] = value
+
+
+def get_patch_base(data, ops):
+    """
+    Copy the parts of a schema or template which are needed to rebase PATCH operations with rebase_patch_ops.
+
+    :param data: The schema or template the operations were created for. -> Dict
+    :param ops: The PATCH operations. -> List[Dict]
+    :return: The copy of the objects on the paths of the operations. -> Dict
+
+    Objects on the paths of the operations only contain the keys on these paths, the objects addressed by the operations are copied completely.
+    Other items of a list are reduced to the keys which identify them, so items remain addressable by index and by name.
+    """
+
+    def get_skeleton(node):
+        if isinstance(node, dict):
+            return dict((key, node.get(key)) for key in ("name", "siteId", "templateName") if key in node)
+        items = []
+        for item in node:
+            if isinstance(item, dict) and (item.get("name") is not None or item.get("siteId") is not None):
+                items.append(get_skeleton(item))
+            else:
+                # Items without a name are identified by their value
+                items.append(copy.deepcopy(item))
+                expanded[id(items[-1])] = items[-1]
+        return items
+
+    def get_index(items, key):
+        if key.isdigit():
+            return int(key) if int(key) < len(items) else None
+        for index, item in enumerate(items):
+            if isinstance(item, dict) and key in (item.get("name"), "{0}-{1}".format(item.get("siteId"), item.get("templateName"))):
+                return index
+        return None
+
+    base = {}
+    # The copied objects which contain the paths of the operations, other objects are reduced to the keys which identify them
+    expanded = {id(base): base}
+    for op in ops:
+        keys = [key.replace("~1", "/").replace("~0", "~") for key in op.get("path").strip("/").split("/")]
+        source, target = data, base
+        for position, key in enumerate(keys):
+            if isinstance(source, list):
+                key = get_index(source, key) if key != "-" else None
+            elif not isinstance(source, dict) or key not in source:
+                key = None
+            if key is None:
+                break
+            if position == len(keys) - 1 or not isinstance(source[key], (dict, list)):
+                target[key] = copy.deepcopy(source[key])
+                expanded[id(target[key])] = target[key]
+                break
+            child = target[key] if isinstance(target, list) else target.get(key)
+            if id(child) not in expanded:
+                child = target[key] = get_skeleton(source[key])
+                expanded[id(child)] = child
+            source, target = source[key], child
+    return base
+
+
+def rebase_patch_ops(previous, current, ops):
+    """
+    Rebase PATCH operations which were created for a previous version of a schema or template onto the current version.
+
+    :param previous: The version of the schema or template the operations were created for. -> Dict
+    :param current: The current version of the schema or template. -> Dict
+    :param ops: The PATCH operations. -> List[Dict]
+    :return: The rebased PATCH operations. -> List[Dict]
+    :raises ValueError: When an operation changes an object which was changed in the current version.
+
+    Items of a list which are addressed by index are matched by name, or by their value when they have no name,
+    so operations remain valid when other items are added to or removed from the list in the current version.
+    An operation conflicts when the value it replaces or removes differs between both versions,
+    or when it adds an item or a key which already exists in the current version.
+    """
+    previous = copy.deepcopy(previous)
+    current = copy.deepcopy(current)
+
+    def get_identity(item):
+        if isinstance(item, dict) and item.get("name") is not None:
+            return item.get("name")
+        if isinstance(item, dict) and item.get("siteId") is not None:
+            return "{0}-{1}".format(item.get("siteId"), item.get("templateName"))
+        return None
+
+    def find_index(items, item):
+        identity = get_identity(item)
+        for index, current_item in enumerate(items):
+            if (identity is not None and get_identity(current_item) == identity) or (identity is None and current_item == item):
+                return index
+        return None
+
+    def get_child(node, key):
+        if isinstance(node, list):
+            if key == "-":
+                return None
+            if key.isdigit():
+                return node[int(key)] if int(key) < len(node) else None
+            return next((item for item in node if get_identity(item) == key), None)
+        return node.get(key) if isinstance(node, dict) else None
+
+    rebased = []
+    for op in ops:
+        path = op.get("path")
+        keys = [key.replace("~1", "/").replace("~0", "~") for key in path.strip("/").split("/")]
+        previous_node, current_node = previous, current
+        rebased_keys = []
+        for position, key in enumerate(keys):
+            if isinstance(previous_node, list) and key.isdigit():
+                index = int(key)
+                if index < len(previous_node):
+                    current_index = find_index(current_node, previous_node[index])
+                    if current_index is None:
+                        raise ValueError("the object at '{0}' was removed or changed".format("/".join(keys[: position + 1])))
+                    key = str(current_index)
+                elif op.get("op") == "add" and position == len(keys) - 1:
+                    key = str(len(current_node))
+                else:
+                    raise ValueError("the path '{0}' does not exist".format(path))
+            rebased_keys.append(key)
+            if position < len(keys) - 1:
+                previous_node, current_node = get_child(previous_node, keys[position]), get_child(current_node, key)
+                if current_node is None:
+                    raise ValueError("the object at '{0}' was removed".format("/".join(keys[: position + 1])))
+
+        key = rebased_keys[-1]
+        if op.get("op") == "add":
+            value = op.get("value")
+            if isinstance(current_node, list) and get_identity(value) is not None and find_index(current_node, value) is not None:
+                raise ValueError("the object '{0}' was added at '{1}'".format(get_identity(value), path))
+            if isinstance(current_node, dict) and key in current_node and get_child(previous_node, keys[-1]) is None:
+                raise ValueError("the object at '{0}' was added".format(path))
+        elif get_child(previous_node, keys[-1]) != get_child(current_node, key):
+            raise ValueError("the object at '{0}' was changed".format(path))
+
+        rebased_op = dict(op, path="/" + "/".join(key.replace("~", "~0").replace("/", "~1") for key in rebased_keys))
+        apply_patch_ops(previous, [op])
+        apply_patch_ops(current, [rebased_op])
+        rebased.append(rebased_op)
+    return rebased
 
 
 def check_if_all_elements_are_none(values):
@@ -146,3 +412,88 @@ def check_if_all_elements_are_none(values):
     :return: True if all elements are None, False otherwise. -> boo
     """
     return all(value is None for value in values)
+
+
+def rewrite_references(data, ref_path=None, new_ref_path="", remove_keys=None, ref_to_dict=None):
+    """
+    Build a copy of a schema or template structure in a single traversal while rewriting its references.
+
+    :param data: The schema or template structure to copy. -> Dict | List
+    :param ref_path: The reference path prefix to rewrite, e.g. "/schemas/<id>/templates/<name>". -> Str
+    :param new_ref_path: The reference path prefix which replaces ref_path. -> Str
+    :param remove_keys: Keys which are removed at every level of the structure. -> List
+    :param ref_to_dict: Callable which converts a reference string to a reference dictionary.
+                        Applied to keys ending with "Ref" on the top level and in (nested) lists of dictionaries,
+                        which matches the behaviour of MSOModule.recursive_dict_from_ref. -> Callable
+    :return: The rewritten copy of the structure. -> Dict | List
+
+    Only string values which are equal to ref_path or start with ref_path followed by "/" are rewritten,
+    so a template named "T1" does not affect the references of a template named "T10".
+    """
+    remove_keys = set(remove_keys or [])
+    ref_prefix = "{0}/".format(ref_path) if ref_path else None
+
+    def rewrite_value(value):
+        if ref_path and isinstance(value, string_types):
+            if value == ref_path:
+                return new_ref_path
+            if value.startswith(ref_prefix):
+                return new_ref_path + value[len(ref_path) :]
+        return value
+
+    def walk(value, convert_refs):
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if key in remove_keys:
+                    continue
+                if isinstance(item, dict):
+                    result[key] = walk(item, False)
+                elif isinstance(item, list):
+                    result[key] = walk(item, convert_refs)
+                elif convert_refs and key.endswith("Ref"):
+                    result[key] = ref_to_dict(rewrite_value(item))
+                else:
+                    result[key] = rewrite_value(item)
+            return result
+        elif isinstance(value, list):
+            return [walk(item, convert_refs) for item in value]
+        return rewrite_value(value)
+
+    return walk(data, ref_to_dict is not None)
+
+
+def merge_ranges(ranges):
+    """
+    Merge the overlapping and adjacent ranges of integers, e.g. VLAN ranges.
+    :param ranges: The first and last value per range. -> List[Tuple(Int, Int)]
+    :return: The merged ranges, sorted by their first value. -> List[Tuple(Int, Int)]
+    """
+    merged = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def get_overlapping_ranges(ranges, other_ranges):
+    """
+    Find the ranges which overlap with other ranges, with one sweep over both lists of ranges sorted by their first value.
+    :param ranges: The first and last value per range, the ranges must not overlap with each other, see merge_ranges. -> List[Tuple(Int, Int)]
+    :param other_ranges: The first and last value per other range, followed by any values which identify the range, e.g. its owner. -> List[Tuple]
+    :return: The range and the other range with the highest last value which overlaps with it, per overlapping range. -> List[Tuple(Tuple, Tuple)]
+    """
+    overlaps = []
+    other_ranges = sorted(other_ranges, key=lambda other_range: other_range[0])
+    index, furthest = 0, None
+    for current in sorted(ranges):
+        # The other ranges which start before the end of the current range, only the one which ends last can overlap with it
+        while index < len(other_ranges) and other_ranges[index][0] <= current[1]:
+            if furthest is None or other_ranges[index][1] > furthest[1]:
+                furthest = other_ranges[index]
+            index += 1
+        if furthest is not None and furthest[1] >= current[0]:
+            overlaps.append((current, furthest))
+    return overlaps
@@ -41,6 +41,27 @@ options:
     - C(backup_id) is mutually exclusive with C(backup). Only use one of the two.
     type: str
     aliases: [ id ]
+  backups:
+    description:
+    - The names of the backups to query or download.
+    - Shell-style wildcards are supported, e.g. C(nightly*).
+    - The backup records are fetched once and all matching backups are downloaded concurrently to the C(destination) directory.
+    - C(backups) is mutually exclusive with C(backup) and C(backup_id).
+    type: list
+    elements: str
+  newer_than_days:
+    description:
+    - Only query or download the backups which are created in the last number of days.
+    - The creation time is the UTC timestamp of the backup record.
+      When the backup record has no timestamp, it is derived from the UTC timestamp suffix of the backup name, e.g. C(Backup_20200721220043).
+    - Backups without a creation time are not matched and reported in a warning.
+    - Can be combined with C(backups) to filter the matching backups further.
+    type: int
+  workers:
+    description:
+    - The maximum number of concurrent downloads when downloading multiple backups with C(backups) or C(newer_than_days).
+    type: int
+    default: 4
   remote_location:
     description:
     - The remote location's name where the backup should be stored
@@ -55,9 +76,22 @@ options:
     description:
     - Brief information about the backup.
     type: str
+  wait:
+    description:
+    - Wait for the backup creation to complete by polling the backup records with exponential backoff.
+    - Only used with O(state=present).
+    - The created backup record is returned in C(current), its final status in C(status) and the elapsed time and number of polls in C(timings).
+    type: bool
+    default: false
+  wait_timeout:
+    description:
+    - The maximum number of seconds to wait for the backup creation to complete when O(wait=true).
+    type: int
+    default: 600
   destination:
     description:
     - Location where to download the backup to
+    - Must be a directory when downloading multiple backups with C(backups) or C(newer_than_days).
     type: str
   state:
     description:
@@ -84,6 +118,17 @@ EXAMPLES = r"""
     location_type: local
     state: present
 
+- name: Create a new local backup and wait for the backup to complete
+  cisco.mso.mso_backup:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    backup: Backup
+    description: via Ansible
+    location_type: local
+    wait: true
+    state: present
+
 - name: Create a new remote backup
   cisco.mso.mso_backup:
     host: mso_host
@@ -114,6 +159,19 @@ EXAMPLES = r"""
     destination: ./
     state: download
 
+- name: Download all nightly backups of the last 7 days
+  cisco.mso.mso_backup:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    backups:
+    - nightly*
+    newer_than_days: 7
+    destination: ./backups
+    workers: 8
+    state: download
+  register: download_result
+
 - name: Upload a backup
   cisco.mso.mso_backup:
     host: mso_host
@@ -170,7 +228,36 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.constants import DOWNLOAD_WORKERS, WAIT_TIMEOUT
+from fnmatch import fnmatchcase
+import datetime
 import os
+import re
+
+BACKUP_TIME_REGEX = re.compile(r"^(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:\.\d+)?(?:Z|([+-])(\d{2}):?(\d{2}))?$")
+
+
+def get_backup_timestamp(backup_info):
+    """Get the creation time of a backup in UTC from its backup record, or from the timestamp suffix of its name when the record has no timestamp"""
+    metadata = (backup_info.get("backupEntry") or {}).get("metadata") or {}
+    value = backup_info.get("timestamp") or metadata.get("createdAt")
+    if value:
+        match = BACKUP_TIME_REGEX.match(str(value))
+        if match:
+            timestamp = datetime.datetime.strptime("{0} {1}".format(match.group(1), match.group(2)), "%Y-%m-%d %H:%M:%S")
+            if match.group(3):
+                offset = datetime.timedelta(hours=int(match.group(4)), minutes=int(match.group(5)))
+                timestamp = timestamp - offset if match.group(3) == "+" else timestamp + offset
+            return timestamp
+    try:
+        return datetime.datetime.strptime(backup_info.get("name").rsplit("_", 1)[1], "%Y%m%d%H%M%S")
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def backup_matches(backup_name, patterns):
+    """Check if a backup name matches any of the patterns"""
+    return not patterns or any(fnmatchcase(backup_name, pattern) or fnmatchcase(backup_name.split("_")[0], pattern) for pattern in patterns)
 
 
 def main():
@@ -180,6 +267,11 @@ def main():
         description=dict(type="str"),
         backup=dict(type="str", aliases=["name"]),
         backup_id=dict(type="str", aliases=["id"]),
+        backups=dict(type="list", elements="str"),
+        newer_than_days=dict(type="int"),
+        workers=dict(type="int", default=DOWNLOAD_WORKERS),
+        wait=dict(type="bool", default=False),
+        wait_timeout=dict(type="int", default=WAIT_TIMEOUT),
         remote_location=dict(type="str"),
         remote_path=dict(type="str"),
         state=dict(type="str", default="present", choices=["absent", "present", "query", "upload", "restore", "download", "move"]),
@@ -195,13 +287,15 @@ def main():
             ["state", "present", ["backup"]],
             ["state", "upload", ["backup", "backup_id"], True],
             ["state", "restore", ["backup", "backup_id"], True],
-            ["state", "download", ["backup", "backup_id"], True],
+            ["state", "download", ["backup", "backup_id", "backups", "newer_than_days"], True],
             ["state", "download", ["destination"]],
             ["state", "move", ["backup", "backup_id"], True],
             ["state", "move", ["remote_location", "remote_path"]],
         ],
         mutually_exclusive=[
-            ("backup", "backup_id"),
+            ("backup", "backup_id", "backups"),
+            ("backup", "newer_than_days"),
+            ("backup_id", "newer_than_days"),
         ],
     )
 
@@ -213,6 +307,11 @@ def main():
     remote_location = module.params.get("remote_location")
     remote_path = module.params.get("remote_path")
     destination = module.params.get("destination")
+    backups = module.params.get("backups")
+    newer_than_days = module.params.get("newer_than_days")
+    workers = module.params.get("workers")
+    wait = module.params.get("wait")
+    wait_timeout = module.params.get("wait_timeout")
 
     mso = MSOModule(module)
 
@@ -228,6 +327,33 @@ def main():
                 ):
                     mso.existing.append(backup_info)
                     backup_names.append(backup_info.get("name"))
+    elif backups or newer_than_days is not None:
+        mso.existing = [backup_info for backup_info in mso.existing if backup_matches(backup_info.get("name"), backups)]
+        if newer_than_days is not None:
+            newer_than = datetime.datetime.utcnow() - datetime.timedelta(days=newer_than_days)
+            timestamps = [get_backup_timestamp(backup_info) for backup_info in mso.existing]
+            unknown = [backup_info.get("name") for backup_info, timestamp in zip(mso.existing, timestamps) if timestamp is None]
+            if unknown:
+                mso.module.warn(
+                    "Unable to determine the creation time of the backups {0}, they are not matched by newer_than_days.".format(", ".join(unknown))
+                )
+            mso.existing = [backup_info for backup_info, timestamp in zip(mso.existing, timestamps) if timestamp is not None and timestamp >= newer_than]
+        backup_names = [backup_info.get("name") for backup_info in mso.existing]
+
+    if state == "download" and (backups or newer_than_days is not None):
+        if not os.path.isdir(destination):
+            mso.module.fail_json(msg="Destination '{0}' must be an existing directory when downloading multiple backups".format(destination))
+        mso.previous = mso.existing
+        if module.check_mode:
+            mso.existing = mso.proposed
+        elif mso.existing:
+            downloads = mso.request_downloads(
+                ["backups/{id}/download".format(id=backup_info.get("id")) for backup_info in mso.existing], destination, workers=workers
+            )
+            for backup_name, download in zip(backup_names, downloads):
+                download["name"] = backup_name
+            mso.existing = downloads
+        mso.exit_json()
 
     if state == "query":
         mso.exit_json()
@@ -261,6 +387,23 @@ def main():
             mso.existing = mso.proposed
         else:
             mso.existing = mso.request("backups", method="POST", data=payload)
+            if wait:
+                created_backup_id = mso.existing.get("id") if isinstance(mso.existing, dict) else None
+                previous_backup_ids = [backup_info.get("id") for backup_info in mso.previous]
+                created_backup = {}
+
+                def get_backup_statuses(response):
+                    for backup_info in (response or {}).get("backupRecords") or []:
+                        if (created_backup_id and backup_info.get("id") == created_backup_id) or (
+                            backup_info.get("id") not in previous_backup_ids and backup_info.get("name", "").split("_")[0] == backup
+                        ):
+                            created_backup.update(backup_info)
+                            return [backup_info.get("status", {}).get("statusType")]
+                    return None
+
+                mso.result["timings"] = mso.wait_for_completion("backups/backupRecords", get_backup_statuses, timeout=wait_timeout)[1]
+                mso.existing = created_backup
+                mso.result["status"] = created_backup.get("status")
         mso.exit_json()
 
     elif state == "upload":
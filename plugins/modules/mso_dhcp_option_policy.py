@@ -44,7 +44,10 @@ options:
     type: str
     choices: [ absent, present, query ]
     default: present
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.tenant
 """
 
 EXAMPLES = r"""
@@ -97,6 +100,8 @@ def main():
         dhcp_option_policy=dict(type="str", aliases=["name"]),
         description=dict(type="str"),
         tenant=dict(type="str"),
+        tenant_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         state=dict(type="str", default="present", choices=["absent", "present", "query"]),
     )
     module = AnsibleModule(
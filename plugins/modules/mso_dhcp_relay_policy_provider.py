@@ -67,7 +67,11 @@ options:
     type: str
     choices: [ absent, present, query ]
     default: present
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.tenant
 """
 
 EXAMPLES = r"""
@@ -136,7 +140,10 @@ def main():
         dhcp_relay_policy=dict(type="str", required=True, aliases=["name"]),
         ip=dict(type="str"),
         tenant=dict(type="str"),
+        tenant_id=dict(type="str"),
         schema=dict(type="str"),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str"),
         application_profile=dict(type="str", aliases=["anp"]),
         endpoint_group=dict(type="str", aliases=["epg"]),
@@ -57,7 +57,7 @@ RETURN = r"""
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_4_UNIQUE_IDENTIFIERS
-import json
+from ansible_collections.cisco.mso.plugins.module_utils.utils import rewrite_references
 
 
 def main():
@@ -86,11 +86,8 @@ def main():
     source_schema_path = "schemas/{0}".format(mso.lookup_schema(source_schema))
     source_schema_obj = mso.query_obj(source_schema_path, displayName=source_schema)
 
-    source_data = source_schema_obj.get("templates")
-    source_data = json.loads(json.dumps(source_data).replace("/{0}".format(source_schema_path), ""))
-    # certain unique identifiers are present in NDO4.0> source which need to be deleted from source_data prior to POST
-    for template in source_data:
-        mso.delete_keys_from_dict(template, NDO_4_UNIQUE_IDENTIFIERS)
+    # Strip the source schema from the references and delete the unique identifiers present in NDO4.0> source prior to POST
+    source_data = rewrite_references(source_schema_obj.get("templates"), "/{0}".format(source_schema_path), "", NDO_4_UNIQUE_IDENTIFIERS)
 
     path = "schemas"
 
@@ -50,7 +50,11 @@ seealso:
 - module: cisco.mso.mso_schema_site
 - module: cisco.mso.mso_schema_site_anp_epg
 - module: cisco.mso.mso_schema_template_anp
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -111,7 +115,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", aliases=["name"]),  # This parameter is not required for querying all objects
         state=dict(type="str", default="present", choices=["absent", "present", "query"]),
@@ -168,7 +168,11 @@ deprecated:
   removed_in: 3.0.0
   alternative: Use M(cisco.mso.mso_schema_site_anp_epg_staticport) with option `force_replace=true` instead.
   why: The module has been merged to centralise all static port functionality into M(cisco.mso.mso_schema_site_anp_epg_staticport).
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -285,7 +289,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
         epg=dict(type="str", required=True),
@@ -176,7 +176,11 @@ notes:
 seealso:
 - module: cisco.mso.mso_schema_site_anp_epg
 - module: cisco.mso.mso_schema_template_anp_epg
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -287,7 +291,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
         epg=dict(type="str", required=True),
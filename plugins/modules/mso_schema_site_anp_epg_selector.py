@@ -83,7 +83,10 @@ options:
     default: present
 seealso:
 - module: cisco.mso.mso_schema_site_anp_epg
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -171,6 +174,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         site=dict(type="str", required=True),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
@@ -85,7 +85,10 @@ options:
     default: present
 notes:
 - Due to restrictions of the MSO REST API concurrent modifications to EPG subnets can be dangerous and corrupt data.
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -159,6 +162,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         site=dict(type="str", required=True),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
@@ -59,7 +59,11 @@ seealso:
 - module: cisco.mso.mso_schema_site_bd_l3out
 - module: cisco.mso.mso_schema_site_bd_subnet
 - module: cisco.mso.mso_schema_template_bd
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -120,7 +124,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         bd=dict(type="str", aliases=["name"]),  # This parameter is not required for querying all objects
         host_route=dict(type="bool"),
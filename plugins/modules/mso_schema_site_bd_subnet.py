@@ -96,7 +96,11 @@ notes:
 seealso:
 - module: cisco.mso.mso_schema_site_bd
 - module: cisco.mso.mso_schema_template_bd
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -163,7 +167,10 @@ def main():
     argument_spec.update(mso_subnet_spec())
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         bd=dict(type="str", aliases=["name"], required=True),
         subnet=dict(type="str", aliases=["ip"]),
@@ -115,7 +115,10 @@ options:
     default: present
 seealso:
 - module: cisco.mso.mso_schema_template_contract_service_graph
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 
@@ -216,6 +219,8 @@ def main():
     argument_spec.update(
         tenant=dict(type="str"),
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         contract=dict(type="str"),
         site=dict(type="str", required=True),
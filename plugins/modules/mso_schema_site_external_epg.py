@@ -78,7 +78,11 @@ options:
     default: present
 seealso:
 - module: cisco.mso.mso_schema_template_external_epg
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -139,8 +143,11 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         template=dict(type="str", required=True),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         l3out=dict(type="str", aliases=["l3out_name"]),
         l3out_schema=dict(type="str"),
         l3out_template=dict(type="str"),
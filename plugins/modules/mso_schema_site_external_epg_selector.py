@@ -75,7 +75,11 @@ options:
     default: present
 seealso:
 - module: cisco.mso.mso_schema_template_external_epg
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -144,8 +148,11 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         template=dict(type="str", required=True),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         external_epg=dict(type="str", required=True),
         selector=dict(type="str"),
         expressions=dict(type="list", elements="dict", options=mso_expression_spec_ext_epg()),
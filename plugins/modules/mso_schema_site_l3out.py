@@ -71,7 +71,11 @@ options:
 seealso:
 - module: cisco.mso.mso_schema_site
 - module: cisco.mso.mso_schema_template_l3out
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -136,7 +140,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         vrf=dict(type="dict", options=mso_reference_spec()),
         l3out=dict(type="str", aliases=["name"]),  # This parameter is not required for querying all objects
@@ -71,7 +71,11 @@ seealso:
 - module: cisco.mso.mso_schema_site_vrf_region
 - module: cisco.mso.mso_schema_site_vrf_region_cidr_subnet
 - module: cisco.mso.mso_schema_template_vrf
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -140,7 +144,10 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         site=dict(type="str", required=True),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         vrf=dict(type="str", required=True),
         region=dict(type="str", required=True),
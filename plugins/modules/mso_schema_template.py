@@ -61,7 +61,10 @@ notes:
 seealso:
 - module: cisco.mso.mso_schema
 - module: cisco.mso.mso_schema_site
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.tenant
 """
 
 EXAMPLES = r"""
@@ -118,6 +121,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         tenant=dict(type="str"),
+        tenant_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         schema=dict(type="str", required=True),
         schema_description=dict(type="str"),
         template_description=dict(type="str"),
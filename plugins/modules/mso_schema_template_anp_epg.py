@@ -195,7 +195,10 @@ seealso:
 - module: cisco.mso.mso_schema_template_anp_epg_subnet
 - module: cisco.mso.mso_schema_template_bd
 - module: cisco.mso.mso_schema_template_contract_filter
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -286,6 +289,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
         epg=dict(type="str", aliases=["name"]),  # This parameter is not required for querying all objects
@@ -115,7 +115,10 @@ options:
 seealso:
 - module: cisco.mso.mso_schema_template_anp_epg
 - module: cisco.mso.mso_schema_template_contract_filter
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -263,6 +266,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", required=True),
         epg=dict(type="str", required=True),
@@ -301,14 +306,12 @@ def main():
     mso_schema.set_template_anp(anp)
     mso_schema.set_template_anp_epg(epg)
 
-    # Schema dict is used as a cache store for schema id lookups
-    # This is done to limit the amount of schema id lookups when schema is not specified for multiple contracts
-    schema_cache = {mso_schema.schema_name: mso_schema.id}
+    # The schema ids are looked up with the schema pool of the module, which limits the lookups to one per referenced schema
     if contract:
-        overwrite_contract_schema_and_template(mso, contract, schema, schema_cache, template)
+        overwrite_contract_schema_and_template(mso, contract, schema, template)
     elif contracts:
         for contract_dict in contracts:
-            overwrite_contract_schema_and_template(mso, contract_dict, schema, schema_cache, template)
+            overwrite_contract_schema_and_template(mso, contract_dict, schema, template)
 
     contracts_path = "/templates/{0}/anps/{1}/epgs/{2}/contractRelationships".format(template, anp, epg)
     contract_path = "{0}/-".format(contracts_path)
@@ -431,13 +434,10 @@ def get_contract_payload(contract):
     )
 
 
-def overwrite_contract_schema_and_template(mso, contract, epg_schema_name, schema_cache, epg_template_name):
+def overwrite_contract_schema_and_template(mso, contract, epg_schema_name, epg_template_name):
     if contract.get("schema") is None:
         contract["schema"] = epg_schema_name
-        contract["schema_id"] = schema_cache.get(epg_schema_name)
-    else:
-        schema_id = schema_cache.get(contract.get("schema"))
-        contract["schema_id"] = schema_id if schema_id else mso.lookup_schema(contract.get("schema"))
+    contract["schema_id"] = mso.lookup_schema(contract.get("schema"))
 
     if contract.get("template") is None:
         contract["template"] = epg_template_name
@@ -90,7 +90,10 @@ seealso:
 - module: cisco.mso.mso_schema_template_anp
 - module: cisco.mso.mso_schema_template_anp_epg
 - module: cisco.mso.mso_schema_template_contract_filter
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -205,6 +208,8 @@ def main():
 
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         anp=dict(type="str", aliases=["application_profile"], required=True),
         epg=dict(type="str", aliases=["endpoint_group"], required=True),
@@ -243,7 +248,11 @@ def main():
     mso_schema.set_template_anp_epg(epg)
 
     contract_template = (contract.get("template") if contract.get("template") else template).replace(" ", "")
-    contract_schema_id = MSOSchema(mso, contract.get("schema"), contract_template).id if contract.get("schema") is not None else None
+    contract_schema_id = None
+    if contract.get("schema") is not None:
+        contract_schema = mso.get_schema(contract.get("schema"))
+        contract_schema.set_template(contract_template)
+        contract_schema_id = contract_schema.id
 
     matching_contracts = get_intra_epg_contracts_ref(
         mso_schema.schema_objects.get("template_anp_epg", {}).details.get("intraEpgContracts", []),
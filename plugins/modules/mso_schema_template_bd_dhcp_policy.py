@@ -68,7 +68,10 @@ options:
 notes:
 - This module can only be used on versions of MSO that are 3.1.1h or greater.
 - This module can only be used on versions of NDO that are 3.7.2i or lower.
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -134,6 +137,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         bd=dict(type="str", required=True),
         dhcp_policy=dict(type="str", aliases=["name"]),
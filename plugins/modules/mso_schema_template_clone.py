@@ -102,7 +102,7 @@ RETURN = r"""
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_4_UNIQUE_IDENTIFIERS
-import json
+from ansible_collections.cisco.mso.plugins.module_utils.utils import rewrite_references
 
 
 def main():
@@ -192,18 +192,19 @@ def main():
         new_template = None
         for template in source_templates:
             if template.get("name") == source_template_name:
-                new_template = json.loads(json.dumps(template).replace(source_template_path, destination_template_path))
+                # Rewrite the references, delete the NDO4.0> unique identifiers and convert the references in a single pass
+                new_template = rewrite_references(
+                    template, source_template_path, destination_template_path, NDO_4_UNIQUE_IDENTIFIERS, ref_to_dict=mso.dict_from_ref
+                )
                 new_template["name"] = destination_template_name
                 new_template["displayName"] = destination_template_display_name
                 if destination_tenant_id is not None:
                     new_template["tenantId"] = destination_tenant_id
-                mso.delete_keys_from_dict(new_template, NDO_4_UNIQUE_IDENTIFIERS)
                 break
 
         if new_template is None:
             mso.fail_json(msg="Source template with the name '{0}' does not exist.".format(source_template_name))
 
-        new_template = mso.recursive_dict_from_ref(new_template)
         mso.previous = mso.existing
 
         ops.append(dict(op="add", path="/templates/-", value=new_template))
@@ -95,7 +95,10 @@ options:
     default: present
 seealso:
 - module: cisco.mso.mso_schema_template_contract_filter
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -149,6 +152,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         contract=dict(type="str", required=True),
         service_graph=dict(type="str"),
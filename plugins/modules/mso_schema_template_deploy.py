@@ -45,10 +45,35 @@ options:
     type: str
     choices: [ deploy, status, undeploy ]
     default: deploy
+  force_validation:
+    description:
+    - Validate the schema even when the current version of the schema was already validated.
+    - When the controller side cache is enabled with the C(MSO_CACHE) environment variable,
+      the validation result is cached per schema version and reused by later deploys of the unchanged schema.
+    - The schema is only validated prior to deploy when connected to Nexus Dashboard.
+    type: bool
+    default: false
+  wait:
+    description:
+    - Wait for the deploy or undeploy to complete by polling the template deploy status with exponential backoff.
+    - The deploy status is requested before the submit, so the final status of a previous deployment is not mistaken for the final status.
+    - A template without sites has no site statuses and does not wait.
+    - The final status is returned in C(status) and the elapsed time and number of polls in C(timings).
+    type: bool
+    default: false
+  wait_timeout:
+    description:
+    - The maximum number of seconds to wait for the deploy or undeploy to complete when O(wait=true).
+    type: int
+    default: 600
 seealso:
 - module: cisco.mso.mso_schema_site
 - module: cisco.mso.mso_schema_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -61,6 +86,16 @@ EXAMPLES = r"""
     template: Template 1
     state: deploy
 
+- name: Deploy a schema template and wait for the deployment to complete
+  cisco.mso.mso_schema_template_deploy:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    schema: Schema 1
+    template: Template 1
+    wait: true
+    state: deploy
+
 - name: Undeploy a schema template
   cisco.mso.mso_schema_template_deploy:
     host: mso_host
@@ -86,16 +121,23 @@ RETURN = r"""
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec, get_submitted_deploy_site_statuses
+from ansible_collections.cisco.mso.plugins.module_utils.constants import WAIT_TIMEOUT
 
 
 def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
         template=dict(type="str", required=True, aliases=["name"]),
         site=dict(type="str"),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         state=dict(type="str", default="deploy", choices=["deploy", "status", "undeploy"]),
+        force_validation=dict(type="bool", default=False),
+        wait=dict(type="bool", default=False),
+        wait_timeout=dict(type="int", default=WAIT_TIMEOUT),
     )
 
     module = AnsibleModule(
@@ -110,6 +152,9 @@ def main():
     template = module.params.get("template").replace(" ", "")
     site = module.params.get("site")
     state = module.params.get("state")
+    force_validation = module.params.get("force_validation")
+    wait = module.params.get("wait")
+    wait_timeout = module.params.get("wait_timeout")
 
     mso = MSOModule(module)
 
@@ -124,7 +169,7 @@ def main():
     qs = None
     if state == "deploy":
         if mso.platform == "nd":
-            mso.validate_schema(schema_id)
+            mso.validate_schema(schema_id, force=force_validation)
         path = "execute/schema/{0}/template/{1}".format(schema_id, template)
     elif state == "status":
         path = "status/schema/{0}/template/{1}".format(schema_id, template)
@@ -134,7 +179,13 @@ def main():
         qs = dict(undeploy=site_id)
 
     if not module.check_mode:
+        if wait and state != "status":
+            status_path = "status/schema/{0}/template/{1}".format(schema_id, template)
+            get_statuses = get_submitted_deploy_site_statuses(mso.query_deploy_statuses([status_path])[0])
         status = mso.request(path, method="GET", data=payload, qs=qs)
+        if wait and state != "status":
+            deploy_status, mso.result["timings"] = mso.wait_for_completion(status_path, get_statuses, timeout=wait_timeout)
+            status["status"] = deploy_status.get("status")
         mso.exit_json(**status)
     else:
         mso.exit_json()
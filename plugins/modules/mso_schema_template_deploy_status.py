@@ -22,8 +22,22 @@ options:
   schema:
     description:
     - The name of the schema.
+    - When C(schema) is not provided the deployment status of all schemas, or the schemas provided in C(schemas), is returned.
+    - The policy states of the schemas are queried concurrently and returned as a matrix of schema, template and site
+      with the status C(deployed), C(pending) or C(failed).
     type: str
     aliases: [ name ]
+  schemas:
+    description:
+    - The names of the schemas to include in the deployment status matrix.
+    - C(schemas) is mutually exclusive with C(schema).
+    type: list
+    elements: str
+  workers:
+    description:
+    - The maximum number of concurrent policy state queries for the deployment status matrix.
+    type: int
+    default: 8
   template:
     description:
     - The name of the template.
@@ -38,7 +52,10 @@ options:
     type: str
     choices: [ query ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.site
 """
 
 EXAMPLES = r"""
@@ -82,33 +99,103 @@ EXAMPLES = r"""
     schema: Schema 1
     state: query
   register: query_result
+
+- name: Query the deployment status matrix of all schemas
+  cisco.mso.mso_schema_template_deploy_status:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    state: query
+  register: query_result
+
+- name: Query the deployment status matrix of a set of schemas for a site
+  cisco.mso.mso_schema_template_deploy_status:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    schemas:
+    - Schema 1
+    - Schema 2
+    site: ansible_test
+    state: query
+  register: query_result
 """
 
 RETURN = r"""
+current:
+  description:
+  - The policy states of the schema, or the deployment status matrix when C(schema) is not provided.
+  - The matrix maps each schema name to its template names and each template name to its site names with the deployment status.
+  - The deployment status of a template on a site is derived from the C(state) of the objects, at any depth, in its policy state.
+  - The status is C(failed) when the state of any object is C(failed) or C(error).
+  - Otherwise the status is C(pending) when the state of any object is not C(deployed), so a mix of deployed and undeployed objects is C(pending).
+  - The status is C(deployed) when no object has a state other than C(deployed), including a policy state without objects.
+  - The states are compared case-insensitively.
+  returned: always
+  type: dict
+  sample: {"Schema 1": {"Template1": {"site1": "deployed", "site2": "pending"}, "Template2": {"site1": "failed"}}}
+summary:
+  description:
+  - The number of templates on a site per deployment status of the deployment status matrix.
+  returned: when C(schema) is not provided
+  type: dict
+  sample: {"deployed": 2, "pending": 1, "failed": 1}
 """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.constants import REQUEST_WORKERS
+
+DEPLOYED_POLICY_STATES = ["deployed"]
+FAILED_POLICY_STATES = ["failed", "error"]
+
+
+def get_policy_state_status(policy_state):
+    """Get the deployment status of a template on a site from the states of its (nested) objects"""
+    states = set()
+
+    def collect_states(value):
+        if isinstance(value, dict):
+            if value.get("state"):
+                states.add(str(value.get("state")).lower())
+            value = list(value.values())
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, (dict, list)):
+                    collect_states(item)
+
+    collect_states([value for value in policy_state.values() if isinstance(value, list)])
+    if states.intersection(FAILED_POLICY_STATES):
+        return "failed"
+    elif states.difference(DEPLOYED_POLICY_STATES):
+        return "pending"
+    return "deployed"
 
 
 def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", aliases=["name"]),
+        schemas=dict(type="list", elements="str"),
+        workers=dict(type="int", default=REQUEST_WORKERS),
         template=dict(type="str"),
         site=dict(type="str"),
+        site_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         state=dict(type="str", default="query", choices=["query"]),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
-        required_if=[
-            ["state", "query", ["schema"]],
+        mutually_exclusive=[
+            ("schema", "schemas"),
         ],
     )
 
     schema = module.params.get("schema")
+    schemas = module.params.get("schemas")
+    workers = module.params.get("workers")
     template = module.params.get("template")
     if template is not None:
         template = template.replace(" ", "")
@@ -117,10 +204,13 @@ def main():
 
     mso = MSOModule(module)
 
+    if schema is None:
+        query_deploy_status_matrix(mso, schemas, template, site, workers)
+
     schema_id = None
-    path = "schemas"
+    path = "schemas/list-identity"
 
-    get_schema = mso.get_obj(path, displayName=schema)
+    get_schema = mso.get_obj(path, key="schemas", displayName=schema)
     if get_schema:
         schema_id = get_schema.get("id")
         path = "schemas/{id}/policy-states".format(id=schema_id)
@@ -138,9 +228,11 @@ def main():
                 mso.fail_json(msg="Template '{0}' not found.".format(template))
 
         if site:
+            # Resolve the site once instead of for every policy state
+            site_id = mso.lookup_site(site)
             mso.existing.clear()
             for configuration_objects in get_data.get("policyStates"):
-                if configuration_objects.get("siteId") == mso.lookup_site(site):
+                if configuration_objects.get("siteId") == site_id:
                     if template:
                         if configuration_objects.get("templateName") == template:
                             mso.existing = configuration_objects
@@ -155,5 +247,36 @@ def main():
     mso.exit_json()
 
 
+def query_deploy_status_matrix(mso, schemas, template, site, workers):
+    """Query the policy states of multiple schemas concurrently and exit with a schema, template and site status matrix"""
+    schema_objs = mso.query_objs("schemas/list-identity", key="schemas")
+    if schemas:
+        missing_schemas = set(schemas).difference(schema_obj.get("displayName") for schema_obj in schema_objs)
+        if missing_schemas:
+            mso.fail_json(msg="Schema(s) '{0}' not found.".format("', '".join(sorted(missing_schemas))))
+        schema_objs = [schema_obj for schema_obj in schema_objs if schema_obj.get("displayName") in schemas]
+
+    site_names = dict((site_obj.get("id"), site_obj.get("name")) for site_obj in mso.query_objs("sites"))
+    if site and site not in site_names.values():
+        mso.fail_json(msg="Site '{0}' is not a valid site name.".format(site))
+
+    policy_states = mso.request_concurrently(
+        [dict(path="schemas/{id}/policy-states".format(id=schema_obj.get("id")), method="GET") for schema_obj in schema_objs], workers=workers
+    )
+
+    mso.existing = {}
+    summary = dict(deployed=0, pending=0, failed=0)
+    for schema_obj, schema_policy_states in zip(schema_objs, policy_states):
+        for policy_state in (schema_policy_states or {}).get("policyStates") or []:
+            site_name = site_names.get(policy_state.get("siteId"), policy_state.get("siteId"))
+            if (template and policy_state.get("templateName") != template) or (site and site_name != site):
+                continue
+            status = get_policy_state_status(policy_state)
+            mso.existing.setdefault(schema_obj.get("displayName"), {}).setdefault(policy_state.get("templateName"), {})[site_name] = status
+            summary[status] += 1
+
+    mso.exit_json(summary=summary)
+
+
 if __name__ == "__main__":
     main()
@@ -69,7 +69,10 @@ options:
 seealso:
 - module: cisco.mso.mso_schema_template_external_epg
 - module: cisco.mso.mso_schema_template_contract_filter
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -133,6 +136,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         external_epg=dict(type="str", required=True),
         contract=dict(type="dict", options=mso_contractref_spec()),
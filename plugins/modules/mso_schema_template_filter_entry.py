@@ -119,7 +119,10 @@ seealso:
 - module: cisco.mso.mso_schema_template_contract_filter
 notes:
 - Due to restrictions of the MSO REST API this module creates filters when needed, and removes them when the last entry has been removed.
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -176,6 +179,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         filter=dict(type="str", required=True),
         filter_description=dict(type="str", default=""),
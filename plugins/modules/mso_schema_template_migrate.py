@@ -65,7 +65,10 @@ options:
     - Use C(present) for adding.
     type: str
     default: present
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -173,6 +176,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         template=dict(type="str", required=True),
         bds=dict(type="list", elements="str"),
         epgs=dict(type="list", elements="dict", options=mso_object_migrate_spec()),
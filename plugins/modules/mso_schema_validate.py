@@ -36,7 +36,10 @@ options:
     choices: [ query ]
 seealso:
 - module: cisco.mso.mso_schema
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids
+- cisco.mso.object_ids.schema
 """
 
 EXAMPLES = r"""
@@ -61,6 +64,8 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         schema=dict(type="str", required=True),
+        schema_id=dict(type="str"),
+        verify_ids=dict(type="bool", default=False),
         state=dict(type="str", default="query", choices=["query"]),
     )
 
@@ -73,7 +78,7 @@ def main():
 
     mso = MSOModule(module)
 
-    mso.existing = mso.validate_schema(schema_id=mso.lookup_schema(schema))
+    mso.existing = mso.validate_schema(schema_id=mso.lookup_schema(schema), force=True)
 
     mso.exit_json()
 
@@ -95,7 +95,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -150,7 +152,6 @@ RETURN = r"""
 import copy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
-from ansible_collections.cisco.mso.plugins.module_utils.schema import MSOSchema
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
 
 
@@ -158,6 +159,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         relay_policy=dict(type="str", aliases=["name"]),
         relay_policy_uuid=dict(type="str", aliases=["uuid"]),
         description=dict(type="str"),
@@ -265,9 +267,6 @@ def main():
 
 def get_providers_payload(mso, providers):
 
-    # Cache used to reduce the number of schema queries done by MSOSchema function.
-    schema_cache = {}
-
     payload = []
     for provider in providers:
 
@@ -280,11 +279,9 @@ def get_providers_payload(mso, providers):
 
         provider_payload = {"ip": ip, "useServerVrf": provider.get("use_server_vrf")}
 
-        # Check if schema is already in cache, if not create a new MSOSchema object and add it to the cache.
-        if not schema_cache.get(schema):
-            schema_cache[schema] = MSOSchema(mso, schema)
-
-        schema_cache[schema].set_template(template)
+        # The schema pool of the module reduces the number of schema queries when providers share a schema
+        mso_schema = mso.get_schema(schema)
+        mso_schema.set_template(template)
 
         if epg and not anp:
             mso.fail_json(msg="The anp argument is required for each provider when the epg argument is provided.")
@@ -295,12 +292,12 @@ def get_providers_payload(mso, providers):
         elif external_epg and anp:
             mso.fail_json(msg="The anp and external_epg arguments are mutually exclusive for each provider.")
         elif epg:
-            schema_cache[schema].set_template_anp(anp)
-            schema_cache[schema].set_template_anp_epg(epg)
-            provider_payload["epgRef"] = schema_cache[schema].schema_objects["template_anp_epg"].details.get("uuid")
+            mso_schema.set_template_anp(anp)
+            mso_schema.set_template_anp_epg(epg)
+            provider_payload["epgRef"] = mso_schema.schema_objects["template_anp_epg"].details.get("uuid")
         else:
-            schema_cache[schema].set_template_external_epg(external_epg)
-            provider_payload["externalEpgRef"] = schema_cache[schema].schema_objects.get("template_external_epg").details.get("uuid")
+            mso_schema.set_template_external_epg(external_epg)
+            provider_payload["externalEpgRef"] = mso_schema.schema_objects.get("template_external_epg").details.get("uuid")
 
         payload.append(provider_payload)
     return payload
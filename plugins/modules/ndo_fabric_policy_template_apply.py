@@ -0,0 +1,191 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_fabric_policy_template_apply
+short_description: Apply the desired policies of a fabric policy template on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Apply the desired policies of multiple collections of a fabric policy template on Cisco Nexus Dashboard Orchestrator (NDO) in one PATCH request.
+- The template is requested once and only the differences between the desired and the existing policies are sent.
+- The policies of a collection are matched by uuid when provided and by name otherwise.
+- Only the provided attributes of a matched policy are compared and changed, the collections which are not provided are not changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a fabric policy template.
+    type: str
+    required: true
+  policies:
+    description:
+    - The desired policies per collection of the fabric policy template, in the format of the NDO API.
+    - The collections are the keys of the C(fabricPolicyTemplate.template) object of the template,
+      e.g. C(vlanPools), C(domains), C(l3Domains), C(interfacePolicyGroups), C(nodePolicyGroups), C(macsecPolicies) or C(syncEthIntfPolicies).
+    - The singleton policies, e.g. C(ptpPolicy) or C(mcpGlobalPolicy), are provided as a dictionary of the desired attributes.
+    - Every policy of a collection must have a C(name) or a C(uuid), a policy with a C(uuid) must exist.
+    - The C(pool) of C(domains) and C(l3Domains) can be provided as a dictionary with the C(name) of the VLAN Pool
+      and optionally the C(template) of the VLAN Pool, which defaults to the template of the domain.
+    - A VLAN Pool referenced by name must exist before it is referenced, the VLAN Pools in the same O(policies) are not created yet.
+    - Other references to objects must be provided as the uuid of the object.
+    - When querying, only the provided collections are returned.
+    type: dict
+  prune:
+    description:
+    - Remove the existing policies of the provided collections which are not in O(policies).
+    - The collections which are not provided are not changed.
+    type: bool
+    default: false
+  state:
+    description:
+    - Use C(present) for applying the desired policies.
+    - Use C(query) for listing the policies of the template.
+    type: str
+    choices: [ query, present ]
+    default: query
+notes:
+- Within a collection, the existing policies are updated first, then the pruned policies are removed and the new policies are added.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_vlan_pool
+- module: cisco.mso.ndo_physical_domain
+- module: cisco.mso.ndo_l3_domain
+- module: cisco.mso.ndo_fabric_resource_template_apply
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Apply VLAN Pools to a fabric policy template
+  cisco.mso.ndo_fabric_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_policy_template
+    policies:
+      vlanPools:
+      - name: ansible_test_vlan_pool_1
+        allocMode: static
+        encapBlocks:
+        - range:
+            from: 100
+            to: 200
+            allocMode: static
+      - name: ansible_test_vlan_pool_2
+        allocMode: static
+        encapBlocks:
+        - range:
+            from: 300
+            to: 400
+            allocMode: static
+    state: present
+
+- name: Apply domains which reference the VLAN Pools by name
+  cisco.mso.ndo_fabric_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_policy_template
+    policies:
+      domains:
+      - name: ansible_test_physical_domain
+        pool:
+          name: ansible_test_vlan_pool_1
+      l3Domains:
+      - name: ansible_test_l3_domain
+        pool:
+          name: ansible_test_vlan_pool_2
+          template: ansible_fabric_policy_template
+    state: present
+
+- name: Query the VLAN Pools of a fabric policy template
+  cisco.mso.ndo_fabric_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_policy_template
+    policies:
+      vlanPools: []
+    state: query
+  register: query_vlan_pools
+"""
+
+RETURN = r"""
+"""
+
+import copy
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+
+# The template type, collection and description of the objects which can be referenced by name per collection and attribute
+REFERENCES = {
+    ("domains", "pool"): ("fabric_policy", "vlanPools", "VLAN Pool"),
+    ("l3Domains", "pool"): ("fabric_policy", "vlanPools", "VLAN Pool"),
+}
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        policies=dict(type="dict"),
+        prune=dict(type="bool", default=False),
+        state=dict(type="str", default="query", choices=["query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["policies"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    policies = module.params.get("policies")
+    prune = module.params.get("prune")
+    state = module.params.get("state")
+
+    mso_template = MSOTemplate(mso, "fabric_policy", template)
+    mso_template.validate_template("fabricPolicy")
+
+    existing_policies = mso_template.template.get("fabricPolicyTemplate", {}).get("template", {})
+
+    if state == "query":
+        mso.existing = dict((collection, existing_policies.get(collection)) for collection in policies) if policies else existing_policies
+
+    elif state == "present":
+        policies = copy.deepcopy(policies)
+        mso.template_objects.resolve_references(policies, REFERENCES, mso_template)
+        ops, mso.previous, mso.proposed = mso_template.get_apply_ops("fabricPolicyTemplate", policies, prune)
+        mso.existing = mso.proposed if ops else mso.previous
+
+        if not module.check_mode and ops:
+            response = mso.request(mso_template.template_path, method="PATCH", data=ops)
+            if response:
+                mso_template.template = response
+                existing_policies = mso_template.template.get("fabricPolicyTemplate", {}).get("template", {})
+                mso.existing = dict((collection, existing_policies.get(collection)) for collection in policies)
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_fabric_resource_template_apply
+short_description: Apply the desired resources of a fabric resource template on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Apply the desired resources of multiple collections of a fabric resource template on Cisco Nexus Dashboard Orchestrator (NDO) in one PATCH request.
+- The template is requested once and only the differences between the desired and the existing resources are sent.
+- The resources of a collection are matched by uuid when provided and by name otherwise.
+- Only the provided attributes of a matched resource are compared and changed, the collections which are not provided are not changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a fabric resource template.
+    type: str
+    required: true
+  resources:
+    description:
+    - The desired resources per collection of the fabric resource template, in the format of the NDO API.
+    - The collections are the keys of the C(fabricResourceTemplate.template) object of the template, e.g. C(interfaceProfiles) or C(portChannels).
+    - Every resource of a collection must have a C(name) or a C(uuid), a resource with a C(uuid) must exist.
+    - The C(policy) of C(interfaceProfiles) and C(portChannels) can be provided as a dictionary with the C(name) and the C(template)
+      of the Interface Policy Group in a fabric policy template.
+    - The referenced fabric policy templates are queried concurrently and only once for all resources.
+    - Other references to objects must be provided as the uuid of the object.
+    - When querying, only the provided collections are returned.
+    type: dict
+  prune:
+    description:
+    - Remove the existing resources of the provided collections which are not in O(resources).
+    - The collections which are not provided are not changed.
+    type: bool
+    default: false
+  state:
+    description:
+    - Use C(present) for applying the desired resources.
+    - Use C(query) for listing the resources of the template.
+    type: str
+    choices: [ query, present ]
+    default: query
+notes:
+- Within a collection, the existing resources are updated first, then the pruned resources are removed and the new resources are added.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_physical_interface
+- module: cisco.mso.ndo_port_channel_interface
+- module: cisco.mso.ndo_fabric_policy_template_apply
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Apply physical and port channel interfaces to a fabric resource template
+  cisco.mso.ndo_fabric_resource_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_resource_template
+    resources:
+      interfaceProfiles:
+      - name: ansible_test_physical_interface
+        policyGroupType: physical
+        nodes: ["101"]
+        interfaces: 1/1-2
+        policy:
+          name: ansible_test_interface_policy_group_physical
+          template: ansible_fabric_policy_template
+      portChannels:
+      - name: ansible_test_port_channel_interface
+        node: "101"
+        memberInterfaces: 1/3-4
+        policy:
+          name: ansible_test_interface_policy_group_port_channel
+          template: ansible_fabric_policy_template
+    state: present
+
+- name: Remove every port channel interface except one from a fabric resource template
+  cisco.mso.ndo_fabric_resource_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_resource_template
+    resources:
+      portChannels:
+      - name: ansible_test_port_channel_interface
+    prune: true
+    state: present
+
+- name: Query all resources of a fabric resource template
+  cisco.mso.ndo_fabric_resource_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_fabric_resource_template
+    state: query
+  register: query_all
+"""
+
+RETURN = r"""
+"""
+
+import copy
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+
+# The template type, collection and description of the objects which can be referenced by name per collection and attribute
+REFERENCES = {
+    ("interfaceProfiles", "policy"): ("fabric_policy", "interfacePolicyGroups", "Interface Policy Group"),
+    ("portChannels", "policy"): ("fabric_policy", "interfacePolicyGroups", "Interface Policy Group"),
+}
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        resources=dict(type="dict"),
+        prune=dict(type="bool", default=False),
+        state=dict(type="str", default="query", choices=["query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["resources"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    resources = module.params.get("resources")
+    prune = module.params.get("prune")
+    state = module.params.get("state")
+
+    mso_template = MSOTemplate(mso, "fabric_resource", template)
+    mso_template.validate_template("fabricResource")
+
+    existing_resources = mso_template.template.get("fabricResourceTemplate", {}).get("template", {})
+
+    if state == "query":
+        mso.existing = dict((collection, existing_resources.get(collection)) for collection in resources) if resources else existing_resources
+
+    elif state == "present":
+        resources = copy.deepcopy(resources)
+        mso.template_objects.resolve_references(resources, REFERENCES)
+        ops, mso.previous, mso.proposed = mso_template.get_apply_ops("fabricResourceTemplate", resources, prune)
+        mso.existing = mso.proposed if ops else mso.previous
+
+        if not module.check_mode and ops:
+            response = mso.request(mso_template.template_path, method="PATCH", data=ops)
+            if response:
+                mso_template.template = response
+                existing_resources = mso_template.template.get("fabricResourceTemplate", {}).get("template", {})
+                mso.existing = dict((collection, existing_resources.get(collection)) for collection in resources)
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_facts
+short_description: Gather and index the Nexus Dashboard Orchestrator inventory
+description:
+- Gather the sites, tenants, schemas, templates, users, roles and labels of Nexus Dashboard Orchestrator (NDO) concurrently in one task.
+- Every collection is returned in C(current) as a C(by_name) name to object index and a C(by_id) id to object index.
+- The C(by_name) index of templates is grouped by template type, because template names are only unique per template type.
+- The ids can be passed to the O(schema_id), O(site_id), O(tenant_id) and O(template_id) parameters of later tasks to skip their lookups.
+- When the controller side cache is enabled with the C(MSO_CACHE) environment variable,
+  the schema ids are also stored in the identity cache of the connection, which is used by the schema modules to skip the schema lookup.
+- Collections which are not available on the NDO version are returned empty with a warning.
+  Other errors, e.g. authentication or server errors, fail the module.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  gather_subset:
+    description:
+    - The collections to gather.
+    type: list
+    elements: str
+    choices: [ all, sites, tenants, schemas, templates, users, roles, labels ]
+    default: [ all ]
+  bodies:
+    description:
+    - Also gather the full schema and/or template objects of the gathered schemas and templates.
+    - The full objects are returned in the C(bodies) id to object index of the collection.
+    type: list
+    elements: str
+    choices: [ schemas, templates ]
+    default: []
+  workers:
+    description:
+    - The maximum number of concurrent requests.
+    type: int
+    default: 8
+extends_documentation_fragment: cisco.mso.modules
+"""
+
+EXAMPLES = r"""
+- name: Gather the NDO inventory
+  cisco.mso.ndo_facts:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+  register: ndo
+
+- name: Add a VRF with the pre-resolved schema id
+  cisco.mso.mso_schema_template_vrf:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    schema: Schema 1
+    schema_id: "{{ ndo.current.schemas.by_name['Schema 1'].id }}"
+    template: Template 1
+    vrf: VRF1
+    state: present
+
+- name: Gather the schemas and templates including the full objects
+  cisco.mso.ndo_facts:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    gather_subset: [ schemas, templates ]
+    bodies: [ schemas, templates ]
+  register: ndo
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_COLLECTIONS, ND_USERS_COLLECTION, ND_USERS_PATHS, REQUEST_WORKERS
+import re
+
+# The error message of NDO for an API which is not supported by the NDO version
+UNSUPPORTED_API_REGEX = re.compile(r"not supported|unsupported|not found", re.IGNORECASE)
+
+
+def is_api_not_available(status, msg):
+    """Check if a request failed because the API is not available on the NDO version"""
+    return status == 404 or (status == 400 and UNSUPPORTED_API_REGEX.search(msg) is not None)
+
+
+def index_objects(objects, name_key, id_key, group_key=None):
+    """
+    Index a list of objects by name and by id.
+    :param objects: The objects to index. -> List[Dict]
+    :param name_key: The key of the name of an object. -> Str
+    :param id_key: The key of the id of an object. -> Str
+    :param group_key: The key to group the name index by, when names are only unique within a group. -> Str
+    :return: The name and id indexes. -> Dict
+    """
+    by_name = {}
+    for obj in objects:
+        (by_name.setdefault(obj.get(group_key), {}) if group_key else by_name)[obj.get(name_key)] = obj
+    return dict(by_name=by_name, by_id=dict((obj.get(id_key), obj) for obj in objects))
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        gather_subset=dict(type="list", elements="str", default=["all"], choices=["all"] + list(NDO_COLLECTIONS)),
+        bodies=dict(type="list", elements="str", default=[], choices=["schemas", "templates"]),
+        workers=dict(type="int", default=REQUEST_WORKERS),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    gather_subset = module.params.get("gather_subset")
+    bodies = module.params.get("bodies")
+    workers = module.params.get("workers")
+
+    mso = MSOModule(module)
+
+    subset = [name for name in NDO_COLLECTIONS if "all" in gather_subset or name in gather_subset]
+    subset.extend(name for name in bodies if name not in subset)
+
+    # Users are managed by Nexus Dashboard and are queried with the Nexus Dashboard API
+    nd_users = "users" in subset and mso.platform == "nd"
+    api_subset = [name for name in subset if not (nd_users and name == "users")]
+
+    responses = mso.request_concurrently(
+        [dict(path=NDO_COLLECTIONS[name].get("path"), method="GET") for name in api_subset], workers=workers, not_found=is_api_not_available
+    )
+
+    objects = {}
+    for name, response in zip(api_subset, responses):
+        if response is None:
+            module.warn("Unable to gather {0}, the '{1}' API is not available.".format(name, NDO_COLLECTIONS[name].get("path")))
+            response = []
+        key = NDO_COLLECTIONS[name].get("key")
+        objects[name] = (response.get(key) or []) if isinstance(response, dict) and key else response or []
+
+    if nd_users:
+        objects["users"] = [user.get("spec") for path in ND_USERS_PATHS for user in mso.nd_request(path, method="GET").get("items") or []]
+
+    facts = {}
+    for name in subset:
+        collection = NDO_COLLECTIONS[name]
+        if name == "users" and nd_users:
+            facts[name] = index_objects(objects[name], ND_USERS_COLLECTION.get("name"), ND_USERS_COLLECTION.get("id"))
+        else:
+            facts[name] = index_objects(objects[name], collection.get("name"), collection.get("id"), "templateType" if name == "templates" else None)
+
+    for name in bodies:
+        ids = list(facts[name].get("by_id"))
+        body_responses = mso.request_concurrently([dict(path="{0}/{1}".format(name, object_id), method="GET") for object_id in ids], workers=workers)
+        facts[name]["bodies"] = dict(zip(ids, body_responses))
+
+    if "schemas" in facts:
+        cache = mso.get_cache("identity")
+        for schema_name, schema in facts["schemas"].get("by_name").items():
+            cache.set("schema:{0}".format(schema_name), schema.get("id"))
+
+    mso.existing = facts
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -289,7 +289,9 @@ notes:
 seealso:
 - module: cisco.mso.ndo_template
 - module: cisco.mso.ndo_macsec_policy
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -414,69 +416,19 @@ RETURN = r"""
 
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec, ndo_interface_setting_spec, get_interface_setting_attributes
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
-from ansible_collections.cisco.mso.plugins.module_utils.constants import (
-    PORT_CHANNEL_MODE_MAP,
-    CONTROL_MAP,
-    LINK_LEVEL_FEC_MAP,
-    L2_INTERFACE_QINQ_MAP,
-    LOAD_BALANCE_HASHING_MAP,
-)
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops
 import copy
 
 
 def main():
     argument_spec = mso_argument_spec()
+    argument_spec.update(ndo_interface_setting_spec())
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
-            name=dict(type="str", aliases=["interface_policy_group", "interface_setting"]),
-            uuid=dict(type="str", aliases=["interface_policy_group_uuid", "interface_setting_uuid"]),
-            description=dict(type="str"),
-            interface_type=dict(type="str", choices=["physical", "port_channel"]),
-            speed=dict(type="str", choices=["100M", "1G", "10G", "25G", "40G", "50G", "100G", "200G", "400G", "inherit"]),
-            auto_negotiation=dict(type="str", choices=["on", "off", "on_enforce"]),
-            vlan_scope=dict(type="str", choices=["global", "port_local"]),
-            cdp_admin_state=dict(type="str", choices=["enabled", "disabled"]),
-            lldp=dict(
-                type="dict",
-                options=dict(
-                    status=dict(type="str", choices=["enabled", "disabled"]),
-                    transmit_state=dict(type="str", choices=["enabled", "disabled"]),
-                    receive_state=dict(type="str", choices=["enabled", "disabled"]),
-                ),
-            ),
-            domains=dict(type="list", elements="str"),
-            port_channel_mode=dict(type="str", choices=list(PORT_CHANNEL_MODE_MAP)),
-            min_links=dict(type="int"),
-            max_links=dict(type="int"),
-            controls=dict(type="list", elements="str", choices=list(CONTROL_MAP)),
-            load_balance_hashing=dict(type="str", choices=list(LOAD_BALANCE_HASHING_MAP)),
-            synce=dict(type="str"),
-            link_level_debounce_interval=dict(type="int"),
-            link_level_bring_up_delay=dict(type="int"),
-            link_level_fec=dict(type="str", choices=list(LINK_LEVEL_FEC_MAP)),
-            l2_interface_qinq=dict(type="str", choices=list(L2_INTERFACE_QINQ_MAP)),
-            l2_interface_reflective_relay=dict(type="str", choices=["enabled", "disabled"]),
-            stp_bpdu_filter=dict(type="str", choices=["enabled", "disabled"]),
-            stp_bpdu_guard=dict(type="str", choices=["enabled", "disabled"]),
-            llfc_transmit_state=dict(type="str", choices=["enabled", "disabled"]),
-            llfc_receive_state=dict(type="str", choices=["enabled", "disabled"]),
-            mcp=dict(
-                type="dict",
-                options=dict(
-                    admin_state=dict(type="str", choices=["enabled", "disabled"]),
-                    strict_mode=dict(type="str", choices=["on", "off"], aliases=["mcp_mode"]),
-                    initial_delay_time=dict(type="int"),
-                    transmission_frequency_sec=dict(type="int"),
-                    transmission_frequency_msec=dict(type="int"),
-                    grace_period_sec=dict(type="int"),
-                    grace_period_msec=dict(type="int"),
-                ),
-            ),
-            pfc_admin_state=dict(type="str", choices=["on", "off", "auto"]),
-            access_macsec_policy=dict(type="str"),
+            template_id=dict(type="str"),
             state=dict(type="str", choices=["absent", "query", "present"], default="query"),
         )
     )
@@ -495,39 +447,12 @@ def main():
     template = module.params.get("template")
     name = module.params.get("name")
     uuid = module.params.get("uuid")
-    description = module.params.get("description")
     interface_type = module.params.get("interface_type")
     if interface_type == "port_channel":
         interface_type = "portchannel"
-    speed = module.params.get("speed")
-    auto_negotiation = module.params.get("auto_negotiation")
-    if auto_negotiation == "on_enforce":
-        auto_negotiation = "on-enforce"
-    vlan_scope = module.params.get("vlan_scope")
-    if vlan_scope == "port_local":
-        vlan_scope = "portlocal"
-    cdp_admin_state = module.params.get("cdp_admin_state")
     lldp = module.params.get("lldp")
     domains = module.params.get("domains")
-    port_channel_mode = PORT_CHANNEL_MODE_MAP.get(module.params.get("port_channel_mode"))
-    min_links = module.params.get("min_links")
-    max_links = module.params.get("max_links")
-    controls = module.params.get("controls")
-    if controls:
-        controls = [CONTROL_MAP.get(v) for v in controls]
-    load_balance_hashing = LOAD_BALANCE_HASHING_MAP.get(module.params.get("load_balance_hashing"))
     synce = module.params.get("synce")
-    link_level_debounce_interval = module.params.get("link_level_debounce_interval")
-    link_level_bring_up_delay = module.params.get("link_level_bring_up_delay")
-    link_level_fec = LINK_LEVEL_FEC_MAP.get(module.params.get("link_level_fec"))
-    l2_interface_qinq = L2_INTERFACE_QINQ_MAP.get(module.params.get("l2_interface_qinq"))
-    l2_interface_reflective_relay = module.params.get("l2_interface_reflective_relay")
-    stp_bpdu_filter = module.params.get("stp_bpdu_filter")
-    stp_bpdu_guard = module.params.get("stp_bpdu_guard")
-    llfc_transmit_state = module.params.get("llfc_transmit_state")
-    llfc_receive_state = module.params.get("llfc_receive_state")
-    mcp = module.params.get("mcp")
-    pfc_admin_state = module.params.get("pfc_admin_state")
     access_macsec_policy = module.params.get("access_macsec_policy")
     state = module.params.get("state")
 
@@ -559,152 +484,28 @@ def main():
         if uuid and not mso.existing:
             mso.fail_json(msg="{0} with the UUID: '{1}' not found".format(object_description, uuid))
 
-        if mso.existing:
-            proposed_payload = copy.deepcopy(match.details)
+        if interface_type and mso.existing and mso.existing.get("type") != interface_type:
+            mso.fail_json(msg="Interface type cannot be changed.")
+
+        if domains:
+            domains = validate_domains(mso, domains, template, template_info)
+            if mso.existing and set(domains) == set(mso.existing.get("domains", [])):
+                domains = mso.existing.get("domains")
+
+        if synce:
+            synce = validate_sync_e(mso, synce, template, template_info)[synce]
+
+        if access_macsec_policy:
+            access_macsec_policy = validate_macsec_policy(mso, access_macsec_policy, template, template_info)[access_macsec_policy]
 
-            if name and mso.existing.get("name") != name:
-                ops.append(dict(op="replace", path=interface_path + "/name", value=name))
-                proposed_payload["name"] = name
-
-            if description is not None and mso.existing.get("description") != description:
-                ops.append(dict(op="replace", path=interface_path + "/description", value=description))
-                proposed_payload["description"] = description
-
-            if interface_type and mso.existing.get("type") != interface_type:
-                mso.fail_json(msg="Interface type cannot be changed.")
-
-            if domains == []:
-                ops.append(dict(op="remove", path=interface_path + "/domains"))
-                proposed_payload.pop("domains", None)
-            elif domains:
-                domain_uuid_list = validate_domains(mso, domains, template, template_info)
-                if set(domain_uuid_list) != set(mso.existing.get("domains", [])):
-                    ops.append(dict(op="replace", path=interface_path + "/domains", value=domain_uuid_list))
-                proposed_payload["domains"] = domain_uuid_list
-
-            if synce:
-                existing_sync_e = validate_sync_e(mso, synce, template, template_info)
-                if existing_sync_e[synce] != mso.existing.get("syncEthPolicy"):
-                    ops.append(dict(op="replace", path=interface_path + "/syncEthPolicy", value=existing_sync_e[synce]))
-                    proposed_payload["syncEthPolicy"] = existing_sync_e[synce]
-
-            if access_macsec_policy:
-                existing_access_macsec_policy = validate_macsec_policy(mso, access_macsec_policy, template, template_info)
-                if existing_access_macsec_policy[access_macsec_policy] != mso.existing.get("accessMACsecPolicy"):
-                    ops.append(dict(op="replace", path=interface_path + "/accessMACsecPolicy", value=existing_access_macsec_policy[access_macsec_policy]))
-                    proposed_payload["accessMACsecPolicy"] = existing_access_macsec_policy[access_macsec_policy]
-
-            if cdp_admin_state and mso.existing.get("cdp", {}).get("adminState") != cdp_admin_state:
-                ops.append(dict(op="replace", path=interface_path + "/cdp/adminState", value=cdp_admin_state))
-                proposed_payload["cdp"]["adminState"] = cdp_admin_state
-
-            if pfc_admin_state and mso.existing.get("pfc", {}).get("adminState") != pfc_admin_state:
-                ops.append(dict(op="replace", path=interface_path + "/pfc/adminState", value=pfc_admin_state))
-                proposed_payload["pfc"]["adminState"] = pfc_admin_state
-
-            if llfc_transmit_state and mso.existing.get("llfc", {}).get("transmitState") != llfc_transmit_state:
-                ops.append(dict(op="replace", path=interface_path + "/llfc/transmitState", value=llfc_transmit_state))
-                proposed_payload["llfc"]["transmitState"] = llfc_transmit_state
-
-            if llfc_receive_state and mso.existing.get("llfc", {}).get("receiveState") != llfc_receive_state:
-                ops.append(dict(op="replace", path=interface_path + "/llfc/receiveState", value=llfc_receive_state))
-                proposed_payload["llfc"]["receiveState"] = llfc_receive_state
-
-            if stp_bpdu_filter and mso.existing.get("stp", {}).get("bpduFilterEnabled") != stp_bpdu_filter:
-                ops.append(dict(op="replace", path=interface_path + "/stp/bpduFilterEnabled", value=stp_bpdu_filter))
-                proposed_payload["stp"]["bpduFilterEnabled"] = stp_bpdu_filter
-
-            if stp_bpdu_guard and mso.existing.get("stp", {}).get("bpduGuardEnabled") != stp_bpdu_guard:
-                ops.append(dict(op="replace", path=interface_path + "/stp/bpduGuardEnabled", value=stp_bpdu_guard))
-                proposed_payload["stp"]["bpduGuardEnabled"] = stp_bpdu_guard
-
-            if l2_interface_qinq and mso.existing.get("l2Interface", {}).get("qinq") != l2_interface_qinq:
-                ops.append(dict(op="replace", path=interface_path + "/l2Interface/qinq", value=l2_interface_qinq))
-                proposed_payload["l2Interface"]["qinq"] = l2_interface_qinq
-
-            if l2_interface_reflective_relay and mso.existing.get("l2Interface", {}).get("reflectiveRelay") != l2_interface_reflective_relay:
-                ops.append(dict(op="replace", path=interface_path + "/l2Interface/reflectiveRelay", value=l2_interface_reflective_relay))
-                proposed_payload["l2Interface"]["reflectiveRelay"] = l2_interface_reflective_relay
-
-            if vlan_scope and mso.existing.get("l2Interface", {}).get("vlanScope") != vlan_scope:
-                ops.append(dict(op="replace", path=interface_path + "/l2Interface/vlanScope", value=vlan_scope))
-                proposed_payload["l2Interface"]["vlanScope"] = vlan_scope
-
-            if lldp:
-                validate_lldp(mso, lldp)
-                if lldp["receive_state"] and mso.existing.get("lldp", {}).get("receiveState") != lldp["receive_state"]:
-                    ops.append(dict(op="replace", path=interface_path + "/lldp/receiveState", value=lldp["receive_state"]))
-                    proposed_payload["lldp"]["receiveState"] = lldp["receive_state"]
-                if lldp["transmit_state"] and mso.existing.get("lldp", {}).get("transmitState") != lldp["transmit_state"]:
-                    ops.append(dict(op="replace", path=interface_path + "/lldp/transmitState", value=lldp["transmit_state"]))
-                    proposed_payload["lldp"]["transmitState"] = lldp["transmit_state"]
-
-            if link_level_debounce_interval and mso.existing.get("linkLevel", {}).get("debounceInterval") != link_level_debounce_interval:
-                ops.append(dict(op="replace", path=interface_path + "/linkLevel/debounceInterval", value=link_level_debounce_interval))
-                proposed_payload["linkLevel"]["debounceInterval"] = link_level_debounce_interval
-
-            if link_level_bring_up_delay and mso.existing.get("linkLevel", {}).get("bringUpDelay") != link_level_bring_up_delay:
-                ops.append(dict(op="replace", path=interface_path + "/linkLevel/bringUpDelay", value=link_level_bring_up_delay))
-                proposed_payload["linkLevel"]["bringUpDelay"] = link_level_bring_up_delay
-
-            if link_level_fec and mso.existing.get("linkLevel", {}).get("fec") != link_level_fec:
-                ops.append(dict(op="replace", path=interface_path + "/linkLevel/fec", value=link_level_fec))
-                proposed_payload["linkLevel"]["fec"] = link_level_fec
-
-            if speed and mso.existing.get("linkLevel", {}).get("speed") != speed:
-                ops.append(dict(op="replace", path=interface_path + "/linkLevel/speed", value=speed))
-                proposed_payload["linkLevel"]["speed"] = speed
-
-            if auto_negotiation and mso.existing.get("linkLevel", {}).get("autoNegotiation") != auto_negotiation:
-                ops.append(dict(op="replace", path=interface_path + "/linkLevel/autoNegotiation", value=auto_negotiation))
-                proposed_payload["linkLevel"]["autoNegotiation"] = auto_negotiation
-
-            if mcp:
-                if mcp["admin_state"] and mso.existing.get("mcp", {}).get("adminState") != mcp["admin_state"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/adminState", value=mcp["admin_state"]))
-                    proposed_payload["mcp"]["adminState"] = mcp["admin_state"]
-                if mcp["strict_mode"] and mso.existing.get("mcp", {}).get("mcpMode") != mcp["strict_mode"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/mcpMode", value=mcp["strict_mode"]))
-                    proposed_payload["mcp"]["mcpMode"] = mcp["strict_mode"]
-                if mcp["initial_delay_time"] and mso.existing.get("mcp", {}).get("initialDelayTime") != mcp["initial_delay_time"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/initialDelayTime", value=mcp["initial_delay_time"]))
-                    proposed_payload["mcp"]["initialDelayTime"] = mcp["initial_delay_time"]
-                if mcp["transmission_frequency_sec"] and mso.existing.get("mcp", {}).get("txFreq") != mcp["transmission_frequency_sec"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/txFreq", value=mcp["transmission_frequency_sec"]))
-                    proposed_payload["mcp"]["txFreq"] = mcp["transmission_frequency_sec"]
-                if mcp["transmission_frequency_msec"] and mso.existing.get("mcp", {}).get("txFreqMsec") != mcp["transmission_frequency_msec"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/txFreqMsec", value=mcp["transmission_frequency_msec"]))
-                    proposed_payload["mcp"]["txFreqMsec"] = mcp["transmission_frequency_msec"]
-                if mcp["grace_period_sec"] and mso.existing.get("mcp", {}).get("gracePeriod") != mcp["grace_period_sec"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/gracePeriod", value=mcp["grace_period_sec"]))
-                    proposed_payload["mcp"]["gracePeriod"] = mcp["grace_period_sec"]
-                if mcp["grace_period_msec"] and mso.existing.get("mcp", {}).get("gracePeriodMsec") != mcp["grace_period_msec"]:
-                    ops.append(dict(op="replace", path=interface_path + "/mcp/gracePeriodMsec", value=mcp["grace_period_msec"]))
-                    proposed_payload["mcp"]["gracePeriodMsec"] = mcp["grace_period_msec"]
-
-            if port_channel_mode and mso.existing.get("portChannelPolicy", {}).get("mode") != port_channel_mode:
-                ops.append(dict(op="replace", path=interface_path + "/portChannelPolicy/mode", value=port_channel_mode))
-                proposed_payload["portChannelPolicy"]["mode"] = port_channel_mode
-
-            if min_links and mso.existing.get("portChannelPolicy", {}).get("minLinks") != min_links:
-                ops.append(dict(op="replace", path=interface_path + "/portChannelPolicy/minLinks", value=min_links))
-                proposed_payload["portChannelPolicy"]["minLinks"] = min_links
-
-            if max_links and mso.existing.get("portChannelPolicy", {}).get("maxLinks") != max_links:
-                ops.append(dict(op="replace", path=interface_path + "/portChannelPolicy/maxLinks", value=max_links))
-                proposed_payload["portChannelPolicy"]["maxLinks"] = max_links
-
-            if load_balance_hashing and mso.existing.get("portChannelPolicy", {}).get("hashFields") != load_balance_hashing:
-                ops.append(dict(op="replace", path=interface_path + "/portChannelPolicy/hashFields", value=load_balance_hashing))
-                proposed_payload["portChannelPolicy"]["hashFields"] = load_balance_hashing
-
-            if controls and mso.existing.get("portChannelPolicy", {}).get("control") != controls:
-                ops.append(dict(op="replace", path=interface_path + "/portChannelPolicy/control", value=controls))
-                proposed_payload["portChannelPolicy"]["control"] = controls
-            elif controls == []:
-                ops.append(dict(op="remove", path=interface_path + "/portChannelPolicy/control"))
-                mso.existing.pop("controls", None)
+        if lldp:
+            validate_lldp(mso, lldp)
 
+        mso_values = get_interface_setting_attributes(module.params, domains, synce, access_macsec_policy)
+
+        if mso.existing:
+            proposed_payload = copy.deepcopy(match.details)
+            ops.extend(get_attribute_ops(proposed_payload, interface_path, mso_values))
             mso.sanitize(proposed_payload, collate=True)
 
         else:
@@ -723,87 +524,7 @@ def main():
                 "mcp": {},
                 "portChannelPolicy": {},
             }
-
-            if description:
-                payload["description"] = description
-
-            if domains:
-                domain_uuid_list = validate_domains(mso, domains, template, template_info)
-                payload["domains"] = domain_uuid_list
-
-            if synce:
-                existing_sync_e = validate_sync_e(mso, synce, template, template_info)
-                payload["syncEthPolicy"] = existing_sync_e[synce]
-
-            if access_macsec_policy:
-                existing_access_macsec_policy = validate_macsec_policy(mso, access_macsec_policy, template, template_info)
-                payload["accessMACsecPolicy"] = existing_access_macsec_policy[access_macsec_policy]
-
-            if cdp_admin_state:
-                payload["cdp"] = {"adminState": cdp_admin_state}
-
-            if pfc_admin_state:
-                payload["pfc"] = {"adminState": pfc_admin_state}
-
-            if llfc_transmit_state:
-                payload["llfc"]["transmitState"] = llfc_transmit_state
-            if llfc_receive_state:
-                payload["llfc"]["receiveState"] = llfc_receive_state
-
-            if stp_bpdu_filter:
-                payload["stp"]["bpduFilterEnabled"] = stp_bpdu_filter
-            if stp_bpdu_guard:
-                payload["stp"]["bpduGuardEnabled"] = stp_bpdu_guard
-
-            if l2_interface_qinq:
-                payload["l2Interface"]["qinq"] = l2_interface_qinq
-            if l2_interface_reflective_relay:
-                payload["l2Interface"]["reflectiveRelay"] = l2_interface_reflective_relay
-            if vlan_scope:
-                payload["l2Interface"]["vlanScope"] = vlan_scope
-
-            if lldp:
-                validate_lldp(mso, lldp)
-                payload["lldp"]["receiveState"] = lldp["receive_state"]
-                payload["lldp"]["transmitState"] = lldp["transmit_state"]
-
-            if link_level_debounce_interval:
-                payload["linkLevel"]["debounceInterval"] = link_level_debounce_interval
-            if link_level_bring_up_delay:
-                payload["linkLevel"]["bringUpDelay"] = link_level_bring_up_delay
-            if link_level_fec:
-                payload["linkLevel"]["fec"] = link_level_fec
-            if speed:
-                payload["linkLevel"]["speed"] = speed
-            if auto_negotiation:
-                payload["linkLevel"]["autoNegotiation"] = auto_negotiation
-
-            if mcp:
-                if mcp["admin_state"]:
-                    payload["mcp"]["adminState"] = mcp["admin_state"]
-                if mcp["strict_mode"]:
-                    payload["mcp"]["mcpMode"] = mcp["strict_mode"]
-                if mcp["initial_delay_time"]:
-                    payload["mcp"]["initialDelayTime"] = mcp["initial_delay_time"]
-                if mcp["transmission_frequency_sec"]:
-                    payload["mcp"]["txFreq"] = mcp["transmission_frequency_sec"]
-                if mcp["transmission_frequency_msec"]:
-                    payload["mcp"]["txFreqMsec"] = mcp["transmission_frequency_msec"]
-                if mcp["grace_period_sec"]:
-                    payload["mcp"]["gracePeriod"] = mcp["grace_period_sec"]
-                if mcp["grace_period_msec"]:
-                    payload["mcp"]["gracePeriodMsec"] = mcp["grace_period_msec"]
-
-            if port_channel_mode:
-                payload["portChannelPolicy"]["mode"] = port_channel_mode
-            if min_links:
-                payload["portChannelPolicy"]["minLinks"] = min_links
-            if max_links:
-                payload["portChannelPolicy"]["maxLinks"] = max_links
-            if load_balance_hashing:
-                payload["portChannelPolicy"]["hashFields"] = load_balance_hashing
-            if controls:
-                payload["portChannelPolicy"]["control"] = controls
+            get_attribute_ops(payload, "", mso_values)
 
             mso.sanitize(payload)
             ops.append(dict(op="add", path="/fabricPolicyTemplate/template/interfacePolicyGroups/-", value=mso.sent))
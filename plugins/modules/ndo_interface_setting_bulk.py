@@ -0,0 +1,505 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_interface_setting_bulk
+short_description: Manage multiple Interface Policy Groups on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Manage multiple Interface Policy Groups of a fabric policy template on Cisco Nexus Dashboard Orchestrator (NDO) in one task.
+- The template is requested once, the domains, SyncE policies and MACsec policies are resolved once for all interface policy groups
+  and the changes of all interface policy groups are sent in one PATCH request, or in multiple PATCH requests with O(chunk_size).
+- Only the provided attributes of an existing interface policy group are compared and changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a fabric policy template.
+    type: str
+    required: true
+  interface_policy_groups:
+    description:
+    - The interface policy groups, with the same attributes as the options of M(cisco.mso.ndo_interface_setting).
+    - Every interface policy group must have a O(interface_policy_groups.name) or a O(interface_policy_groups.uuid).
+    - When querying, only the provided interface policy groups are returned.
+    type: list
+    elements: dict
+    aliases: [ interface_settings ]
+    suboptions:
+      name:
+        description:
+        - The name of the interface policy group.
+        type: str
+        aliases: [ interface_policy_group, interface_setting ]
+      uuid:
+        description:
+        - The UUID of the interface policy group.
+        - This parameter is required when the O(interface_policy_groups.name) attribute needs to be updated.
+        type: str
+        aliases: [ interface_policy_group_uuid, interface_setting_uuid ]
+      description:
+        description:
+        - The description of the interface policy group.
+        type: str
+      interface_type:
+        description:
+        - The type of the interface policy group.
+        - This parameter is required when interface policy group needs to be created or updated.
+        type: str
+        choices: [ physical, port_channel ]
+      speed:
+        description:
+        - The port speed for the port(s) associated with the interface policy group.
+        - The default value is C(inherit).
+        type: str
+        choices: [ 100M, 1G, 10G, 25G, 40G, 50G, 100G, 200G, 400G, inherit ]
+      auto_negotiation:
+        description:
+        - The auto negotiation state of the port(s) in the interface policy group.
+        - The default value is C(on).
+        type: str
+        choices: [ 'on', 'off', on_enforce ]
+      vlan_scope:
+        description:
+        - The scope of the VLAN encapsulation of the port(s) in the interface policy group.
+        - The default value is C(global).
+        type: str
+        choices: [ global, port_local ]
+      cdp_admin_state:
+        description:
+        - The CDP admin state enables Cisco Discovery Protocol (CDP) on the interface.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      domains:
+        description:
+        - The domains with which you want to associate this interface policy.
+        - The domains must be defined in the same fabric policy template.
+        - The old O(interface_policy_groups.domains) will be replaced by the new entries during an update.
+        - Providing an empty list will remove the O(interface_policy_groups.domains) from the interface policy.
+        type: list
+        elements: str
+      port_channel_mode:
+        description:
+        - The port channel mode of the interface policy group.
+        - The default value is C(static_channel_mode_on).
+        - The value is available only when the interface_type is C(port_channel).
+        type: str
+        choices: [ static_channel_mode_on, lacp_passive, lacp_active, mac_pinning, mac_pinning_physical_nic_load, use_explicit_failover_order ]
+      min_links:
+        description:
+        - The minimum number of active links in a port-channel of the interface policy group.
+        - The default value is 1.
+        - The value must be between 1 and 16.
+        - The value is available only when the interface_type is C(port_channel).
+        type: int
+      max_links:
+        description:
+        - The maximum number of links in a port-channel of the interface policy group.
+        - The default value is 16.
+        - The value must be between 1 and 64.
+        - The value is available only when the interface_type is C(port_channel).
+        type: int
+      controls:
+        description:
+        - The port-channel control flags of the interface policy group.
+        - The default value is C(fast_sel_hot_stdby), C(graceful_conv), C(susp_individual).
+        - The value is available only when the interface_type is C(port_channel).
+        - Providing an empty list will remove the O(interface_policy_groups.controls) from the interface policy.
+        - The old O(interface_policy_groups.controls) will be replaced by the new entries during an update.
+        type: list
+        elements: str
+        choices: [ fast_sel_hot_stdby, graceful_conv, susp_individual, load_defer, symmetric_hash ]
+      load_balance_hashing:
+        description:
+        - The IP header information used by the port-channel load balance hashing algorithm of the interface policy group.
+        - The value is available only when the interface_type is C(port_channel).
+        type: str
+        choices: [ destination_ip, layer_4_destination_ip, layer_4_source_ip, source_ip ]
+      synce:
+        description:
+        - The syncE policy assigned to the interface policy group.
+        - The syncE policy must be defined in the same fabric policy template.
+        type: str
+      link_level_debounce_interval:
+        description:
+        - The debounce interval of the link level in milliseconds.
+        - The default value is 100.
+        - The value must be an integer between 0 and 5000.
+        type: int
+      link_level_bring_up_delay:
+        description:
+        - The time in milliseconds that the decision feedback equalizer (DFE) tuning is delayed when a port is coming up.
+        - The default value is 0.
+        - The value must be an integer between 0 and 10000.
+        type: int
+      link_level_fec:
+        description:
+        - The type of Forwarding Error Correction (FEC) used by the port(s) in the interface policy group.
+        - The default value is C(inherit).
+        type: str
+        choices: [ inherit, cl74_fc_fec, cl91_rs_fec, cons16_rs_fec, ieee_rs_fec, kp_fec, disable_fec ]
+      l2_interface_qinq:
+        description:
+        - The QinQ state for the port(s) in the interface policy group to define how to map double-tagged VLAN traffic.
+        - The default value is C(disabled).
+        type: str
+        choices: [ core_port, double_q_tag_port, edge_port, disabled ]
+      l2_interface_reflective_relay:
+        description:
+        - Enables or disables reflective relay (802.1Qbg) to forward traffic back to the destination or target.
+        - The term Virtual Ethernet Port Aggregator (VEPA) is also used to describe 802.1Qbg functionality.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      lldp:
+        description:
+        - The Link Layer Discovery Protocol (LLDP) configuration of the interface policy group.
+        type: dict
+        suboptions:
+          status:
+            description:
+            - The state of LLDP on the interface.
+            - The default value is C(enabled).
+            type: str
+            choices: [ enabled, disabled ]
+          transmit_state:
+            description:
+            - The transmit state allows LLDP packets to be sent from the interface.
+            - The default value is C(enabled).
+            type: str
+            choices: [ enabled, disabled ]
+          receive_state:
+            description:
+            - The receive state allows LLDP packets to be received by the interface.
+            - The default value is C(enabled).
+            type: str
+            choices: [ enabled, disabled ]
+      stp_bpdu_filter:
+        description:
+        - Enabling the Bridge Protocol Data Unit (BPDU) filter prevents any BPDUs on the port(s)
+        - in the interface policy group by filtering the BPDUs.
+        - Disabling the BPDU filter allows BPDUs to be received on the port.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      stp_bpdu_guard:
+        description:
+        - Enabling the STP BPDU guard shutdown the port(s) by placing them in 'error-disable' mode when BPDUs are received.
+        - Disabling the STP BPDU guard allows BPDUs to be received on the port.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      llfc_transmit_state:
+        description:
+        - The LLFC transmit state allows Link Level Flow Control (LLFC) packets to be sent from the interface.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      llfc_receive_state:
+        description:
+        - The LLFC receive state allows LLFC packets to be received by the interface.
+        - The default value is C(disabled).
+        type: str
+        choices: [ enabled, disabled ]
+      mcp:
+        description:
+        - The MisCabling Protocol (MCP) settings.
+        type: dict
+        suboptions:
+          admin_state:
+            description:
+            - The MCP admin state enables MisCabling Protocol (MCP) on the interface.
+            - The default value is C(enabled).
+            type: str
+            choices: [ enabled, disabled ]
+          strict_mode:
+            description:
+            - The MCP strict mode.
+            - The value is available only when the MCP admin_state is C(enabled).
+            - The default value is C(off).
+            type: str
+            choices: [ 'on', 'off' ]
+            aliases: [ mcp_mode ]
+          initial_delay_time:
+            description:
+            - The MCP initial delay time in seconds.
+            - The default value is 180.
+            - The value must be between 0 and 1800.
+            - The value is available only when the MCP strict_mode is C(on).
+            type: int
+          transmission_frequency_sec:
+            description:
+            - The MCP transmission frequency in seconds.
+            - The default value is 2.
+            - The value must be between 0 and 300.
+            - The value is available only when the MCP strict_mode is C(on).
+            type: int
+          transmission_frequency_msec:
+            description:
+            - The MCP transmission frequency in milliseconds.
+            - The default value is 0.
+            - The value must be between 0 and 999.
+            - The value is available only when the MCP strict_mode is C(on).
+            type: int
+          grace_period_sec:
+            description:
+            - The MCP grace period in seconds.
+            - The default value is 3.
+            - The value must be between 0 and 300.
+            - The value is available only when the MCP strict_mode is C(on).
+            type: int
+          grace_period_msec:
+            description:
+            - The MCP grace period in milliseconds.
+            - The default value is 0.
+            - The value must be between 0 and 999.
+            - The value is available only when the MCP strict_mode is C(on).
+            type: int
+      pfc_admin_state:
+        description:
+        - The Priority Flow Control (PFC) admin state.
+        - The default value is C(auto).
+        type: str
+        choices: [ 'on', 'off', auto ]
+      access_macsec_policy:
+        description:
+        - The access MACsec policy.
+        - The value is available only when the mcp_admin_state is C(enabled).
+        - The MACsec policy must be defined in the same fabric policy template.
+        type: str
+  chunk_size:
+    description:
+    - The maximum number of operations per PATCH request.
+    - By default, all changes are sent in one PATCH request.
+    type: int
+  state:
+    description:
+    - Use C(absent) for removing the interface policy groups.
+    - Use C(query) for listing the interface policy groups.
+    - Use C(present) for creating or updating the interface policy groups.
+    type: str
+    choices: [ absent, query, present ]
+    default: query
+notes:
+- The O(template) must exist before using this module in your playbook.
+  Use M(cisco.mso.ndo_template) to create the fabric policy template.
+- The domains, SyncE policies and MACsec policies must exist before using this module in your playbook.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_interface_setting
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Create or update multiple interface policy groups
+  cisco.mso.ndo_interface_setting_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    interface_policy_groups:
+    - name: ansible_test_interface_policy_group_physical
+      description: Interface Policy Group for Ansible Test
+      interface_type: physical
+      speed: 10G
+      domains:
+      - ansible_test_physical_domain
+    - name: ansible_test_interface_policy_group_port_channel
+      interface_type: port_channel
+      port_channel_mode: lacp_active
+      min_links: 2
+      max_links: 8
+    chunk_size: 500
+    state: present
+
+- name: Query multiple interface policy groups
+  cisco.mso.ndo_interface_setting_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    interface_policy_groups:
+    - name: ansible_test_interface_policy_group_physical
+    - name: ansible_test_interface_policy_group_port_channel
+    state: query
+  register: query_interface_policy_groups
+
+- name: Query all interface policy groups
+  cisco.mso.ndo_interface_setting_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    state: query
+  register: query_all
+
+- name: Delete multiple interface policy groups
+  cisco.mso.ndo_interface_setting_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    interface_policy_groups:
+    - name: ansible_test_interface_policy_group_physical
+    - name: ansible_test_interface_policy_group_port_channel
+    state: absent
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec, ndo_interface_setting_spec, get_interface_setting_attributes
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops
+import copy
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        interface_policy_groups=dict(type="list", elements="dict", options=ndo_interface_setting_spec(), aliases=["interface_settings"]),
+        chunk_size=dict(type="int"),
+        state=dict(type="str", default="query", choices=["absent", "query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["interface_policy_groups"]],
+            ["state", "absent", ["interface_policy_groups"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    interface_policy_groups = module.params.get("interface_policy_groups") or []
+    chunk_size = module.params.get("chunk_size")
+    state = module.params.get("state")
+
+    if chunk_size is not None and chunk_size < 1:
+        mso.fail_json(msg="The chunk_size must be at least 1.")
+
+    mso_template = MSOTemplate(mso, "fabric_policy", template)
+    mso_template.validate_template("fabricPolicy")
+
+    path = "/fabricPolicyTemplate/template/interfacePolicyGroups"
+    template_info = mso_template.template.get("fabricPolicyTemplate", {}).get("template", {})
+    existing_interface_policies = template_info.get("interfacePolicyGroups") or []
+
+    matches = mso_template.get_bulk_matches("Interface Policy Group", existing_interface_policies, interface_policy_groups)
+
+    if state == "query":
+        mso.existing = [match.details for interface_policy_group, match in matches if match] if interface_policy_groups else existing_interface_policies
+        mso.exit_json()
+
+    ops = []
+    proposed_interface_policies = []
+
+    if state == "present":
+        # The referenced policies are indexed once for all interface policy groups, physical domains take precedence over L3 domains
+        references = dict(
+            domain=dict((domain.get("name"), domain.get("uuid")) for domain in template_info.get("l3Domains", []) + template_info.get("domains", [])),
+            synce=dict((synce.get("name"), synce.get("uuid")) for synce in template_info.get("syncEthIntfPolicies", [])),
+            macsec=dict((macsec_policy.get("name"), macsec_policy.get("uuid")) for macsec_policy in template_info.get("macsecPolicies", [])),
+        )
+        descriptions = dict(domain="Domain", synce="SyncE policy", macsec="Access MACsec policy")
+
+        def resolve(reference_type, reference_name):
+            if reference_name not in references[reference_type]:
+                mso.fail_json(msg="{0} '{1}' not found in the template '{2}'.".format(descriptions[reference_type], reference_name, template))
+            return references[reference_type][reference_name]
+
+        for interface_policy_group, match in matches:
+            name = interface_policy_group.get("name") or interface_policy_group.get("uuid")
+            interface_type = interface_policy_group.get("interface_type")
+            if interface_type == "port_channel":
+                interface_type = "portchannel"
+
+            if match and interface_type and match.details.get("type") != interface_type:
+                mso.fail_json(msg="Interface type of the Interface Policy Group '{0}' cannot be changed.".format(name))
+
+            lldp = interface_policy_group.get("lldp")
+            if lldp and lldp.get("status") == "disabled" and not (lldp.get("receive_state") == "disabled" and lldp.get("transmit_state") == "disabled"):
+                mso.fail_json(
+                    msg="LLDP receive_state and transmit_state of the Interface Policy Group '{0}' must be 'disabled' when LLDP status is disabled.".format(
+                        name
+                    )
+                )
+
+            domains = interface_policy_group.get("domains")
+            if domains:
+                domains = [resolve("domain", domain) for domain in domains]
+                if match and set(domains) == set(match.details.get("domains", [])):
+                    domains = match.details.get("domains")
+            synce = resolve("synce", interface_policy_group.get("synce")) if interface_policy_group.get("synce") else None
+            access_macsec_policy = (
+                resolve("macsec", interface_policy_group.get("access_macsec_policy")) if interface_policy_group.get("access_macsec_policy") else None
+            )
+
+            mso_values = get_interface_setting_attributes(interface_policy_group, domains, synce, access_macsec_policy)
+
+            if match:
+                proposed = copy.deepcopy(match.details)
+                ops.extend(get_attribute_ops(proposed, "{0}/{1}".format(path, match.index), mso_values))
+            else:
+                if not interface_type:
+                    mso.fail_json(msg="Missing required argument 'interface_type' for creating the Interface Policy Group '{0}'.".format(name))
+                proposed = {
+                    "name": name,
+                    "type": interface_type,
+                    "templateId": mso_template.template.get("templateId"),
+                    "llfc": {},
+                    "stp": {},
+                    "l2Interface": {},
+                    "lldp": {},
+                    "linkLevel": {},
+                    "mcp": {},
+                    "portChannelPolicy": {},
+                }
+                if mso_template.template.get("schemaId"):
+                    proposed["schemaId"] = mso_template.template.get("schemaId")
+                get_attribute_ops(proposed, "", mso_values)
+                ops.append(dict(op="add", path="{0}/-".format(path), value=proposed))
+            proposed_interface_policies.append(proposed)
+
+    elif state == "absent":
+        # The interface policy groups are removed in descending order of the index, so the index of the next removal does not change
+        for index in sorted((match.index for interface_policy_group, match in matches if match), reverse=True):
+            ops.append(dict(op="remove", path="{0}/{1}".format(path, index)))
+
+    mso.previous = [match.details for interface_policy_group, match in matches if match]
+    mso.existing = mso.proposed = proposed_interface_policies
+
+    if not module.check_mode and ops:
+        response = mso_template.patch(ops, chunk_size)
+        if response and state == "present":
+            interface_policies = response.get("fabricPolicyTemplate", {}).get("template", {}).get("interfacePolicyGroups") or []
+            mso.existing = [
+                match.details for proposed, match in mso_template.get_bulk_matches("Interface Policy Group", interface_policies, mso.proposed) if match
+            ]
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -120,7 +120,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -211,6 +213,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         ipsla_monitoring_policy=dict(type="str", aliases=["name"]),
         description=dict(type="str"),
         ipsla_monitoring_policy_uuid=dict(type="str", aliases=["uuid"]),
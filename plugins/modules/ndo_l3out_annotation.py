@@ -52,7 +52,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 notes:
 - The O(template) must exist before using this module in your playbook.
   Use M(cisco.mso.ndo_template) to create the L3Out template.
@@ -140,6 +142,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["l3out_template"]),
+        template_id=dict(type="str"),
         l3out=dict(type="str", required=True, aliases=["l3out_name"]),
         annotation_key=dict(type="str", aliases=["key"], no_log=False),
         annotation_value=dict(type="str", aliases=["value"]),
@@ -116,7 +116,9 @@ seealso:
 - module: cisco.mso.ndo_template
 - module: cisco.mso.ndo_l3out_template
 - module: cisco.mso.ndo_l3out_node_routing_policy
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -188,7 +190,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
 from ansible_collections.cisco.mso.plugins.module_utils.constants import TARGET_DSCP_MAP, ENABLED_OR_DISABLED_TO_BOOL_STRING_MAP
-from ansible_collections.cisco.mso.plugins.module_utils.utils import generate_api_endpoint, check_if_all_elements_are_none, append_update_ops_data
+from ansible_collections.cisco.mso.plugins.module_utils.utils import check_if_all_elements_are_none, append_update_ops_data
 
 
 def bfd_multi_hop_mso_values(bfd):
@@ -205,6 +207,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["l3out_template"]),
+        template_id=dict(type="str"),
         l3out=dict(type="str", required=True, aliases=["l3out_name"]),
         name=dict(type="str", aliases=["l3out_node_group_policy"]),
         description=dict(type="str"),
@@ -266,13 +269,12 @@ def main():
 
         l3out_node_routing_policy_object = None
         if node_routing_policy:
-            l3out_node_routing_policy_objects = mso.query_objs(
-                generate_api_endpoint(
-                    "templates/objects", **{"type": "l3OutNodePolGroup", "tenant-id": mso_template.template_summary.get("tenantId"), "include-common": "true"}
-                )
-            )
-            l3out_node_routing_policy_object = mso_template.get_object_by_key_value_pairs(
-                "L3Out Node Routing Policy", l3out_node_routing_policy_objects, [KVPair("name", node_routing_policy)], True
+            l3out_node_routing_policy_object = mso.template_objects.get_object(
+                "l3OutNodePolGroup",
+                mso_template.template_summary.get("tenantId"),
+                [KVPair("name", node_routing_policy)],
+                object_description="L3Out Node Routing Policy",
+                fail_module=True,
             )
 
         if mso.existing:
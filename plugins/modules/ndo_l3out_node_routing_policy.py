@@ -131,7 +131,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -246,6 +248,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         name=dict(type="str", aliases=["l3out_node_routing_policy_name"]),
         uuid=dict(type="str", aliases=["l3out_node_routing_policy_uuid"]),
         description=dict(type="str"),
@@ -241,7 +241,9 @@ seealso:
 - module: cisco.mso.mso_schema_template_vrf
 - module: cisco.mso.ndo_template
 - module: cisco.mso.ndo_l3_domain
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -403,7 +405,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
 from ansible_collections.cisco.mso.plugins.module_utils.constants import TARGET_DSCP_MAP, ORIGINATE_DEFAULT_ROUTE, L3OUT_ROUTING_PROTOCOLS
-from ansible_collections.cisco.mso.plugins.module_utils.utils import generate_api_endpoint
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops, REMOVE_ATTRIBUTE
 
 
 def get_routing_protocol(existing_protocol, ospf_state, bgp_state):
@@ -422,6 +424,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["l3out_template"]),
+        template_id=dict(type="str"),
         name=dict(type="str"),
         uuid=dict(type="str"),
         description=dict(type="str"),
@@ -522,14 +525,13 @@ def main():
         if uuid and not mso.existing:
             mso.fail_json(msg="L3Out with the uuid: '{0}' not found".format(uuid))
 
-        templates_objects_path = "templates/objects"
-        route_map_params = {"type": "routeMap", "tenant-id": tenant_id}
-        route_map_path = generate_api_endpoint(templates_objects_path, **route_map_params)
-        route_map_objects = mso.query_objs(route_map_path)
+        # The route maps and VRFs of the tenant are queried concurrently
+        mso.template_objects.prefetch([("routeMap", tenant_id), ("vrf", tenant_id)] if vrf_dict else [("routeMap", tenant_id)])
+        route_map_objects = mso.template_objects.get_objects("routeMap", tenant_id)
 
         vrf_ref = None
         if vrf_dict:
-            vrf_object = l3out_template_object.get_vrf_object(vrf_dict, tenant_id, templates_objects_path)
+            vrf_object = l3out_template_object.get_vrf_object(vrf_dict, tenant_id)
             if pim and vrf_object.details.get("l3MCast") is False:
                 mso.fail_json(
                     msg="Invalid configuration in L3Out {0}, 'PIM' cannot be enabled while using the VRF '{1}' with L3 Multicast disabled".format(
@@ -688,33 +690,16 @@ def main():
             proposed_payload = copy.deepcopy(match.details)
             l3out_attrs_path = "/l3outTemplate/l3outs/{0}".format(match.index)
 
-            if name is not [None, ""] and mso.existing.get("name") != name:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/name", value=name))
-                proposed_payload["name"] = name
-
-            if mso.existing.get("routingProtocol") != routing_protocols:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/routingProtocol", value=routing_protocols))
-                proposed_payload["routingProtocol"] = routing_protocols
-
-            if vrf_ref is not None and mso.existing.get("vrfRef") != vrf_ref:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/vrfRef", value=vrf_ref))
-                proposed_payload["vrfRef"] = vrf_ref
-
-            if description is not None and mso.existing.get("description") != description:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/description", value=description))
-                proposed_payload["description"] = description
-
-            if l3_domain is not None and mso.existing.get("l3domain") != l3_domain:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/l3domain", value=l3_domain))
-                proposed_payload["l3domain"] = l3_domain
-
-            if target_dscp is not None and mso.existing.get("targetDscp") != target_dscp:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/targetDscp", value=target_dscp))
-                proposed_payload["targetDscp"] = target_dscp
-
-            if pim is not None and mso.existing.get("pim") != pim:
-                ops.append(dict(op="replace", path=l3out_attrs_path + "/pim", value=pim))
-                proposed_payload["pim"] = pim
+            mso_values = {
+                "name": name,
+                "routingProtocol": routing_protocols,
+                "vrfRef": vrf_ref,
+                "description": description,
+                "l3domain": l3_domain,
+                "targetDscp": target_dscp,
+                "pim": pim,
+            }
+            ops.extend(get_attribute_ops(proposed_payload, l3out_attrs_path, mso_values))
 
             if (
                 interleak is not None
@@ -867,66 +852,35 @@ def main():
                 originate_default_route = ORIGINATE_DEFAULT_ROUTE.get(ospf.get("originate_default_route"))
                 originate_default_route_always = ospf.get("originate_default_route_always")
 
+                redistribute = ospf.get("send_redistributed_lsas")
+                originate = ospf.get("originate_summary_lsa")
+                suppress_fa = ospf.get("suppress_forwarding_addr_translated_lsa")
+
+                mso_values = {}
                 if originate_default_route is not None and originate_default_route == "" and mso.existing.get("defaultRouteLeak"):
-                    ops.append(dict(op="remove", path=l3out_attrs_path + "/defaultRouteLeak"))
-                    proposed_payload.pop("defaultRouteLeak", None)
+                    mso_values["defaultRouteLeak"] = REMOVE_ATTRIBUTE
 
                 elif (originate_default_route is not None and originate_default_route != "") or (originate_default_route_always is not None):
                     if not mso.existing.get("defaultRouteLeak"):
-                        ops.append(dict(op="replace", path=l3out_attrs_path + "/defaultRouteLeak", value=dict()))
-                        proposed_payload["defaultRouteLeak"] = dict()
-
-                    if originate_default_route != mso.existing.get("defaultRouteLeak", {}).get("originateDefaultRoute"):
-                        ops.append(
-                            dict(
-                                op="replace",
-                                path=l3out_attrs_path + "/defaultRouteLeak/originateDefaultRoute",
-                                value=originate_default_route,
-                            )
-                        )
-                        proposed_payload["defaultRouteLeak"]["originateDefaultRoute"] = originate_default_route
-
-                    if originate_default_route_always is not None and originate_default_route_always != mso.existing.get("defaultRouteLeak", {}).get("always"):
-                        ops.append(dict(op="replace", path=l3out_attrs_path + "/defaultRouteLeak/always", value=originate_default_route_always))
-                        proposed_payload["defaultRouteLeak"]["always"] = originate_default_route_always
+                        mso_values["defaultRouteLeak"] = dict()
+                    mso_values[("defaultRouteLeak", "originateDefaultRoute")] = originate_default_route
+                    mso_values[("defaultRouteLeak", "always")] = originate_default_route_always
 
                 if not mso.existing.get("ospfAreaConfig"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig", value=dict()))
-                    proposed_payload["ospfAreaConfig"] = dict()
-
-                if ospf.get("cost") is not None and ospf.get("cost") != mso.existing.get("ospfAreaConfig", {}).get("cost"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/cost", value=ospf.get("cost")))
-                    proposed_payload["ospfAreaConfig"]["cost"] = ospf.get("cost")
-
-                if ospf.get("area_id") is not None and ospf.get("area_id") != mso.existing.get("ospfAreaConfig", {}).get("id"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/id", value=ospf.get("area_id")))
-                    proposed_payload["ospfAreaConfig"]["id"] = ospf.get("area_id")
-
-                if ospf.get("area_type") is not None and ospf.get("area_type") != mso.existing.get("ospfAreaConfig", {}).get("areaType"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/areaType", value=ospf.get("area_type")))
-                    proposed_payload["ospfAreaConfig"]["areaType"] = ospf.get("area_type")
-
-                redistribute = ospf.get("send_redistributed_lsas")
-                originate = ospf.get("originate_summary_lsa")
-                suppress_fa = ospf.get("suppress_forwarding_addr_translated_lsa")
+                    mso_values["ospfAreaConfig"] = dict()
+                mso_values[("ospfAreaConfig", "cost")] = ospf.get("cost")
+                mso_values[("ospfAreaConfig", "id")] = ospf.get("area_id")
+                mso_values[("ospfAreaConfig", "areaType")] = ospf.get("area_type")
 
                 if (redistribute is not None or originate is not None or suppress_fa is not None) and not mso.existing.get("ospfAreaConfig", {}).get(
                     "control"
                 ):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/control", value=dict()))
-                    proposed_payload["ospfAreaConfig"]["control"] = dict()
-
-                if redistribute is not None and redistribute != mso.existing.get("ospfAreaConfig", {}).get("control", {}).get("redistribute"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/control/redistribute", value=redistribute))
-                    proposed_payload["ospfAreaConfig"]["control"]["redistribute"] = redistribute
-
-                if originate is not None and originate != mso.existing.get("ospfAreaConfig", {}).get("control", {}).get("originate"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/control/originate", value=originate))
-                    proposed_payload["ospfAreaConfig"]["control"]["originate"] = originate
+                    mso_values[("ospfAreaConfig", "control")] = dict()
+                mso_values[("ospfAreaConfig", "control", "redistribute")] = redistribute
+                mso_values[("ospfAreaConfig", "control", "originate")] = originate
+                mso_values[("ospfAreaConfig", "control", "suppressFA")] = suppress_fa
 
-                if suppress_fa is not None and suppress_fa != mso.existing.get("ospfAreaConfig", {}).get("control", {}).get("suppressFA"):
-                    ops.append(dict(op="replace", path=l3out_attrs_path + "/ospfAreaConfig/control/suppressFA", value=suppress_fa))
-                    proposed_payload["ospfAreaConfig"]["control"]["suppressFA"] = suppress_fa
+                ops.extend(get_attribute_ops(proposed_payload, l3out_attrs_path, mso_values))
 
             elif ospf_state == "disabled":
                 ops.append(dict(op="remove", path=l3out_attrs_path + "/ospfAreaConfig"))
@@ -136,7 +136,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -221,6 +223,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
 from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_CIPHER_SUITE_MAP, NDO_SECURITY_POLICY_MAP
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops, REMOVE_ATTRIBUTE
 import copy
 
 
@@ -229,6 +232,7 @@ def main():
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
+            template_id=dict(type="str"),
             macsec_policy=dict(type="str", aliases=["name"]),
             macsec_policy_uuid=dict(type="str", aliases=["uuid"]),
             description=dict(type="str"),
@@ -306,47 +310,22 @@ def main():
 
         if match:
 
-            if macsec_policy and match.details.get("name") != macsec_policy:
-                ops.append(dict(op="replace", path="{0}/{1}/name".format(path, match.index), value=macsec_policy))
-                match.details["name"] = macsec_policy
-
-            if description is not None and match.details.get("description") != description:
-                ops.append(dict(op="replace", path="{0}/{1}/description".format(path, match.index), value=description))
-                match.details["description"] = description
-
-            if admin_state and match.details.get("adminState") != admin_state:
-                ops.append(dict(op="replace", path="{0}/{1}/adminState".format(path, match.index), value=admin_state))
-                match.details["adminState"] = admin_state
-
             if interface_type and match.details.get("type") != interface_type:
                 mso.fail_json(msg="Type cannot be changed for an existing MACsec Policy.")
 
-            if cipher_suite and match.details.get("macsecParams")["cipherSuite"] != cipher_suite:
-                ops.append(dict(op="replace", path="{0}/{1}/macsecParams/cipherSuite".format(path, match.index), value=cipher_suite))
-                match.details["macsecParams"]["cipherSuite"] = cipher_suite
-
-            if window_size and match.details.get("macsecParams")["windowSize"] != window_size:
-                ops.append(dict(op="replace", path="{0}/{1}/macsecParams/windowSize".format(path, match.index), value=window_size))
-                match.details["macsecParams"]["windowSize"] = window_size
-
-            if security_policy and match.details.get("macsecParams")["securityPol"] != security_policy:
-                ops.append(dict(op="replace", path="{0}/{1}/macsecParams/securityPol".format(path, match.index), value=security_policy))
-                match.details["macsecParams"]["securityPol"] = security_policy
-
-            if sak_expiry_time and match.details.get("macsecParams")["sakExpiryTime"] != sak_expiry_time:
-                ops.append(dict(op="replace", path="{0}/{1}/macsecParams/sakExpiryTime".format(path, match.index), value=sak_expiry_time))
-                match.details["macsecParams"]["sakExpiryTime"] = sak_expiry_time
+            mso_values = {
+                "name": macsec_policy,
+                "description": description,
+                "adminState": admin_state,
+                ("macsecParams", "cipherSuite"): cipher_suite,
+                ("macsecParams", "windowSize"): window_size,
+                ("macsecParams", "securityPol"): security_policy,
+                ("macsecParams", "sakExpiryTime"): sak_expiry_time,
+            }
 
             if interface_type == "access":
-                if confidentiality_offset and match.details.get("macsecParams")["confOffSet"] != confidentiality_offset:
-                    ops.append(
-                        dict(op="replace", path="{0}/{1}/macsecParams/confOffSet".format(path, match.index), value="offset{0}".format(confidentiality_offset))
-                    )
-                    match.details["macsecParams"]["confOffSet"] = "offset{0}".format(confidentiality_offset)
-
-                if key_server_priority and match.details.get("macsecParams")["keyServerPrio"] != key_server_priority:
-                    ops.append(dict(op="replace", path="{0}/{1}/macsecParams/keyServerPrio".format(path, match.index), value=key_server_priority))
-                    match.details["macsecParams"]["keyServerPrio"] = key_server_priority
+                mso_values[("macsecParams", "confOffSet")] = "offset{0}".format(confidentiality_offset) if confidentiality_offset else None
+                mso_values[("macsecParams", "keyServerPrio")] = key_server_priority
 
             if macsec_keys:
                 # updating macsec_keys modifies the existing list with the new list
@@ -360,14 +339,12 @@ def main():
                             end=mso.verify_time_format(macsec_key.get("end_time")) if macsec_key.get("end_time") else None,
                         )
                     )
-
-                if macsec_keys_list != match.details.get("macsecKeys", []):
-                    ops.append(dict(op="replace", path="{0}/{1}/macsecKeys".format(path, match.index), value=macsec_keys_list))
-                match.details["macsecKeys"] = macsec_keys
+                mso_values["macsecKeys"] = macsec_keys_list
             elif macsec_keys == []:
                 # remove macsec_keys if the list is empty
-                ops.append(dict(op="remove", path="{0}/{1}/macsecKeys".format(path, match.index)))
-                match.details.pop("macsecKeys", None)
+                mso_values["macsecKeys"] = REMOVE_ATTRIBUTE
+
+            ops.extend(get_attribute_ops(match.details, "{0}/{1}".format(path, match.index), mso_values))
 
             mso.sanitize(match.details)
 
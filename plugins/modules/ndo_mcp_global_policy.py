@@ -112,7 +112,9 @@ notes:
   object in the Fabric Policy template.
 seealso:
 - module: cisco.mso.ndo_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -218,6 +220,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["fabric_template"]),
+        template_id=dict(type="str"),
         name=dict(type="str", aliases=["mcp_global_policy"]),
         uuid=dict(type="str", aliases=["mcp_global_policy_uuid"]),
         description=dict(type="str"),
@@ -101,7 +101,9 @@ notes:
   Use M(cisco.mso.ndo_template) to create the Fabric Policy template.
 seealso:
 - module: cisco.mso.ndo_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -204,6 +206,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["fabric_template"]),
+        template_id=dict(type="str"),
         name=dict(type="str", aliases=["node_setting"]),
         uuid=dict(type="str", aliases=["node_setting_uuid"]),
         description=dict(type="str"),
@@ -56,7 +56,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -123,6 +125,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         physical_domain=dict(type="str", aliases=["name"]),
         physical_domain_uuid=dict(type="str", aliases=["uuid"]),
         description=dict(type="str"),
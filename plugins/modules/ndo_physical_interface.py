@@ -122,7 +122,9 @@ notes:
   Use M(cisco.mso.ndo_interface_setting) to create the Interface Setting Policy UUID.
 seealso:
 - module: cisco.mso.ndo_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -215,6 +217,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import (
     MSOModule,
     mso_argument_spec,
+    ndo_physical_interface_spec,
     format_interface_descriptions,
 )
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
@@ -224,33 +227,11 @@ import copy
 
 def main():
     argument_spec = mso_argument_spec()
+    argument_spec.update(ndo_physical_interface_spec())
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
-            name=dict(type="str", aliases=["physical_interface"]),
-            uuid=dict(type="str", aliases=["physical_interface_uuid"]),
-            description=dict(type="str"),
-            nodes=dict(type="list", elements="int"),
-            interfaces=dict(type="list", elements="str"),
-            physical_interface_type=dict(type="str", choices=["physical", "breakout"]),
-            physical_policy_uuid=dict(type="str", aliases=["policy_uuid", "interface_policy_uuid", "interface_policy_group_uuid", "interface_setting_uuid"]),
-            physical_policy=dict(
-                type="dict",
-                options=dict(
-                    name=dict(type="str"),
-                    template=dict(type="str"),
-                ),
-                aliases=["policy", "interface_policy", "interface_policy_group", "interface_setting"],
-            ),
-            breakout_mode=dict(type="str", choices=["4x10G", "4x25G", "4x100G"]),
-            interface_descriptions=dict(
-                type="list",
-                elements="dict",
-                options=dict(
-                    interface_id=dict(type="str"),
-                    description=dict(type="str"),
-                ),
-            ),
+            template_id=dict(type="str"),
             state=dict(type="str", default="query", choices=["absent", "query", "present"]),
         )
     )
@@ -311,7 +292,7 @@ def main():
             mso.fail_json(msg="{0} with the UUID: '{1}' not found".format(object_description, uuid))
 
         if physical_policy and not physical_policy_uuid:
-            fabric_policy_template = MSOTemplate(mso, "fabric_policy", physical_policy.get("template"))
+            fabric_policy_template = mso.template_objects.get_template("fabric_policy", physical_policy.get("template"))
             fabric_policy_template.validate_template("fabricPolicy")
             physical_policy_uuid = fabric_policy_template.get_interface_policy_group_uuid(physical_policy.get("name"))
 
@@ -0,0 +1,343 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_physical_interface_bulk
+short_description: Manage multiple Physical Interfaces on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Manage multiple Physical Interfaces of a fabric resource template on Cisco Nexus Dashboard Orchestrator (NDO) in one task.
+- The template is requested once, the Interface Setting Policies are resolved with one request per fabric policy template
+  and the changes of all Physical Interfaces are sent in one PATCH request, or in multiple PATCH requests with O(chunk_size).
+- Ranges of interface descriptions are only expanded into the descriptions of every interface ID when the payload is built.
+- Only the provided attributes of an existing Physical Interface are compared and changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a fabric resource template.
+    type: str
+    required: true
+  physical_interfaces:
+    description:
+    - The Physical Interfaces, with the same attributes as the options of M(cisco.mso.ndo_physical_interface).
+    - Every Physical Interface must have a O(physical_interfaces.name) or a O(physical_interfaces.uuid).
+    - When querying, only the provided Physical Interfaces are returned.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The name of the Physical Interface.
+        type: str
+        aliases: [ physical_interface ]
+      uuid:
+        description:
+        - The UUID of the Physical Interface.
+        - This parameter is required when the O(physical_interfaces.name) needs to be updated.
+        type: str
+        aliases: [ physical_interface_uuid ]
+      description:
+        description:
+        - The description of the Physical Interface.
+        type: str
+      nodes:
+        description:
+        - The node IDs where the Physical Interface policy will be deployed.
+        type: list
+        elements: int
+      interfaces:
+        description:
+        - The interface names where the policy will be deployed.
+        - The old O(physical_interfaces.interfaces) will be replaced with the new O(physical_interfaces.interfaces) during an update.
+        type: list
+        elements: str
+      physical_interface_type:
+        description:
+        - The type of the interface policy group.
+        type: str
+        choices: [ physical, breakout ]
+      physical_policy_uuid:
+        description:
+        - The UUID of the Interface Setting Policy.
+        - This is only required when creating a new Interface Setting Policy.
+        - This parameter is required when O(physical_interfaces.physical_interface_type) is C(physical).
+        - This parameter can be used instead of O(physical_interfaces.physical_policy).
+        type: str
+        aliases: [ policy_uuid, interface_policy_uuid , interface_policy_group_uuid, interface_setting_uuid]
+      physical_policy:
+        description:
+        - The interface group policy required for physical Interface Setting Policy.
+        - This parameter is required when O(physical_interfaces.physical_interface_type) is C(physical).
+        - This parameter can be used instead of O(physical_interfaces.physical_policy_uuid).
+        type: dict
+        suboptions:
+          name:
+            description:
+            - The name of the Interface Setting Policy.
+            type: str
+          template:
+            description:
+            - The name of the template in which is referred the Interface Setting Policy.
+            type: str
+        aliases: [ policy, interface_policy, interface_policy_group, interface_setting ]
+      breakout_mode:
+        description:
+        - Breakout mode enables breaking down an ethernet port into multiple low-speed ports.
+        - This parameter is available only when O(physical_interfaces.physical_interface_type) is C(breakout).
+        - The default value is C(4x10G).
+        type: str
+        choices: [ 4x10G, 4x25G, 4x100G ]
+      interface_descriptions:
+        description:
+        - The interface settings defined in the interface settings policy will be applied to the interfaces on the node IDs configured in C(nodes).
+        - This parameter when set to an empty list during an update will clear all the existing interface descriptions.
+        - The API will trigger an error when there are duplicate interface IDs in the list.
+        type: list
+        elements: dict
+        suboptions:
+          interface_id:
+            description:
+            - The interface ID.
+            type: str
+          description:
+            description:
+            - The description of the interface.
+            type: str
+  chunk_size:
+    description:
+    - The maximum number of operations per PATCH request.
+    - By default, all changes are sent in one PATCH request.
+    type: int
+  state:
+    description:
+    - Use C(absent) for removing the Physical Interfaces.
+    - Use C(query) for listing the Physical Interfaces.
+    - Use C(present) for creating or updating the Physical Interfaces.
+    type: str
+    choices: [ absent, query, present ]
+    default: query
+notes:
+- The O(template) must exist before using this module in your playbook.
+  Use M(cisco.mso.ndo_template) to create the fabric resource template.
+- The O(physical_interfaces.physical_policy) must exist before using this module in your playbook.
+  Use M(cisco.mso.ndo_interface_setting) to create the Interface Setting Policy.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_physical_interface
+- module: cisco.mso.ndo_interface_setting
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Create or update multiple Physical Interfaces
+  cisco.mso.ndo_physical_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    physical_interfaces:
+    - name: ansible_test_physical_interface_physical
+      description: Physical Interface for Ansible Test
+      nodes: [101, 102]
+      interfaces:
+      - 1/1-48
+      physical_interface_type: physical
+      physical_policy:
+        name: ansible_test_interface_setting_policy
+        template: ansible_fabric_policy_template
+      interface_descriptions:
+      - interface_id: 1/1-48
+        description: Server ports
+    - name: ansible_test_physical_interface_breakout
+      nodes: [101]
+      interfaces:
+      - 1/49
+      physical_interface_type: breakout
+      breakout_mode: 4x25G
+    state: present
+
+- name: Query multiple Physical Interfaces
+  cisco.mso.ndo_physical_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    physical_interfaces:
+    - name: ansible_test_physical_interface_physical
+    - name: ansible_test_physical_interface_breakout
+    state: query
+  register: query_physical_interfaces
+
+- name: Query all Physical Interfaces
+  cisco.mso.ndo_physical_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    state: query
+  register: query_all
+
+- name: Delete multiple Physical Interfaces
+  cisco.mso.ndo_physical_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    physical_interfaces:
+    - name: ansible_test_physical_interface_physical
+    - name: ansible_test_physical_interface_breakout
+    state: absent
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import (
+    MSOModule,
+    mso_argument_spec,
+    ndo_physical_interface_spec,
+    get_interface_description_ranges,
+    expand_interface_description_ranges,
+)
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops, REMOVE_ATTRIBUTE
+import copy
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        physical_interfaces=dict(
+            type="list",
+            elements="dict",
+            options=ndo_physical_interface_spec(),
+            mutually_exclusive=[("physical_policy", "breakout_mode"), ("physical_policy", "physical_policy_uuid")],
+        ),
+        chunk_size=dict(type="int"),
+        state=dict(type="str", default="query", choices=["absent", "query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["physical_interfaces"]],
+            ["state", "absent", ["physical_interfaces"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    physical_interfaces = module.params.get("physical_interfaces") or []
+    chunk_size = module.params.get("chunk_size")
+    state = module.params.get("state")
+
+    if chunk_size is not None and chunk_size < 1:
+        mso.fail_json(msg="The chunk_size must be at least 1.")
+
+    mso_template = MSOTemplate(mso, "fabric_resource", template)
+    mso_template.validate_template("fabricResource")
+    object_description = "Physical Interface Profile"
+
+    path = "/fabricResourceTemplate/template/interfaceProfiles"
+    existing_physical_interfaces = mso_template.template.get("fabricResourceTemplate", {}).get("template", {}).get("interfaceProfiles") or []
+
+    matches = mso_template.get_bulk_matches(object_description, existing_physical_interfaces, physical_interfaces)
+
+    if state == "query":
+        mso.existing = [match.details for physical_interface, match in matches if match] if physical_interfaces else existing_physical_interfaces
+        mso.exit_json()
+
+    ops = []
+    proposed_physical_interfaces = []
+
+    if state == "present":
+        # The Interface Setting Policies of all Physical Interfaces are resolved with one request per fabric policy template
+        policies = [
+            dict(policy=physical_interface.get("physical_policy")) if physical_interface.get("physical_policy") else {}
+            for physical_interface in physical_interfaces
+        ]
+        mso.template_objects.resolve_references(
+            dict(interfaceProfiles=policies),
+            {("interfaceProfiles", "policy"): ("fabric_policy", "interfacePolicyGroups", "Interface Policy Groups")},
+        )
+
+        for (physical_interface, match), policy in zip(matches, policies):
+            name = physical_interface.get("name") or physical_interface.get("uuid")
+            nodes = physical_interface.get("nodes")
+            interfaces = physical_interface.get("interfaces")
+            physical_interface_type = physical_interface.get("physical_interface_type")
+            interface_descriptions = physical_interface.get("interface_descriptions")
+
+            if match and physical_interface_type and match.details.get("policyGroupType") != physical_interface_type:
+                mso.fail_json(msg="Physical Interface type of the {0} '{1}' cannot be changed.".format(object_description, name))
+
+            policy_group_type = physical_interface_type or (match.details.get("policyGroupType") if match else None)
+
+            mso_values = {
+                "name": physical_interface.get("name"),
+                "description": physical_interface.get("description"),
+                "nodes": [str(node) for node in nodes] if nodes is not None else None,
+                "interfaces": ",".join(interfaces) if interfaces is not None else None,
+                "policyGroupType": physical_interface_type,
+                "policy": (policy.get("policy") or physical_interface.get("physical_policy_uuid")) if policy_group_type == "physical" else None,
+                "breakoutMode": physical_interface.get("breakout_mode") if policy_group_type == "breakout" else None,
+            }
+
+            # The ranges of interface IDs are kept compact until the payload of the Physical Interface is built
+            if interface_descriptions == []:
+                mso_values["interfaceDescriptions"] = REMOVE_ATTRIBUTE
+            elif interface_descriptions:
+                mso_values["interfaceDescriptions"] = expand_interface_description_ranges(get_interface_description_ranges(mso, interface_descriptions, ""))
+
+            if match:
+                proposed = copy.deepcopy(match.details)
+                ops.extend(get_attribute_ops(proposed, "{0}/{1}".format(path, match.index), mso_values))
+            else:
+                if not nodes:
+                    mso.fail_json(msg="Missing 'nodes' for creating the {0} '{1}'.".format(object_description, name))
+                if not physical_interface_type:
+                    mso.fail_json(msg="Missing Physical Interface type for creating the {0} '{1}'.".format(object_description, name))
+                proposed = {}
+                get_attribute_ops(proposed, "", mso_values)
+                ops.append(dict(op="add", path="{0}/-".format(path), value=proposed))
+            proposed_physical_interfaces.append(proposed)
+
+    elif state == "absent":
+        # The Physical Interfaces are removed in descending order of the index, so the index of the next removal does not change
+        for index in sorted((match.index for physical_interface, match in matches if match), reverse=True):
+            ops.append(dict(op="remove", path="{0}/{1}".format(path, index)))
+
+    mso.previous = [match.details for physical_interface, match in matches if match]
+    mso.existing = mso.proposed = proposed_physical_interfaces
+
+    if not module.check_mode and ops:
+        response = mso_template.patch(ops, chunk_size)
+        if response and state == "present":
+            physical_interfaces = response.get("fabricResourceTemplate", {}).get("template", {}).get("interfaceProfiles") or []
+            mso.existing = [match.details for proposed, match in mso_template.get_bulk_matches(object_description, physical_interfaces, mso.proposed) if match]
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -114,7 +114,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 notes:
 - The O(template) must exist before using this module in your playbook.
   Use M(cisco.mso.ndo_template) to create the Fabric Resource template.
@@ -235,6 +237,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import (
     MSOModule,
     mso_argument_spec,
+    ndo_port_channel_interface_spec,
     format_interface_descriptions,
 )
 from ansible_collections.cisco.mso.plugins.module_utils.template import (
@@ -246,30 +249,10 @@ from ansible_collections.cisco.mso.plugins.module_utils.utils import append_upda
 
 def main():
     argument_spec = mso_argument_spec()
+    argument_spec.update(ndo_port_channel_interface_spec())
     argument_spec.update(
         template=dict(type="str", required=True),
-        name=dict(type="str", aliases=["port_channel_interface", "port_channel"]),
-        uuid=dict(type="str", aliases=["port_channel_interface_uuid", "port_channel_uuid"]),
-        description=dict(type="str"),
-        node=dict(type="str"),
-        interfaces=dict(type="list", elements="str", aliases=["members"]),
-        interface_policy_group=dict(
-            type="dict",
-            options=dict(
-                name=dict(type="str", required=True),
-                template=dict(type="str", required=True),
-            ),
-            aliases=["policy", "interface_policy", "interface_setting"],
-        ),
-        interface_policy_group_uuid=dict(type="str", aliases=["policy_uuid", "interface_policy_uuid", "interface_setting_uuid"]),
-        interface_descriptions=dict(
-            type="list",
-            elements="dict",
-            options=dict(
-                interface_id=dict(type="str", required=True),
-                description=dict(type="str"),
-            ),
-        ),
+        template_id=dict(type="str"),
         state=dict(type="str", default="query", choices=["absent", "query", "present"]),
     )
 
@@ -324,7 +307,7 @@ def main():
             mso.fail_json(msg="{0} with the UUID: '{1}' not found".format(object_description, uuid))
 
         if interface_policy_group and not interface_policy_group_uuid:
-            fabric_policy_template = MSOTemplate(mso, "fabric_policy", interface_policy_group.get("template"))
+            fabric_policy_template = mso.template_objects.get_template("fabric_policy", interface_policy_group.get("template"))
             fabric_policy_template.validate_template("fabricPolicy")
             interface_policy_group_uuid = fabric_policy_template.get_interface_policy_group_uuid(interface_policy_group.get("name"))
 
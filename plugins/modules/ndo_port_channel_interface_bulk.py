@@ -0,0 +1,335 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_port_channel_interface_bulk
+short_description: Manage multiple Port Channel Interfaces on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Manage multiple Port Channel Interfaces of a fabric resource template on Cisco Nexus Dashboard Orchestrator (NDO) in one task.
+- The template is requested once, the Interface Policy Groups are resolved with one request per fabric policy template
+  and the changes of all Port Channel Interfaces are sent in one PATCH request, or in multiple PATCH requests with O(chunk_size).
+- Ranges of interface descriptions are only expanded into the descriptions of every interface ID when the payload is built.
+- Only the provided attributes of an existing Port Channel Interface are compared and changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a fabric resource template.
+    type: str
+    required: true
+  port_channel_interfaces:
+    description:
+    - The Port Channel Interfaces, with the same attributes as the options of M(cisco.mso.ndo_port_channel_interface).
+    - Every Port Channel Interface must have a O(port_channel_interfaces.name) or a O(port_channel_interfaces.uuid).
+    - When querying, only the provided Port Channel Interfaces are returned.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The name of the Port Channel Interface.
+        type: str
+        aliases: [ port_channel_interface, port_channel ]
+      uuid:
+        description:
+        - The UUID of the Port Channel Interface.
+        - This parameter can be used instead of O(port_channel_interfaces.name)
+          when an existing Port Channel Interface is updated.
+        - This parameter is required when parameter O(port_channel_interfaces.name) is updated.
+        type: str
+        aliases: [ port_channel_interface_uuid, port_channel_uuid ]
+      description:
+        description:
+        - The description of the Port Channel Interface.
+        type: str
+      node:
+        description:
+        - The node ID.
+        - This is only required when creating a new Port Channel Interface.
+        type: str
+      interfaces:
+        description:
+        - The list of used Interface IDs.
+        - Ranges of Interface IDs can be used.
+        - This is only required when creating a new Port Channel Interface.
+        type: list
+        elements: str
+        aliases: [ members ]
+      interface_policy_group_uuid:
+        description:
+        - The UUID of the Port Channel Interface Policy Group.
+        - This is only required when creating a new Port Channel Interface.
+        type: str
+        aliases: [ policy_uuid, interface_policy_uuid, interface_setting_uuid ]
+      interface_policy_group:
+        description:
+        - The Port Channel Interface Policy Group.
+        - This parameter can be used instead of O(port_channel_interfaces.interface_policy_group_uuid).
+        - If both parameter are used, O(port_channel_interfaces.interface_policy_group) will be ignored.
+        type: dict
+        suboptions:
+          name:
+            description:
+            - The name of the Interface Policy Group.
+            type: str
+            required: true
+          template:
+            description:
+            - The name of the template in which the Interface Policy Group has been created.
+            type: str
+            required: true
+        aliases: [ policy, interface_policy, interface_setting ]
+      interface_descriptions:
+        description:
+        - The list of interface descriptions of the Port Channel Interface.
+        - Providing a new list of O(port_channel_interfaces.interface_descriptions) will completely
+          replace an existing one from the Port Channel Interface.
+        - Providing an empty list will remove the O(port_channel_interfaces.interface_descriptions=[])
+          from the Port Channel Interface.
+        type: list
+        elements: dict
+        suboptions:
+          interface_id:
+            description:
+            - The interface ID or a range of interface IDs.
+            - Using a range of interface IDs will
+              apply the same O(port_channel_interfaces.interface_descriptions.description) for every ID in range.
+            type: str
+            required: true
+          description:
+            description:
+            - The description of the interface or group of interfaces.
+            type: str
+  chunk_size:
+    description:
+    - The maximum number of operations per PATCH request.
+    - By default, all changes are sent in one PATCH request.
+    type: int
+  state:
+    description:
+    - Use C(absent) for removing the Port Channel Interfaces.
+    - Use C(query) for listing the Port Channel Interfaces.
+    - Use C(present) for creating or updating the Port Channel Interfaces.
+    type: str
+    choices: [ absent, query, present ]
+    default: query
+notes:
+- The O(template) must exist before using this module in your playbook.
+  Use M(cisco.mso.ndo_template) to create the fabric resource template.
+- The O(port_channel_interfaces.interface_policy_group) must exist before using this module in your playbook.
+  Use M(cisco.mso.ndo_interface_setting) to create the Interface Policy Group of type Port Channel.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_port_channel_interface
+- module: cisco.mso.ndo_interface_setting
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Create or update multiple Port Channel Interfaces
+  cisco.mso.ndo_port_channel_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    port_channel_interfaces:
+    - name: ansible_test_port_channel_interface_1
+      description: Port Channel Interface for Ansible Test
+      node: 101
+      interfaces:
+      - 1/1-2
+      interface_policy_group:
+        name: ansible_test_interface_policy_group_port_channel
+        template: ansible_fabric_policy_template
+      interface_descriptions:
+      - interface_id: 1/1-2
+        description: Uplink ports
+    - name: ansible_test_port_channel_interface_2
+      node: 102
+      interfaces:
+      - 1/3
+      - 1/5
+      interface_policy_group_uuid: "{{ interface_policy_group.current.uuid }}"
+    chunk_size: 500
+    state: present
+
+- name: Query multiple Port Channel Interfaces
+  cisco.mso.ndo_port_channel_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    port_channel_interfaces:
+    - name: ansible_test_port_channel_interface_1
+    - name: ansible_test_port_channel_interface_2
+    state: query
+  register: query_port_channel_interfaces
+
+- name: Query all Port Channel Interfaces
+  cisco.mso.ndo_port_channel_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    state: query
+  register: query_all
+
+- name: Delete multiple Port Channel Interfaces
+  cisco.mso.ndo_port_channel_interface_bulk:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_test_template
+    port_channel_interfaces:
+    - name: ansible_test_port_channel_interface_1
+    - name: ansible_test_port_channel_interface_2
+    state: absent
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import (
+    MSOModule,
+    mso_argument_spec,
+    ndo_port_channel_interface_spec,
+    get_interface_description_ranges,
+    expand_interface_description_ranges,
+)
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+from ansible_collections.cisco.mso.plugins.module_utils.utils import get_attribute_ops
+import copy
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        port_channel_interfaces=dict(type="list", elements="dict", options=ndo_port_channel_interface_spec()),
+        chunk_size=dict(type="int"),
+        state=dict(type="str", default="query", choices=["absent", "query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["port_channel_interfaces"]],
+            ["state", "absent", ["port_channel_interfaces"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    port_channel_interfaces = module.params.get("port_channel_interfaces") or []
+    chunk_size = module.params.get("chunk_size")
+    state = module.params.get("state")
+
+    if chunk_size is not None and chunk_size < 1:
+        mso.fail_json(msg="The chunk_size must be at least 1.")
+
+    mso_template = MSOTemplate(mso, "fabric_resource", template)
+    mso_template.validate_template("fabricResource")
+    object_description = "Port Channel Interface"
+
+    path = "/fabricResourceTemplate/template/portChannels"
+    existing_port_channel_interfaces = mso_template.template.get("fabricResourceTemplate", {}).get("template", {}).get("portChannels") or []
+
+    matches = mso_template.get_bulk_matches(object_description, existing_port_channel_interfaces, port_channel_interfaces)
+
+    if state == "query":
+        mso.existing = [match.details for port_channel_interface, match in matches if match] if port_channel_interfaces else existing_port_channel_interfaces
+        mso.exit_json()
+
+    ops = []
+    proposed_port_channel_interfaces = []
+
+    if state == "present":
+        # The Interface Policy Groups of all Port Channel Interfaces are resolved with one request per fabric policy template
+        policies = [
+            (
+                dict(policy=port_channel_interface.get("interface_policy_group"))
+                if port_channel_interface.get("interface_policy_group") and not port_channel_interface.get("interface_policy_group_uuid")
+                else {}
+            )
+            for port_channel_interface in port_channel_interfaces
+        ]
+        mso.template_objects.resolve_references(
+            dict(portChannels=policies),
+            {("portChannels", "policy"): ("fabric_policy", "interfacePolicyGroups", "Interface Policy Groups")},
+        )
+
+        for (port_channel_interface, match), policy in zip(matches, policies):
+            name = port_channel_interface.get("name") or port_channel_interface.get("uuid")
+            node = port_channel_interface.get("node")
+            interfaces = port_channel_interface.get("interfaces")
+            interface_descriptions = port_channel_interface.get("interface_descriptions")
+
+            # The interface descriptions of an existing Port Channel Interface are moved to the new node when only the node is changed
+            if interface_descriptions is None and node and match and match.details.get("interfaceDescriptions"):
+                interface_descriptions = match.details.get("interfaceDescriptions")
+
+            mso_values = {
+                "name": port_channel_interface.get("name"),
+                "node": node,
+                "memberInterfaces": ",".join(interfaces) if interfaces is not None else None,
+                "policy": policy.get("policy") or port_channel_interface.get("interface_policy_group_uuid"),
+                "description": port_channel_interface.get("description"),
+            }
+
+            # The ranges of interface IDs are kept compact until the payload of the Port Channel Interface is built
+            if interface_descriptions is not None:
+                mso_values["interfaceDescriptions"] = expand_interface_description_ranges(
+                    get_interface_description_ranges(mso, interface_descriptions, node or (match.details.get("node") if match else None))
+                )
+
+            if match:
+                proposed = copy.deepcopy(match.details)
+                ops.extend(get_attribute_ops(proposed, "{0}/{1}".format(path, match.index), mso_values))
+            else:
+                if not node:
+                    mso.fail_json(msg="Missing parameter 'node' for creating the {0} '{1}'.".format(object_description, name))
+                proposed = {}
+                get_attribute_ops(proposed, "", mso_values)
+                ops.append(dict(op="add", path="{0}/-".format(path), value=proposed))
+            proposed_port_channel_interfaces.append(proposed)
+
+    elif state == "absent":
+        # The Port Channel Interfaces are removed in descending order of the index, so the index of the next removal does not change
+        for index in sorted((match.index for port_channel_interface, match in matches if match), reverse=True):
+            ops.append(dict(op="remove", path="{0}/{1}".format(path, index)))
+
+    mso.previous = [match.details for port_channel_interface, match in matches if match]
+    mso.existing = mso.proposed = proposed_port_channel_interfaces
+
+    if not module.check_mode and ops:
+        response = mso_template.patch(ops, chunk_size)
+        if response and state == "present":
+            port_channel_interfaces = response.get("fabricResourceTemplate", {}).get("template", {}).get("portChannels") or []
+            mso.existing = [
+                match.details for proposed, match in mso_template.get_bulk_matches(object_description, port_channel_interfaces, mso.proposed) if match
+            ]
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -107,7 +107,9 @@ notes:
   The M(cisco.mso.ndo_template) module can be used for this.
 seealso:
 - module: cisco.mso.ndo_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -194,6 +196,7 @@ def main():
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
+            template_id=dict(type="str"),
             ptp_policy=dict(type="str", aliases=["name"]),
             ptp_policy_uuid=dict(type="str", aliases=["uuid"]),
             description=dict(type="str"),
@@ -85,7 +85,9 @@ notes:
 seealso:
 - module: cisco.mso.ndo_template
 - module: cisco.mso.ndo_ptp_policy
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -176,6 +178,7 @@ def main():
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
+            template_id=dict(type="str"),
             ptp_policy_profile_name=dict(type="str", aliases=["name"]),
             ptp_policy_profile_uuid=dict(type="str", aliases=["uuid"]),
             delay_interval=dict(type="int"),
@@ -83,7 +83,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -146,6 +148,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         route_map_policy=dict(type="str", aliases=["name"]),
         route_map_policy_uuid=dict(type="str", aliases=["uuid"]),
         description=dict(type="str"),
@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_schema_batch
+short_description: Run multiple schema module tasks with one schema fetch and one PATCH request
+description:
+- Run a list of schema module tasks, e.g. M(cisco.mso.mso_schema_template_bd) or M(cisco.mso.mso_schema_template_anp_epg), as one batch.
+- Every schema is requested only once for the whole batch and the changes of every task are applied to a staged copy of the schema.
+- The staged changes of every schema are sent in one PATCH request after all tasks of the batch are completed.
+- When a task of the batch fails, no changes are sent.
+- The result of every task is returned in C(results).
+- Requires the tasks to be executed on the Ansible controller, which is the case for the HTTP API connection plugin and for the local connection.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  tasks:
+    description:
+    - The schema module tasks of the batch, which are executed in order.
+    - The connection options of M(cisco.mso.ndo_schema_batch) are used for every task, unless provided in O(tasks.args).
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      module:
+        description:
+        - The name of the module, e.g. C(mso_schema_template_bd) or C(cisco.mso.mso_schema_template_bd).
+        type: str
+        required: true
+      args:
+        description:
+        - The parameters of the module.
+        type: dict
+        default: {}
+      name:
+        description:
+        - The name of the task, which is returned in the result of the task.
+        type: str
+  workers:
+    description:
+    - The maximum number of concurrent PATCH requests when the batch changes multiple schemas.
+    type: int
+    default: 8
+notes:
+- Only the requests of a schema, e.g. C(schemas/<id>), are staged, the other requests of the tasks are sent directly.
+- The schema modules which create, replace or delete a schema, e.g. M(cisco.mso.mso_schema), are not supported in a batch.
+extends_documentation_fragment: cisco.mso.modules
+"""
+
+EXAMPLES = r"""
+- name: Add a VRF, a BD and an EPG to a schema with one PATCH request
+  cisco.mso.ndo_schema_batch:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    tasks:
+    - module: mso_schema_template_vrf
+      args:
+        schema: Schema 1
+        template: Template 1
+        vrf: VRF1
+        state: present
+    - module: mso_schema_template_bd
+      args:
+        schema: Schema 1
+        template: Template 1
+        bd: BD1
+        vrf:
+          name: VRF1
+        state: present
+    - module: mso_schema_template_anp_epg
+      args:
+        schema: Schema 1
+        template: Template 1
+        anp: ANP1
+        epg: EPG1
+        bd:
+          name: BD1
+        state: present
+  register: batch
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.constants import REQUEST_WORKERS
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        tasks=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                module=dict(type="str", required=True),
+                args=dict(type="dict", default={}),
+                name=dict(type="str"),
+            ),
+        ),
+        workers=dict(type="int", default=REQUEST_WORKERS),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    workers = module.params.get("workers")
+
+    mso = MSOModule(module)
+
+    # The tasks are executed by the action plugin, the module sends the staged changes of the tasks
+    schema_batch = mso.schema_batch
+    if schema_batch is None:
+        mso.fail_json(msg="The ndo_schema_batch module must be executed by the cisco.mso.ndo_schema_batch action plugin.")
+    mso.schema_batch = None
+
+    staged = [(schema_id, schema_staged) for schema_id, schema_staged in schema_batch.get_staged().items() if schema_staged.get("ops")]
+
+    if staged and not module.check_mode:
+        mso.request_concurrently(
+            [dict(path="schemas/{0}".format(schema_id), method="PATCH", data=schema_staged.get("ops")) for schema_id, schema_staged in staged],
+            workers=workers,
+        )
+
+    mso.existing = [
+        dict(schemaId=schema_id, displayName=schema_staged.get("schema", {}).get("displayName"), operations=len(schema_staged.get("ops")))
+        for schema_id, schema_staged in staged
+    ]
+    mso.result["changed"] = bool(staged)
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
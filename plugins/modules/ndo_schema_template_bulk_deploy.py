@@ -0,0 +1,233 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_schema_template_bulk_deploy
+short_description: Deploy multiple schema templates to sites concurrently for NDO v3.7 and higher
+description:
+- Deploy, redeploy or undeploy multiple templates of multiple schemas in one task.
+- The schema and site names of all targets are resolved once and every schema is validated only once per schema version prior to deploy or redeploy.
+- The deploy tasks of targets with the same O(targets.order) are submitted concurrently.
+- Targets with a higher O(targets.order) are only submitted when all targets with a lower order are completed.
+- When schema validation fails, M(cisco.mso.ndo_schema_template_bulk_deploy) fails and no deploy or redeploy will be executed.
+- Only supports NDO v3.7 and higher
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  targets:
+    description:
+    - The schema templates to deploy, redeploy or undeploy.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      schema:
+        description:
+        - The name of the schema.
+        type: str
+        required: true
+      template:
+        description:
+        - The name of the template.
+        type: str
+        required: true
+      sites:
+        description:
+        - The name of the site(s) to undeploy the template from.
+        type: list
+        elements: str
+      order:
+        description:
+        - The order in which the target is deployed.
+        - Targets with a lower order are deployed and completed first, e.g. templates with shared VRFs.
+        type: int
+        default: 0
+  workers:
+    description:
+    - The maximum number of concurrent requests.
+    type: int
+    default: 8
+  force_validation:
+    description:
+    - Validate the schemas even when the current version of a schema was already validated.
+    - When the controller side cache is enabled with the C(MSO_CACHE) environment variable,
+      the validation result is cached per schema version and reused by later deploys of the unchanged schema.
+    type: bool
+    default: false
+  wait:
+    description:
+    - Wait for the deployments of each order to complete by polling the template deploy status with exponential backoff.
+    - The deploy status is requested before the submit, so the final status of a previous deployment is not mistaken for the final status.
+    - A template without sites has no site statuses and does not wait.
+    - When O(wait=false) the targets are submitted in order without waiting for the completion of the previous order.
+    type: bool
+    default: true
+  wait_timeout:
+    description:
+    - The maximum number of seconds to wait for the deployments of each order to complete.
+    type: int
+    default: 600
+  state:
+    description:
+    - Use C(deploy) to deploy schema templates.
+    - Use C(redeploy) to redeploy schema templates.
+    - Use C(undeploy) to undeploy schema templates from the sites.
+    type: str
+    choices: [ deploy, redeploy, undeploy ]
+    default: deploy
+seealso:
+- module: cisco.mso.ndo_schema_template_deploy
+extends_documentation_fragment: cisco.mso.modules
+"""
+
+EXAMPLES = r"""
+- name: Deploy the shared template first and the other templates concurrently afterwards
+  cisco.mso.ndo_schema_template_bulk_deploy:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    targets:
+    - schema: Schema 1
+      template: Shared
+      order: 0
+    - schema: Schema 1
+      template: Template 1
+      order: 1
+    - schema: Schema 2
+      template: Template 1
+      order: 1
+    state: deploy
+
+- name: Undeploy schema templates from sites
+  cisco.mso.ndo_schema_template_bulk_deploy:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    targets:
+    - schema: Schema 1
+      template: Template 1
+      sites: [Site1, Site2]
+    - schema: Schema 2
+      template: Template 1
+      sites: [Site1]
+    state: undeploy
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec, get_submitted_deploy_site_statuses
+from ansible_collections.cisco.mso.plugins.module_utils.constants import REQUEST_WORKERS, WAIT_TIMEOUT
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        targets=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                schema=dict(type="str", required=True),
+                template=dict(type="str", required=True),
+                sites=dict(type="list", elements="str"),
+                order=dict(type="int", default=0),
+            ),
+        ),
+        workers=dict(type="int", default=REQUEST_WORKERS),
+        force_validation=dict(type="bool", default=False),
+        wait=dict(type="bool", default=True),
+        wait_timeout=dict(type="int", default=WAIT_TIMEOUT),
+        state=dict(type="str", default="deploy", choices=["deploy", "redeploy", "undeploy"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    targets = module.params.get("targets")
+    workers = module.params.get("workers")
+    force_validation = module.params.get("force_validation")
+    wait = module.params.get("wait")
+    wait_timeout = module.params.get("wait_timeout")
+    state = module.params.get("state")
+
+    mso = MSOModule(module)
+
+    # Resolve the schemas, templates and sites of all targets in one pass
+    schemas = dict((schema.get("displayName"), schema) for schema in mso.query_objs("schemas/list-identity", key="schemas"))
+    site_ids = {}
+    if state == "undeploy":
+        site_ids = dict((site.get("name"), site.get("id")) for site in mso.query_objs("sites"))
+
+    deployments = []
+    for target in targets:
+        template = target.get("template").replace(" ", "")
+        schema = schemas.get(target.get("schema"))
+        if not schema:
+            mso.fail_json(msg="Provided schema '{0}' does not exist.".format(target.get("schema")))
+        existing_templates = [existing_template.get("name") for existing_template in schema.get("templates") or []]
+        if template not in existing_templates:
+            mso.fail_json(
+                msg="Provided template '{0}' not matching existing template(s) of schema '{1}': {2}".format(
+                    template, target.get("schema"), ", ".join(existing_templates)
+                )
+            )
+        payload = dict(schemaId=schema.get("id"), templateName=template)
+        if state == "undeploy":
+            if not target.get("sites"):
+                mso.fail_json(msg="Sites must be provided for template '{0}' of schema '{1}' when state is undeploy.".format(template, target.get("schema")))
+            for site in target.get("sites"):
+                if site not in site_ids:
+                    mso.fail_json(msg="Site '{0}' is not a valid site name.".format(site))
+            payload.update(undeploy=[site_ids.get(site) for site in target.get("sites")])
+        else:
+            payload.update(isRedeploy=state == "redeploy")
+        deployments.append(dict(schema=target.get("schema"), template=template, order=target.get("order"), payload=payload))
+
+    # Validate every schema only once prior to deploy or redeploy
+    if state in ["deploy", "redeploy"]:
+        schema_ids = sorted(set(deployment.get("payload").get("schemaId") for deployment in deployments))
+        mso.validate_schemas(schema_ids, force=force_validation, workers=workers)
+
+    if not module.check_mode:
+        for order in sorted(set(deployment.get("order") for deployment in deployments)):
+            order_deployments = [deployment for deployment in deployments if deployment.get("order") == order]
+            if wait:
+                status_paths = [
+                    "status/schema/{0}/template/{1}".format(deployment.get("payload").get("schemaId"), deployment.get("template"))
+                    for deployment in order_deployments
+                ]
+                status_getters = [
+                    get_submitted_deploy_site_statuses(deploy_status) for deploy_status in mso.query_deploy_statuses(status_paths, workers=workers)
+                ]
+            tasks = mso.request_concurrently(
+                [dict(path="task", method="POST", data=deployment.get("payload")) for deployment in order_deployments], workers=workers
+            )
+            for deployment, task in zip(order_deployments, tasks):
+                deployment["task"] = task
+
+            if wait:
+                deploy_statuses = mso.wait_for_completions(status_paths, status_getters, timeout=wait_timeout, workers=workers)
+                for deployment, (deploy_status, timings) in zip(order_deployments, deploy_statuses):
+                    deployment["status"] = deploy_status.get("status")
+                    deployment["timings"] = timings
+
+    mso.existing = [dict((key, value) for key, value in deployment.items() if key != "payload") for deployment in deployments]
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
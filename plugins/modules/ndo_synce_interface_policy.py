@@ -80,7 +80,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -153,6 +155,7 @@ def main():
     argument_spec.update(
         dict(
             template=dict(type="str", required=True),
+            template_id=dict(type="str"),
             interface_policy=dict(type="str", aliases=["name"]),
             interface_policy_uuid=dict(type="str", aliases=["uuid"]),
             description=dict(type="str"),
@@ -82,7 +82,9 @@ notes:
   Use M(cisco.mso.ndo_template) to create the Tenant template.
 seealso:
 - module: cisco.mso.ndo_template
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -171,6 +173,7 @@ def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True, aliases=["tenant_template"]),
+        template_id=dict(type="str"),
         name=dict(type="str", aliases=["bgp_peer_prefix_policy"]),
         uuid=dict(type="str"),
         description=dict(type="str"),
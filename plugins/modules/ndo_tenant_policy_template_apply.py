@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {"metadata_version": "1.1", "status": ["preview"], "supported_by": "community"}
+
+DOCUMENTATION = r"""
+---
+module: ndo_tenant_policy_template_apply
+short_description: Apply the desired policies of a tenant policy template on Cisco Nexus Dashboard Orchestrator (NDO).
+description:
+- Apply the desired policies of multiple collections of a tenant policy template on Cisco Nexus Dashboard Orchestrator (NDO) in one PATCH request.
+- The template is requested once and only the differences between the desired and the existing policies are sent.
+- The policies of a collection are matched by uuid when provided and by name otherwise.
+- Only the provided attributes of a matched policy are compared and changed, the collections which are not provided are not changed.
+- This module is only supported on ND v3.1 (NDO v4.3) and later.
+author:
+- Anvitha Jain (@anvitha-jain)
+options:
+  template:
+    description:
+    - The name of the template.
+    - The template must be a tenant policy template.
+    type: str
+    required: true
+  policies:
+    description:
+    - The desired policies per collection of the tenant policy template, in the format of the NDO API.
+    - The collections are the keys of the C(tenantPolicyTemplate.template) object of the template,
+      e.g. C(dhcpRelayPolicies), C(dhcpOptionPolicies), C(ipslaMonitoringPolicies), C(bgpPeerPrefixPolicies), C(igmpSnoopPolicies),
+      C(mldSnoopPolicies), C(mcastRouteMapPolicies) or C(l3OutNodePolGroups).
+    - Every policy of a collection must have a C(name) or a C(uuid), a policy with a C(uuid) must exist.
+    - References to other objects must be provided as the uuid of the object, e.g. the C(epgRef) of the providers of a DHCP Relay Policy.
+    - When querying, only the provided collections are returned.
+    type: dict
+  prune:
+    description:
+    - Remove the existing policies of the provided collections which are not in O(policies).
+    - The collections which are not provided are not changed.
+    type: bool
+    default: false
+  state:
+    description:
+    - Use C(present) for applying the desired policies.
+    - Use C(query) for listing the policies of the template.
+    type: str
+    choices: [ query, present ]
+    default: query
+notes:
+- Within a collection, the existing policies are updated first, then the pruned policies are removed and the new policies are added.
+seealso:
+- module: cisco.mso.ndo_template
+- module: cisco.mso.ndo_dhcp_relay_policy
+- module: cisco.mso.ndo_dhcp_option_policy
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
+"""
+
+EXAMPLES = r"""
+- name: Apply DHCP and IGMP snooping policies to a tenant policy template
+  cisco.mso.ndo_tenant_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_tenant_template
+    policies:
+      dhcpOptionPolicies:
+      - name: ansible_test_option_policy
+        description: DHCP Option Policy
+        options:
+        - name: option_1
+          id: 1
+          data: data_1
+      igmpSnoopPolicies:
+      - name: ansible_test_igmp_snooping_policy_1
+        enableAdminState: enabled
+      - name: ansible_test_igmp_snooping_policy_2
+        enableAdminState: disabled
+    state: present
+
+- name: Remove every IGMP snooping policy except one from a tenant policy template
+  cisco.mso.ndo_tenant_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_tenant_template
+    policies:
+      igmpSnoopPolicies:
+      - name: ansible_test_igmp_snooping_policy_1
+    prune: true
+    state: present
+
+- name: Query the IGMP snooping policies of a tenant policy template
+  cisco.mso.ndo_tenant_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_tenant_template
+    policies:
+      igmpSnoopPolicies: []
+    state: query
+  register: query_igmp_snooping_policies
+
+- name: Query all policies of a tenant policy template
+  cisco.mso.ndo_tenant_policy_template_apply:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_tenant_template
+    state: query
+  register: query_all
+"""
+
+RETURN = r"""
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
+from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate
+
+
+def main():
+    argument_spec = mso_argument_spec()
+    argument_spec.update(
+        template=dict(type="str", required=True),
+        template_id=dict(type="str"),
+        policies=dict(type="dict"),
+        prune=dict(type="bool", default=False),
+        state=dict(type="str", default="query", choices=["query", "present"]),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_if=[
+            ["state", "present", ["policies"]],
+        ],
+    )
+
+    mso = MSOModule(module)
+
+    template = module.params.get("template")
+    policies = module.params.get("policies")
+    prune = module.params.get("prune")
+    state = module.params.get("state")
+
+    mso_template = MSOTemplate(mso, "tenant", template)
+    mso_template.validate_template("tenantPolicy")
+
+    existing_policies = mso_template.template.get("tenantPolicyTemplate", {}).get("template", {})
+
+    if state == "query":
+        mso.existing = dict((collection, existing_policies.get(collection)) for collection in policies) if policies else existing_policies
+
+    elif state == "present":
+        ops, mso.previous, mso.proposed = mso_template.get_apply_ops("tenantPolicyTemplate", policies, prune)
+        mso.existing = mso.proposed if ops else mso.previous
+
+        if not module.check_mode and ops:
+            response = mso.request(mso_template.template_path, method="PATCH", data=ops)
+            if response:
+                mso_template.template = response
+                existing_policies = mso_template.template.get("tenantPolicyTemplate", {}).get("template", {})
+                mso.existing = dict((collection, existing_policies.get(collection)) for collection in policies)
+
+    mso.exit_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,8 @@ options:
     - A list of vlan ranges attached to the VLAN Pool.
     - The list of configured vlan ranges must contain at least one entry.
     - When the list of vlan ranges is null the update will not change existing entry configuration.
+    - Overlapping and adjacent vlan ranges are merged, e.g. C(100-200) and C(201-300) are configured as C(100-300).
+    - During an update, only the vlan ranges which are not configured are added and only the configured vlan ranges which are not provided are removed.
     type: list
     elements: dict
     suboptions:
@@ -62,6 +64,11 @@ options:
         type: int
         required: true
         aliases: [ to ]
+  check_overlap:
+    description:
+    - Fail when the O(vlan_ranges) overlap with the vlan ranges of the other VLAN Pools of the template.
+    type: bool
+    default: false
   state:
     description:
     - Use C(absent) for removing.
@@ -70,7 +77,9 @@ options:
     type: str
     choices: [ absent, query, present ]
     default: query
-extends_documentation_fragment: cisco.mso.modules
+extends_documentation_fragment:
+- cisco.mso.modules
+- cisco.mso.object_ids.template
 """
 
 EXAMPLES = r"""
@@ -88,6 +97,23 @@ EXAMPLES = r"""
         to_vlan: 400
     state: present
 
+- name: Add a vlan range to a vlan pool which does not overlap with the other vlan pools
+  cisco.mso.ndo_vlan_pool:
+    host: mso_host
+    username: admin
+    password: SomeSecretPassword
+    template: ansible_tenant_template
+    vlan_pool: ansible_test_vlan_pool
+    vlan_ranges:
+      - from_vlan: 100
+        to_vlan: 200
+      - from_vlan: 300
+        to_vlan: 400
+      - from_vlan: 500
+        to_vlan: 600
+    check_overlap: true
+    state: present
+
 - name: Query a vlan pool with template_name
   cisco.mso.ndo_vlan_pool:
     host: mso_host
@@ -125,12 +151,14 @@ import copy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.template import MSOTemplate, KVPair
+from ansible_collections.cisco.mso.plugins.module_utils.utils import merge_ranges, get_overlapping_ranges
 
 
 def main():
     argument_spec = mso_argument_spec()
     argument_spec.update(
         template=dict(type="str", required=True),
+        template_id=dict(type="str"),
         vlan_pool=dict(type="str", aliases=["name"]),
         vlan_pool_uuid=dict(type="str", aliases=["uuid"]),
         description=dict(type="str"),
@@ -142,6 +170,7 @@ def main():
                 to_vlan=dict(type="int", required=True, aliases=["to"]),
             ),
         ),
+        check_overlap=dict(type="bool", default=False),
         state=dict(type="str", default="query", choices=["absent", "query", "present"]),
     )
 
@@ -159,10 +188,19 @@ def main():
     template = module.params.get("template")
     vlan_pool = module.params.get("vlan_pool")
     vlan_pool_uuid = module.params.get("vlan_pool_uuid")
-    vlan_ranges = get_vlan_ranges_payload(module.params.get("vlan_ranges")) if module.params.get("vlan_ranges") else []
+    vlan_ranges = module.params.get("vlan_ranges")
     description = module.params.get("description")
+    check_overlap = module.params.get("check_overlap")
     state = module.params.get("state")
 
+    if vlan_ranges is not None:
+        for vlan_range in vlan_ranges:
+            if vlan_range.get("from_vlan") > vlan_range.get("to_vlan"):
+                mso.fail_json(
+                    msg="The from_vlan {0} of a vlan range is greater than its to_vlan {1}.".format(vlan_range.get("from_vlan"), vlan_range.get("to_vlan"))
+                )
+        vlan_ranges = merge_ranges((vlan_range.get("from_vlan"), vlan_range.get("to_vlan")) for vlan_range in vlan_ranges)
+
     ops = []
     match = None
 
@@ -188,9 +226,28 @@ def main():
 
         err_message_min_vlan_ranges = "At least one vlan range is required when state is present."
 
+        if check_overlap and vlan_ranges:
+            other_vlan_ranges = [
+                get_block_range(block) + (existing_vlan_pool.get("name"),)
+                for index, existing_vlan_pool in enumerate(existing_vlan_pools)
+                if not (match and index == match.index)
+                for block in existing_vlan_pool.get("encapBlocks") or []
+                if get_block_range(block) is not None
+            ]
+            overlaps = get_overlapping_ranges(vlan_ranges, other_vlan_ranges)
+            if overlaps:
+                mso.fail_json(
+                    msg="The vlan ranges overlap with the vlan ranges of other VLAN Pools: {0}.".format(
+                        ", ".join(
+                            "{0}-{1} with {2}-{3} of '{4}'".format(vlan_range[0], vlan_range[1], other_vlan_range[0], other_vlan_range[1], other_vlan_range[2])
+                            for vlan_range, other_vlan_range in overlaps
+                        )
+                    )
+                )
+
         if match:
 
-            if module.params.get("vlan_ranges") is not None and len(vlan_ranges) == 0:
+            if vlan_ranges is not None and len(vlan_ranges) == 0:
                 mso.fail_json(msg=err_message_min_vlan_ranges)
 
             if vlan_pool and match.details.get("name") != vlan_pool:
@@ -201,9 +258,15 @@ def main():
                 ops.append(dict(op="replace", path="{0}/{1}/description".format(path, match.index), value=description))
                 match.details["description"] = description
 
-            if module.params.get("vlan_ranges") is not None and match.details.get("vlan_ranges") != vlan_ranges:
-                ops.append(dict(op="replace", path="{0}/{1}/encapBlocks".format(path, match.index), value=vlan_ranges))
-                match.details["vlan_ranges"] = vlan_ranges
+            if vlan_ranges is not None:
+                existing_blocks = match.details.get("vlan_ranges") or []
+                existing_ranges = [get_block_range(block) for block in existing_blocks]
+                # Incomplete existing vlan ranges are not merged, they are removed by the operations
+                if None in existing_ranges or merge_ranges(existing_ranges) != vlan_ranges:
+                    vlan_ranges_ops, match.details["vlan_ranges"] = get_vlan_ranges_ops(
+                        "{0}/{1}/encapBlocks".format(path, match.index), existing_blocks, vlan_ranges
+                    )
+                    ops.extend(vlan_ranges_ops)
 
             mso.sanitize(match.details)
 
@@ -212,7 +275,7 @@ def main():
             if not vlan_ranges:
                 mso.fail_json(msg=err_message_min_vlan_ranges)
 
-            payload = {"name": vlan_pool, "allocMode": "static", "encapBlocks": vlan_ranges}
+            payload = {"name": vlan_pool, "allocMode": "static", "encapBlocks": get_vlan_ranges_payload(vlan_ranges)}
             if description:
                 payload["description"] = description
 
@@ -234,13 +297,25 @@ def main():
     mso.exit_json()
 
 
+def get_block_range(block):
+    """
+    Get the vlan range of an existing vlan range block of a VLAN Pool.
+    :param block: The existing vlan range block. -> Dict
+    :return: The start and end of the vlan range, or None when the block has no start or end. -> Tuple(Int, Int) | None
+    """
+    vlan_range = block.get("range") or {}
+    if vlan_range.get("from") is None or vlan_range.get("to") is None:
+        return None
+    return (vlan_range.get("from"), vlan_range.get("to"))
+
+
 def get_vlan_ranges_payload(vlan_ranges):
     payload = []
-    for vlan_range in vlan_ranges:
+    for from_vlan, to_vlan in vlan_ranges:
         vlan_range_payload = {
             "range": {
-                "from": vlan_range.get("from_vlan"),
-                "to": vlan_range.get("to_vlan"),
+                "from": from_vlan,
+                "to": to_vlan,
                 "allocMode": "static",
             }
         }
@@ -248,5 +323,36 @@ def get_vlan_ranges_payload(vlan_ranges):
     return payload
 
 
+def get_vlan_ranges_ops(path, existing_blocks, vlan_ranges):
+    """
+    Get the PATCH operations which change the existing vlan ranges of a VLAN Pool into the merged vlan ranges.
+    The existing vlan ranges which are provided are kept, the other existing vlan ranges are removed and the missing vlan ranges are added.
+    :param path: The path of the vlan ranges of the VLAN Pool. -> Str
+    :param existing_blocks: The existing vlan ranges of the VLAN Pool. -> List[Dict]
+    :param vlan_ranges: The merged vlan ranges, see merge_ranges. -> List[Tuple(Int, Int)]
+    :return: The operations and the vlan ranges of the VLAN Pool after the operations. -> Tuple(List[Dict], List[Dict])
+    """
+    desired_ranges = set(vlan_ranges)
+    kept_ranges, blocks, remove_indexes = set(), [], []
+    for index, block in enumerate(existing_blocks):
+        existing_range = get_block_range(block)
+        if existing_range in desired_ranges and existing_range not in kept_ranges:
+            kept_ranges.add(existing_range)
+            blocks.append(block)
+        else:
+            remove_indexes.append(index)
+    added_blocks = get_vlan_ranges_payload(vlan_range for vlan_range in vlan_ranges if vlan_range not in kept_ranges)
+    blocks.extend(added_blocks)
+
+    if not kept_ranges:
+        # None of the existing vlan ranges is kept, so the vlan ranges are replaced with one operation
+        return [dict(op="replace", path=path, value=blocks)], blocks
+
+    # The vlan ranges are removed in descending order of the index, so the index of the next removal does not change
+    ops = [dict(op="remove", path="{0}/{1}".format(path, index)) for index in reversed(remove_indexes)]
+    ops.extend(dict(op="add", path="{0}/-".format(path), value=block) for block in added_blocks)
+    return ops, blocks
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Anvitha Jain (@anvitha-jain) <anvjain@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+
+from ansible.errors import AnsibleError
+from ansible.module_utils._text import to_bytes, to_native
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils.urls import open_url
+from ansible_collections.cisco.mso.plugins.module_utils.constants import NDO_COLLECTIONS, ND_USERS_COLLECTION, ND_USERS_PATHS, REQUEST_WORKERS
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+
+    HAS_CONCURRENT_FUTURES = True
+except ImportError:
+    HAS_CONCURRENT_FUTURES = False
+
+
+class NDOClient:
+    """
+    Minimal NDO REST client for the controller side plugins, which cannot use the persistent httpapi connection of the modules.
+    """
+
+    def __init__(
+        self,
+        host,
+        username="admin",
+        password=None,
+        port=None,
+        login_domain=None,
+        platform=None,
+        use_ssl=True,
+        validate_certs=True,
+        use_proxy=True,
+        timeout=30,
+        workers=REQUEST_WORKERS,
+    ):
+        if not host:
+            raise AnsibleError("Provide the NDO host with the host option.")
+        self.username = username
+        self.password = password
+        self.login_domain = login_domain
+        # The platform can be provided as the ansible_network_os of the httpapi connection, e.g. cisco.nd.nd or cisco.mso.mso
+        self.platform = "mso" if (platform or "nd").split(".")[-1] == "mso" else "nd"
+        self.validate_certs = validate_certs
+        self.use_proxy = use_proxy
+        self.timeout = timeout
+        self.workers = workers
+        self.base_url = "{0}://{1}{2}/".format("https" if use_ssl else "http", host, ":{0}".format(port) if port else "")
+        self.headers = None
+
+    @property
+    def scope(self):
+        """
+        The identifier of the NDO host and user, used to scope cached data.
+        """
+        return hashlib.sha1(to_bytes("{0}:{1}".format(self.base_url, self.username))).hexdigest()
+
+    def get_api_url(self, path):
+        return "{0}{1}api/v1/{2}".format(self.base_url, "mso/" if self.platform == "nd" else "", path)
+
+    def send(self, method, url, data=None, headers=None):
+        try:
+            response = open_url(
+                url,
+                method=method,
+                data=json.dumps(data) if data is not None else None,
+                headers=dict({"Content-Type": "application/json"}, **(headers or {})),
+                validate_certs=self.validate_certs,
+                use_proxy=self.use_proxy,
+                timeout=self.timeout,
+            )
+            output = response.read()
+        except HTTPError as e:
+            raise AnsibleError("NDO Error {0} for {1}: {2}".format(e.code, url, to_native(e.read())))
+        except URLError as e:
+            raise AnsibleError("Connection failed for {0}. {1}".format(url, to_native(e.reason)))
+        return json.loads(output) if output else {}
+
+    def login(self):
+        """
+        Log in with the credentials and store the authorization headers.
+        :return: The authorization headers. -> Dict
+        """
+        if not self.password:
+            raise AnsibleError("Provide the password with the password option.")
+        if self.platform == "nd":
+            payload = dict(userName=self.username, userPasswd=self.password, domain=self.login_domain or "DefaultAuth")
+            token = self.send("POST", "{0}login".format(self.base_url), data=payload).get("token")
+        else:
+            payload = dict(username=self.username, password=self.password)
+            if self.login_domain and self.login_domain != "Local":
+                domains = self.send("GET", self.get_api_url("auth/login-domains")).get("domains", [])
+                domain = next((domain for domain in domains if domain.get("name") == self.login_domain), None)
+                if not domain:
+                    raise AnsibleError("Login domain '{0}' is not a valid domain name.".format(self.login_domain))
+                payload.update(domainId=domain.get("id"))
+            token = self.send("POST", self.get_api_url("auth/login"), data=payload).get("token")
+        self.headers = {"Authorization": "Bearer {0}".format(token)}
+        return self.headers
+
+    def get_collection(self, collection):
+        """
+        Get the definition of a collection, the users of the ND platform are the Nexus Dashboard users.
+        :param collection: The name of the collection in NDO_COLLECTIONS. -> Str
+        :return: The definition with at least the name and id keys of the objects. -> Dict
+        """
+        if collection == "users" and self.platform == "nd":
+            return ND_USERS_COLLECTION
+        return NDO_COLLECTIONS[collection]
+
+    def query_collection(self, collection):
+        """
+        Query the objects of a collection.
+        :param collection: The name of the collection in NDO_COLLECTIONS. -> Str
+        :return: The objects of the collection. -> List[Dict]
+        """
+        if self.headers is None:
+            self.login()
+        if collection == "users" and self.platform == "nd":
+            # Users are managed by Nexus Dashboard and are queried with the Nexus Dashboard API
+            responses = [self.send("GET", "{0}{1}".format(self.base_url, path.lstrip("/")), headers=self.headers) for path in ND_USERS_PATHS]
+            return [user.get("spec") for response in responses for user in response.get("items") or []]
+        response = self.send("GET", self.get_api_url(NDO_COLLECTIONS[collection].get("path")), headers=self.headers)
+        key = NDO_COLLECTIONS[collection].get("key")
+        return (response.get(key) or []) if isinstance(response, dict) and key else response or []
+
+    def query_collections(self, collections):
+        """
+        Query the objects of multiple collections concurrently after a single login.
+        :param collections: The names of the collections in NDO_COLLECTIONS. -> List[Str]
+        :return: The objects per collection. -> Dict[Str, List[Dict]]
+        """
+        if not collections:
+            return {}
+        if self.headers is None:
+            self.login()
+        if HAS_CONCURRENT_FUTURES and len(collections) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(collections))) as executor:
+                responses = list(executor.map(self.query_collection, collections))
+        else:
+            responses = [self.query_collection(collection) for collection in collections]
+        return dict(zip(collections, responses))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import threading
+import time
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.batch import HAS_FCNTL, MSOSchemaCommitQueue
+from ansible_collections.cisco.mso.plugins.module_utils.constants import COMMIT_QUEUE_TTL
+
+pytestmark = pytest.mark.skipif(not HAS_FCNTL, reason="The schema commit queue requires fcntl")
+
+
+class FakeController:
+    """Record the PATCH requests which are sent by the queues"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def send(self, ops):
+        with self.lock:
+            self.requests.append(ops)
+        return dict(ops=ops), None
+
+
+def commit_concurrently(directory, controller, requests, window=0.5):
+    """Commit the operations of every request in its own thread with its own queue, like concurrent module executions"""
+    barrier = threading.Barrier(len(requests))
+    results = [None] * len(requests)
+
+    def commit(index, ops):
+        queue = MSOSchemaCommitQueue("s1", window, directory=directory)
+        barrier.wait()
+        results[index] = queue.commit(ops, controller.send)
+
+    threads = [threading.Thread(target=commit, args=(index, ops)) for index, ops in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_requests_are_merged(tmp_path):
+    controller = FakeController()
+    requests = [[dict(op="add", path="/templates/T1/vrfs/-", value=dict(name="VRF{0}".format(index)))] for index in range(4)]
+
+    results = commit_concurrently(str(tmp_path), controller, requests)
+
+    assert len(controller.requests) == 1
+    assert sorted(op.get("value").get("name") for op in controller.requests[0]) == ["VRF0", "VRF1", "VRF2", "VRF3"]
+    for ops, (response, error) in zip(requests, results):
+        assert error is None
+        assert ops[0] in response.get("ops")
+    # The empty queue is removed with its lock file
+    assert os.listdir(os.path.join(str(tmp_path), "commit")) == []
+
+
+def test_requests_with_indexes_are_not_merged_with_previous_requests(tmp_path):
+    controller = FakeController()
+    indexed_ops = [dict(op="remove", path="/sites/0/anps/A1/epgs/E1/staticPorts/2")]
+    requests = [[dict(op="add", path="/templates/T1/vrfs/-", value=dict(name="VRF{0}".format(index)))] for index in range(3)] + [indexed_ops]
+
+    results = commit_concurrently(str(tmp_path), controller, requests)
+
+    assert sorted(op.get("path") for ops in controller.requests for op in ops) == sorted(ops[0].get("path") for ops in requests)
+    sent_with_indexed_ops = next(ops for ops in controller.requests if indexed_ops[0] in ops)
+    assert sent_with_indexed_ops[0] == indexed_ops[0]
+    assert all(error is None for response, error in results)
+
+
+def test_stale_files_are_removed(tmp_path):
+    controller = FakeController()
+    stale = time.time() - COMMIT_QUEUE_TTL - 1
+    for schema_id, file_name in (("s1", "0-crashed.request"), ("s1", "0-crashed.result"), ("s2", "0-crashed.result"), ("s2", "lock")):
+        path = os.path.join(str(tmp_path), "commit", schema_id)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        with open(os.path.join(path, file_name), "w") as stale_file:
+            stale_file.write("[]")
+        os.utime(os.path.join(path, file_name), (stale, stale))
+
+    ops = [dict(op="add", path="/templates/T1/vrfs/-", value=dict(name="VRF1"))]
+    response, error = MSOSchemaCommitQueue("s1", 0.1, directory=str(tmp_path)).commit(ops, controller.send)
+
+    assert error is None
+    # The stale request of the module execution which ended unexpectedly is not sent
+    assert controller.requests == [ops]
+    assert os.listdir(os.path.join(str(tmp_path), "commit")) == []
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import time
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.cache import MSOCache
+from ansible_collections.cisco.mso.plugins.module_utils.constants import CACHE_PRUNE_INTERVAL, CACHE_TTL
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule
+
+
+class FakeModule:
+    _socket_path = "/tmp/socket"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE", "true")
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path))
+    return str(tmp_path)
+
+
+def add_expired_scope(cache_dir, scope):
+    path = os.path.join(cache_dir, "identity", scope)
+    os.makedirs(path)
+    with open(os.path.join(path, "entry.json"), "w") as entry_file:
+        entry_file.write("{}")
+    expired = time.time() - CACHE_TTL - 1
+    os.utime(os.path.join(path, "entry.json"), (expired, expired))
+    return path
+
+
+def test_prune_once_per_interval(cache_dir, monkeypatch):
+    MSOCache("identity", "scope").set("schema:S0", "s0")
+    expired_scope = add_expired_scope(cache_dir, "expired")
+
+    listed = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: listed.append(path) or listdir(path))
+
+    cache = MSOCache("identity", "scope")
+    for index in range(10):
+        cache.set("schema:S{0}".format(index), "s{0}".format(index))
+    # The namespace was pruned by the first cache within the prune interval
+    assert listed == []
+    assert os.path.isdir(expired_scope)
+
+    pruned = time.time() - CACHE_PRUNE_INTERVAL - 1
+    os.utime(os.path.join(cache_dir, "identity", ".pruned"), (pruned, pruned))
+    cache = MSOCache("identity", "scope")
+    for index in range(10):
+        cache.set("schema:S{0}".format(index), "s{0}".format(index))
+    assert listed.count(os.path.join(cache_dir, "identity")) == 1
+    assert not os.path.isdir(expired_scope)
+    assert cache.get("schema:S9") == "s9"
+
+
+def test_validate_schemas_without_version(cache_dir, monkeypatch):
+    requests = []
+
+    def request(self, path, method=None, data=None, qs=None, api_version="v1"):
+        requests.append(path)
+        if path == "schemas/list-identity":
+            # The identities of older releases have no _updateVersion
+            return dict(schemas=[dict(id="s1", displayName="S1")])
+        return dict(result="valid")
+
+    monkeypatch.setattr(MSOModule, "request", request)
+    mso = MSOModule.__new__(MSOModule)
+    mso.module = FakeModule()
+    mso.params = dict()
+    mso.versions, mso.caches, mso.schema_pool, mso.result, mso.httpapi_logs = {}, {}, {}, {}, []
+    mso.path = mso.method = mso.url = mso.status = mso.response = None
+
+    assert mso.validate_schemas(["s1"]) == [dict(result="valid")]
+    assert mso.validate_schemas(["s1"]) == [dict(result="valid")]
+    assert requests.count("schemas/s1/validate") == 2
+    assert not os.path.isdir(os.path.join(cache_dir, "validation"))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import os
+import tempfile
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule
+
+CONTENT = b"backup content"
+
+
+class FakeModule:
+    def sha1(self, path):
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+
+class FakeConnection:
+    def __init__(self, copies):
+        self.copies = copies
+        self.tmpdirs = []
+
+    def get_remote_file_io_stream(self, path, tmpdir, method):
+        self.tmpdirs.append(tmpdir)
+        fd, tmpsrc = tempfile.mkstemp(dir=self.copies or tmpdir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(CONTENT)
+        return {"status": 200, "content-disposition": "attachment; filename=backup.tar.gz", "tmpsrc": tmpsrc}
+
+
+def get_mso(connection):
+    mso = MSOModule.__new__(MSOModule)
+    mso.module, mso.connection, mso.platform = FakeModule(), connection, "nd"
+    mso.params, mso.headers = {}, {}
+    return mso
+
+
+@pytest.mark.parametrize("copies", [False, True])
+def test_nd_download(tmp_path, copies):
+    dest_dir, copy_dir = str(tmp_path / "dest"), str(tmp_path / "copies")
+    os.makedirs(dest_dir)
+    os.makedirs(copy_dir)
+    connection = FakeConnection(copy_dir if copies else None)
+    mso = get_mso(connection)
+
+    info, dest, changed = mso.download("backups/1/download", dest_dir)
+    assert dest == os.path.join(dest_dir, "backup.tar.gz")
+    assert connection.tmpdirs == [dest_dir]
+    assert changed is True
+    assert info.get("checksum") == hashlib.sha1(CONTENT).hexdigest()
+    with open(dest, "rb") as f:
+        assert f.read() == CONTENT
+    assert os.listdir(dest_dir) == ["backup.tar.gz"]
+    assert os.listdir(copy_dir) == []
+
+    info, dest, changed = mso.download("backups/1/download", dest_dir)
+    assert changed is False
+    assert os.listdir(dest_dir) == ["backup.tar.gz"]
+    assert os.listdir(copy_dir) == []
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.mso.plugins.module_utils.template import Item, KVPair, get_indexed_object
+
+
+def get_objects():
+    return [dict(name="A", uuid="u1"), dict(name="B", uuid="u2"), dict(name="C", uuid="u3")]
+
+
+def test_indexed_lookup():
+    indexes, objects = {}, get_objects()
+    assert get_indexed_object(indexes, objects, [KVPair("name", "B")]) == Item(1, objects[1])
+    assert get_indexed_object(indexes, objects, [KVPair("name", "B"), KVPair("uuid", "u2")]) == Item(1, objects[1])
+    assert get_indexed_object(indexes, objects, [KVPair("name", "B"), KVPair("uuid", "u3")]) is None
+    assert get_indexed_object(indexes, objects, [KVPair("name", "D")]) is None
+
+
+def test_lookup_after_rename_in_place():
+    indexes, objects = {}, get_objects()
+    assert get_indexed_object(indexes, objects, [KVPair("name", "A")]) == Item(0, objects[0])
+
+    objects[0]["name"] = "D"
+    assert get_indexed_object(indexes, objects, [KVPair("name", "D")]) == Item(0, objects[0])
+    assert get_indexed_object(indexes, objects, [KVPair("name", "A")]) is None
+
+    # Swapping the names keeps every indexed name, but not the positions
+    objects[1]["name"], objects[2]["name"] = "C", "B"
+    assert get_indexed_object(indexes, objects, [KVPair("name", "B")]) == Item(2, objects[2])
+    assert get_indexed_object(indexes, objects, [KVPair("name", "C")]) == Item(1, objects[1])
+
+
+def test_lookup_after_replace_in_place():
+    indexes, objects = {}, get_objects()
+    assert get_indexed_object(indexes, objects, [KVPair("uuid", "u2")]) == Item(1, objects[1])
+
+    objects[1] = dict(name="E", uuid="u5")
+    assert get_indexed_object(indexes, objects, [KVPair("uuid", "u5")]) == Item(1, objects[1])
+    assert get_indexed_object(indexes, objects, [KVPair("uuid", "u2")]) is None
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeController:
+    """Serve a template and fail the version checked PATCH requests with a version mismatch while concurrent changes are pending"""
+
+    def __init__(self, template):
+        self.template = template
+        self.concurrent_changes = []
+        self.patches = []
+
+    def request(self, mso, path, method=None, data=None, qs=None, api_version="v1"):
+        if mso.params.get("version_check"):
+            return mso.request_version_check(path, method, data)
+        mso.path, mso.method = path, method
+        if method == "GET":
+            mso.status = 200
+            return copy.deepcopy(self.template)
+        if self.concurrent_changes:
+            self.concurrent_changes.pop(0)(self.template)
+            self.template["_updateVersion"] += 1
+        if data[0].get("value") != self.template["_updateVersion"]:
+            mso.status = 409
+            mso.fail_json(msg="MSO Error 409: Update version mismatch")
+        self.patches.append(data[1:])
+        for op in data[1:]:
+            self.template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0][op.get("path").rsplit("/", 1)[1]] = op.get("value")
+        self.template["_updateVersion"] += 1
+        mso.status = 200
+        return copy.deepcopy(self.template)
+
+
+@pytest.fixture
+def mso(monkeypatch):
+    def fail_json(msg, **kwargs):
+        raise FailJson(msg)
+
+    mso = MSOModule.__new__(MSOModule)
+    mso.params = dict(version_check=True)
+    mso.versions, mso.result, mso.httpapi_logs = {}, {}, []
+    mso.has_modified, mso.error, mso.patch_operation = False, None, None
+    mso.path = mso.method = mso.url = mso.response = mso.status = None
+    mso.fail_json = fail_json
+    return mso
+
+
+def get_template():
+    policy = dict(name="igmp", uuid="u1", queryInterval=125, lastMemberQueryInterval=1)
+    return dict(templateId="t1", _updateVersion=1, tenantPolicyTemplate=dict(template=dict(igmpSnoopPolicies=[policy])))
+
+
+def test_rebase_with_changed_response(mso, monkeypatch):
+    controller = FakeController(get_template())
+    monkeypatch.setattr(MSOModule, "request", lambda self, *args, **kwargs: controller.request(self, *args, **kwargs))
+
+    template = mso.request("templates/t1", method="GET")
+    # Modules update the details of the matched object in place before they send the operations
+    policy = template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0]
+    policy["queryInterval"] = 200
+    ops = [dict(op="replace", path="/tenantPolicyTemplate/template/igmpSnoopPolicies/0/queryInterval", value=200)]
+
+    controller.concurrent_changes.append(
+        lambda template: template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0].update(lastMemberQueryInterval=2)
+    )
+    mso.request("templates/t1", method="PATCH", data=ops)
+
+    assert controller.patches == [ops]
+    assert controller.template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0]["queryInterval"] == 200
+    assert controller.template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0]["lastMemberQueryInterval"] == 2
+    assert mso.versions["templates/t1"][0] == controller.template["_updateVersion"]
+
+
+def test_conflicting_concurrent_change(mso, monkeypatch):
+    controller = FakeController(get_template())
+    monkeypatch.setattr(MSOModule, "request", lambda self, *args, **kwargs: controller.request(self, *args, **kwargs))
+
+    mso.request("templates/t1", method="GET")
+    ops = [dict(op="replace", path="/tenantPolicyTemplate/template/igmpSnoopPolicies/0/queryInterval", value=200)]
+
+    controller.concurrent_changes.append(lambda template: template["tenantPolicyTemplate"]["template"]["igmpSnoopPolicies"][0].update(queryInterval=150))
+    with pytest.raises(FailJson, match="can not be rebased: the object at '.*queryInterval' was changed"):
+        mso.request("templates/t1", method="PATCH", data=ops)
+    assert controller.patches == []
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, get_submitted_deploy_site_statuses
+
+
+class FailJson(Exception):
+    pass
+
+
+def get_deploy_status(*site_statuses, **kwargs):
+    return dict(status=[dict(siteId="s{0}".format(index), status=dict(siteStatus=status, **kwargs)) for index, status in enumerate(site_statuses)])
+
+
+@pytest.fixture
+def mso():
+    def fail_json(msg, **kwargs):
+        raise FailJson(msg)
+
+    mso = MSOModule.__new__(MSOModule)
+    mso.params, mso.result, mso.httpapi_logs = {}, {}, []
+    mso.path = mso.method = mso.url = mso.status = mso.response = mso.error = None
+    mso.fail_json = fail_json
+    return mso
+
+
+def poll(mso, monkeypatch, responses, get_statuses, timeout=5):
+    """Wait for the completion of the deploy status path, which returns the responses per path in order"""
+    responses = dict((path, list(path_responses)) for path, path_responses in responses.items())
+
+    def request(self, path, method=None, data=None, qs=None, api_version="v1"):
+        self.path, self.method, self.status = path, method, 200
+        return responses[path].pop(0) if len(responses[path]) > 1 else responses[path][0]
+
+    monkeypatch.setattr(MSOModule, "request", request)
+    return mso.wait_for_completions(sorted(responses), get_statuses, timeout=timeout, delay=0.01, max_delay=0.01)
+
+
+def test_template_without_sites(mso, monkeypatch):
+    deploy_status, timings = poll(mso, monkeypatch, {"status": [dict(status=[])]}, get_submitted_deploy_site_statuses(None))[0]
+    assert deploy_status == dict(status=[])
+    assert timings.get("polls") == 1
+
+
+def test_previous_final_status_is_not_accepted(mso, monkeypatch):
+    previous = get_deploy_status("Succeeded", "Succeeded")
+    responses = [previous, previous, get_deploy_status("Succeeded", "In Progress"), get_deploy_status("Succeeded", "Failed")]
+    deploy_status, timings = poll(mso, monkeypatch, {"status": responses}, get_submitted_deploy_site_statuses(previous))[0]
+    assert deploy_status == responses[3]
+    assert timings.get("polls") == 4
+
+
+def test_changed_final_status_is_accepted(mso, monkeypatch):
+    previous = get_deploy_status("Succeeded", deployedAt="2026-10-19T10:00:00Z")
+    current = get_deploy_status("Succeeded", deployedAt="2026-10-19T10:05:00Z")
+    deploy_status, timings = poll(mso, monkeypatch, {"status": [current]}, get_submitted_deploy_site_statuses(previous))[0]
+    assert deploy_status == current
+    assert timings.get("polls") == 1
+
+
+def test_unchanged_final_status_after_grace(mso, monkeypatch):
+    previous = get_deploy_status("Succeeded")
+    deploy_status, timings = poll(mso, monkeypatch, {"status": [previous]}, get_submitted_deploy_site_statuses(previous, grace=0))[0]
+    assert deploy_status == previous
+
+
+def test_unchanged_final_status_times_out(mso, monkeypatch):
+    previous = get_deploy_status("Succeeded")
+    with pytest.raises(FailJson, match="Timeout of 0.1 seconds expired"):
+        poll(mso, monkeypatch, {"status": [previous]}, get_submitted_deploy_site_statuses(previous), timeout=0.1)
+
+
+def test_status_function_per_path(mso, monkeypatch):
+    previous = get_deploy_status("Succeeded")
+    responses = {"status/1": [previous, get_deploy_status("Failed")], "status/2": [get_deploy_status("Pending"), get_deploy_status("Succeeded")]}
+    results = poll(mso, monkeypatch, responses, [get_submitted_deploy_site_statuses(previous), get_submitted_deploy_site_statuses(None)])
+    assert [deploy_status for deploy_status, timings in results] == [get_deploy_status("Failed"), get_deploy_status("Succeeded")]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.modules.mso_schema_template_deploy_status import get_policy_state_status
+
+
+def get_policy_state(*states):
+    return dict(templateName="Template1", siteId="s1", anps=[dict(name="ANP{0}".format(index), state=state) for index, state in enumerate(states)])
+
+
+@pytest.mark.parametrize(
+    "states, status",
+    [
+        ((), "deployed"),
+        (("deployed",), "deployed"),
+        (("deployed", "Deployed"), "deployed"),
+        (("deployed", "modified"), "pending"),
+        (("created", "deleted"), "pending"),
+        (("deployed", "modified", "failed"), "failed"),
+        (("deployed", "Error"), "failed"),
+    ],
+)
+def test_policy_state_status(states, status):
+    assert get_policy_state_status(get_policy_state(*states)) == status
+
+
+def test_nested_policy_state_status():
+    policy_state = get_policy_state("deployed")
+    policy_state["anps"][0]["epgs"] = [dict(name="EPG1", state="deployed", subnets=[dict(ip="10.0.0.1/24", state="modified")])]
+    assert get_policy_state_status(policy_state) == "pending"
+
+    policy_state["bds"] = [dict(name="BD1", state="failed")]
+    assert get_policy_state_status(policy_state) == "failed"
+
+
+def test_policy_state_without_objects():
+    assert get_policy_state_status(dict(templateName="Template1", siteId="s1", anps=[], bds=[dict(name="BD1")])) == "deployed"
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule
+from ansible_collections.cisco.mso.plugins.modules.ndo_facts import is_api_not_available
+
+ERRORS = {
+    "labels": (404, "Not Found"),
+    "roles": (400, "The roles API is not supported"),
+    "users": (401, "Unauthorized"),
+    "sites": (403, "Forbidden"),
+    "tenants": (500, "Internal Server Error"),
+    "schemas/list-identity": (400, "Invalid query parameter"),
+}
+
+
+class FailJson(Exception):
+    pass
+
+
+@pytest.fixture
+def mso(monkeypatch):
+    def request(self, path, method=None, data=None, qs=None, api_version="v1"):
+        self.path, self.method = path, method
+        self.status, msg = ERRORS.get(path, (200, None))
+        if msg:
+            self.fail_json(msg="MSO Error {0}: {1}".format(self.status, msg))
+        return dict(path=path)
+
+    def fail_json(msg, **kwargs):
+        raise FailJson(msg)
+
+    monkeypatch.setattr(MSOModule, "request", request)
+    mso = MSOModule.__new__(MSOModule)
+    mso.params, mso.result, mso.httpapi_logs = {}, {}, []
+    mso.path = mso.method = mso.url = mso.status = mso.response = mso.error = None
+    mso.fail_json = fail_json
+    return mso
+
+
+@pytest.mark.parametrize("path", ["labels", "roles", "templates/summaries"])
+def test_unavailable_api(mso, path):
+    responses = mso.request_concurrently([dict(path=path, method="GET")], not_found=is_api_not_available)
+    assert responses == [None if path in ERRORS else dict(path=path)]
+
+
+@pytest.mark.parametrize("path", ["users", "sites", "tenants", "schemas/list-identity"])
+def test_request_error(mso, path):
+    with pytest.raises(FailJson, match="MSO Error {0}".format(ERRORS[path][0])):
+        mso.request_concurrently([dict(path="labels", method="GET"), dict(path=path, method="GET")], not_found=is_api_not_available)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.mso.plugins.plugin_utils.ndo import NDOClient
+
+RESPONSES = {
+    "https://ndo/nexus/infra/api/aaa/v4/localusers": dict(items=[dict(spec=dict(loginID="admin", userID="u1"))]),
+    "https://ndo/nexus/infra/api/aaa/v4/remoteusers": dict(items=[dict(spec=dict(loginID="remote", userID="u2"))]),
+    "https://ndo/api/v1/users": dict(users=[dict(username="mso", id="u4")]),
+}
+
+
+def get_client(monkeypatch, platform):
+    client = NDOClient("ndo", password="secret", platform=platform)
+    client.headers = {}
+    monkeypatch.setattr(client, "send", lambda method, url, data=None, headers=None: RESPONSES[url])
+    return client
+
+
+def test_nd_users(monkeypatch):
+    client = get_client(monkeypatch, "cisco.nd.nd")
+    assert client.query_collections(["users"]) == dict(users=[dict(loginID="admin", userID="u1"), dict(loginID="remote", userID="u2")])
+    assert client.get_collection("users").get("name") == "loginID"
+    assert client.get_collection("sites").get("name") == "name"
+
+
+def test_mso_users(monkeypatch):
+    client = get_client(monkeypatch, "cisco.mso.mso")
+    assert client.query_collections(["users"]) == dict(users=[dict(username="mso", id="u4")])
+    assert client.get_collection("users").get("name") == "username"